@@ -5,6 +5,7 @@ import logging
 import sys
 from importlib.metadata import version
 
+from . import server
 from .server import mcp
 
 logging.basicConfig(
@@ -16,7 +17,14 @@ logger = logging.getLogger("pagerduty_mcp_server")
 def main():
     """PagerDuty MCP Server entry point."""
     parser = argparse.ArgumentParser(description="PagerDuty MCP Server")
-    parser.parse_args()
+    parser.add_argument(
+        "--warm-up",
+        action="store_true",
+        help="Prefetch the user context and reference data before serving (same as PAGERDUTY_WARM_UP=1)",
+    )
+    args = parser.parse_args()
+    if args.warm_up:
+        server.WARM_UP_ON_START = True
 
     logger.info(f"Starting PagerDuty MCP Server v{version('pagerduty_mcp_server')}...")
     try:
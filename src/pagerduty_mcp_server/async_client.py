@@ -0,0 +1,231 @@
+"""Asyncio-native PagerDuty REST API v2 transport.
+
+Implements the subset of `pagerduty.RestApiV2Client` used by this server
+(`jget`, `jput`, `jpost`, `iter_all`, `list_all`) on top of `httpx.AsyncClient`,
+so upstream calls run directly on the event loop instead of hopping through a
+worker thread. Enabled with `PAGERDUTY_ASYNC_TRANSPORT=true`; when `httpx` is not
+installed the server keeps using the synchronous SDK.
+"""
+
+import asyncio
+import logging
+import os
+from collections.abc import AsyncIterator, Callable
+from importlib.metadata import version
+from typing import Any
+
+import pagerduty
+
+from . import rate_limit, utils
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without httpx installed
+    httpx = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "https://api.pagerduty.com"
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_TIMEOUT_SECONDS = 60.0
+
+# PagerDuty rejects classic pagination requests where offset + limit exceeds this.
+ITERATION_LIMIT = 10000
+
+# Strong references to fire-and-forget close tasks so they are not garbage collected
+# before they finish.
+_closing_tasks: set[asyncio.Task] = set()
+
+
+def async_transport_enabled() -> bool:
+    """Return True if the asyncio transport is requested and `httpx` is available.
+
+    Returns:
+        bool: Whether new clients should be created as `AsyncRestClient`
+    """
+    requested = os.environ.get("PAGERDUTY_ASYNC_TRANSPORT", "").strip().lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    if requested and httpx is None:
+        logger.warning(
+            "PAGERDUTY_ASYNC_TRANSPORT is set but httpx is not installed; using the synchronous client"
+        )
+        return False
+    return requested
+
+
+class AsyncRestClient:
+    """Minimal asyncio PagerDuty REST API v2 client backed by `httpx.AsyncClient`.
+
+    Mirrors the call signatures of the SDK methods this server relies on, and raises
+    `pagerduty.HttpError` for unsuccessful responses so callers handle both transports
+    the same way.
+
+    Note:
+        The underlying connection pool is bound to the event loop that first uses it,
+        so an instance must not be shared across event loops.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        auth_type: str = "token",
+        *,
+        base_url: str | None = None,
+        transport: Any = None,
+    ):
+        if httpx is None:
+            raise RuntimeError("httpx is required for the asyncio PagerDuty transport")
+        if auth_type == "bearer":
+            authorization = f"Bearer {api_key}"
+        else:
+            authorization = f"Token token={api_key}"
+        self.url = base_url or DEFAULT_BASE_URL
+        self.token_key = utils.token_key(api_key)
+        self._client = httpx.AsyncClient(
+            base_url=self.url,
+            headers={
+                "Accept": "application/vnd.pagerduty+json;version=2",
+                "Authorization": authorization,
+                "User-Agent": f"pagerduty_mcp_server/{version('pagerduty_mcp_server')} httpx/{httpx.__version__}",
+            },
+            timeout=DEFAULT_TIMEOUT_SECONDS,
+            transport=transport,
+        )
+        # Invoked when the API rejects the client's credentials (HTTP 401).
+        self.on_unauthorized: Callable[[], None] | None = None
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Send a request through the token's rate limit scheduler.
+
+        Waits for a slot in the token's budget before each attempt and, on HTTP 429,
+        queues the request again until the limit resets.
+
+        Args:
+            method: The HTTP method
+            url: The API path (e.g. "/incidents")
+            **kwargs: Passed through to `httpx.AsyncClient.request`
+
+        Returns:
+            httpx.Response: The successful response
+
+        Raises:
+            pagerduty.HttpError: If the API returns an unsuccessful status
+        """
+        if kwargs.get("params"):
+            kwargs["params"] = self.normalize_params(kwargs["params"])
+        for _attempt in range(rate_limit.MAX_RATE_LIMIT_ATTEMPTS):
+            await rate_limit.limiter.acquire_async(self.token_key)
+            response = await self._client.request(method, url, **kwargs)
+            rate_limit.limiter.observe(
+                self.token_key, response.status_code, response.headers
+            )
+            if response.status_code != 429:
+                break
+            logger.debug(
+                f"{method} {url}: Hit API rate limit (status 429); requeueing request"
+            )
+        if response.is_success:
+            return response
+        if response.status_code == 401 and self.on_unauthorized is not None:
+            # The hook may touch the OS keyring, so it runs off the event loop.
+            await asyncio.to_thread(self.on_unauthorized)
+        # httpx and httpx2 responses share the interface HttpError relies on.
+        raise pagerduty.HttpError(
+            f"{method} {url}: API responded with non-success status ({response.status_code})",
+            response,  # type: ignore[arg-type]
+        )
+
+    def normalize_params(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Append "[]" to the names of list-valued parameters, as the SDK does.
+
+        PagerDuty only reads set filters (e.g. `statuses[]`) under the bracketed name
+        and silently ignores them otherwise.
+
+        Args:
+            params: The query parameters
+
+        Returns:
+            The query parameters with every list-valued name ending in "[]"
+        """
+        return {
+            f"{name}[]"
+            if isinstance(value, list) and not name.endswith("[]")
+            else name: value
+            for name, value in params.items()
+        }
+
+    async def jget(self, url: str, **kwargs: Any) -> Any:
+        """Perform a GET request and return the JSON-decoded body."""
+        response = await self.request("GET", url, **kwargs)
+        return response.json()
+
+    async def jput(self, url: str, **kwargs: Any) -> Any:
+        """Perform a PUT request and return the JSON-decoded body."""
+        response = await self.request("PUT", url, **kwargs)
+        return response.json() if response.content else None
+
+    async def jpost(self, url: str, **kwargs: Any) -> Any:
+        """Perform a POST request and return the JSON-decoded body."""
+        response = await self.request("POST", url, **kwargs)
+        return response.json() if response.content else None
+
+    async def iter_all(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        page_size: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate every result of a classic (offset) paginated index endpoint.
+
+        Args:
+            url: The index endpoint path (e.g. "/teams")
+            params: Additional query parameters
+            page_size: Results requested per page (default: 100)
+
+        Yields:
+            Each result dict from the response's entity wrapper (e.g. each entry of "teams")
+        """
+        wrapper = url.rstrip("/").split("/")[-1]
+        query: dict[str, Any] = dict(params or {})
+        limit = page_size or DEFAULT_PAGE_SIZE
+        offset = int(query.pop("offset", 0))
+        while True:
+            if offset + limit > ITERATION_LIMIT:
+                logger.warning(
+                    f"Stopping iteration of {url} at offset {offset}: PagerDuty limits classic pagination to {ITERATION_LIMIT} records"
+                )
+                return
+            body = await self.jget(
+                url, params={**query, "limit": limit, "offset": offset}
+            )
+            results = body.get(wrapper, [])
+            for item in results:
+                yield item
+            if not results or not body.get("more"):
+                return
+            offset += len(results)
+
+    async def list_all(self, url: str, **kwargs: Any) -> list[dict[str, Any]]:
+        """Return every result of a paginated index endpoint as a list."""
+        return [item async for item in self.iter_all(url, **kwargs)]
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    def close(self) -> None:
+        """Close the connection pool from synchronous code.
+
+        Schedules `aclose()` on the running event loop; without a running loop the
+        connections are released when the client is garbage collected.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self.aclose())
+        _closing_tasks.add(task)
+        task.add_done_callback(_closing_tasks.discard)
@@ -1,12 +1,37 @@
-"""Utilities for async operations with synchronous PagerDuty client."""
+"""Utilities for async operations against the PagerDuty API.
+
+Upstream calls go through the `jget`/`jput`/`jpost`/`list_all`/`paginate`/`iter_pages` helpers
+below, which await an `AsyncRestClient` directly on the event loop and run the
+synchronous SDK client in a worker thread otherwise. Reads are served from the
+response cache (see `cache`) where possible, and writes invalidate it.
+"""
 
 import asyncio
+import contextvars
+import copy
+import json
 import logging
-from collections.abc import Callable
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AsyncExitStack, aclosing
 from typing import Any
 
+from . import cache, metrics, resilience, utils
+from .async_client import ITERATION_LIMIT, AsyncRestClient
+
 logger = logging.getLogger(__name__)
 
+# Worker threads reserved for blocking PagerDuty SDK calls. Upstream I/O gets its own
+# pool so a long pagination cannot starve the event loop's default executor, which
+# FastMCP and other libraries share.
+EXECUTOR_MAX_WORKERS = utils.get_env_int(
+    "PAGERDUTY_EXECUTOR_MAX_WORKERS", min(32, (os.cpu_count() or 1) + 4)
+)
+
 
 # Default cap when a list tool is called without an explicit `limit`.
 # Each list tool's docstring exposes `limit` to the caller; this default keeps
@@ -15,12 +40,132 @@ logger = logging.getLogger(__name__)
 # the common case.
 DEFAULT_MAX_RESULTS = 100
 
+# Largest page the PagerDuty API returns for classic (offset) pagination.
+MAX_PAGE_SIZE = 100
+
+# Pages fetched at once when a list call needs more than one page.
+PAGINATE_CONCURRENCY = utils.get_env_int("PAGERDUTY_PAGINATE_CONCURRENCY", 4)
+
+# Most IDs sent in one list filter (e.g. `service_ids[]`); longer filters are split
+# into chunks queried concurrently (see `utils.split_id_filters`), keeping URLs short.
+ID_FILTER_CHUNK_SIZE = utils.get_env_int("PAGERDUTY_ID_FILTER_CHUNK_SIZE", 50)
+
+
+class InstrumentedExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor that tracks queue depth, busy workers and latency.
+
+    `wait_seconds` measures how long each task sat in the queue before a worker
+    picked it up, and `run_seconds` how long the worker spent executing it. A
+    growing wait time with all workers busy means the pool is undersized for the
+    current concurrency.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = ""):
+        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self.max_workers = max_workers
+        self.wait_seconds = metrics.Histogram()
+        self.run_seconds = metrics.Histogram()
+        self._stats_lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        submitted_at = time.perf_counter()
+        started = False
+
+        def _run():
+            nonlocal started
+            started_at = time.perf_counter()
+            with self._stats_lock:
+                started = True
+                self._queued -= 1
+                self._active += 1
+            self.wait_seconds.observe(started_at - submitted_at)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.run_seconds.observe(time.perf_counter() - started_at)
+                with self._stats_lock:
+                    self._active -= 1
+                    self._completed += 1
+
+        def _on_done(future: Future) -> None:
+            # A task cancelled while still queued never reaches _run.
+            if future.cancelled():
+                with self._stats_lock:
+                    if not started:
+                        self._queued -= 1
+
+        with self._stats_lock:
+            self._queued += 1
+        try:
+            future = super().submit(_run)
+        except Exception:
+            with self._stats_lock:
+                self._queued -= 1
+            raise
+        future.add_done_callback(_on_done)
+        return future
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of the executor's utilization.
+
+        Returns:
+            Dict[str, Any]: `max_workers`, `active_workers`, `queue_depth`, `completed`,
+                and the `wait_seconds` and `run_seconds` histograms
+        """
+        with self._stats_lock:
+            queued, active, completed = self._queued, self._active, self._completed
+        return {
+            "max_workers": self.max_workers,
+            "active_workers": active,
+            "queue_depth": queued,
+            "completed": completed,
+            "wait_seconds": self.wait_seconds.snapshot(),
+            "run_seconds": self.run_seconds.snapshot(),
+        }
+
+
+_executor: InstrumentedExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> InstrumentedExecutor:
+    """Return the shared executor for blocking PagerDuty calls, creating it on first use.
+
+    Returns:
+        InstrumentedExecutor: Executor sized by `PAGERDUTY_EXECUTOR_MAX_WORKERS`
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = InstrumentedExecutor(
+                    max_workers=EXECUTOR_MAX_WORKERS,
+                    thread_name_prefix="pagerduty-io",
+                )
+    return _executor
+
+
+def executor_stats() -> dict[str, Any]:
+    """Return utilization metrics for the PagerDuty executor.
+
+    Returns:
+        Dict[str, Any]: See `InstrumentedExecutor.stats`
+    """
+    return get_executor().stats()
+
+
+metrics.register_collector("executor", executor_stats)
+
 
 async def safe_execute_async(func: Callable[[], Any], operation_name: str) -> Any:
-    """Execute a synchronous function asynchronously in a thread pool.
+    """Execute a synchronous function asynchronously in the PagerDuty executor.
 
     This wrapper allows synchronous PagerDuty API calls to be executed
-    without blocking the event loop, using asyncio.to_thread.
+    without blocking the event loop. Calls run on a dedicated, instrumented
+    thread pool (see `get_executor`) with the caller's context variables.
 
     Args:
         func: A callable that performs the synchronous operation
@@ -32,8 +177,10 @@ async def safe_execute_async(func: Callable[[], Any], operation_name: str) -> An
     Raises:
         Exception: Re-raises any exception from the operation with context
     """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
     try:
-        return await asyncio.to_thread(func)
+        return await loop.run_in_executor(get_executor(), context.run, func)
     except Exception as e:
         logger.error(f"Failed to execute {operation_name}: {e}")
         raise
@@ -56,7 +203,8 @@ async def paginate(
     causes excessive HTTP requests when small values are passed.
 
     Use this helper instead of `list_all` for any list tool that exposes a
-    `limit` parameter to callers.
+    `limit` parameter to callers. List tools that parse and size-check each
+    page as it arrives use `iter_pages` instead.
 
     IMPORTANT: Do NOT include `limit` in `params`. Let the SDK default the
     per-page size (100). Pass the user-supplied limit via `max_records` so
@@ -72,6 +220,43 @@ async def paginate(
     Returns:
         A list of result dicts, capped at `max_records` items.
     """
+    results: list[dict[str, Any]] = []
+    async for page in iter_pages(
+        pd_client,
+        entity,
+        params,
+        max_records=max_records,
+        operation_name=operation_name,
+    ):
+        results.extend(page)
+    return results
+
+
+async def iter_pages(
+    pd_client: Any,
+    entity: str,
+    params: dict[str, Any],
+    *,
+    max_records: int,
+    operation_name: str,
+    positions: utils.PagePositions | None = None,
+) -> AsyncGenerator[list[dict[str, Any]]]:
+    """Yield the pages of a PagerDuty list endpoint in order, up to `max_records` items.
+
+    Takes the same arguments as `paginate`; an `offset` in `params` starts iteration
+    part-way through the results, e.g. when resuming from a cursor. Every record the
+    API returns is reported to `positions`, if given, as yielded or dropped, so a
+    cursor can resume right after the records that were used. When more than
+    one page is needed, the first page is requested with `total=true` and the
+    remaining offsets are fetched concurrently (at most `PAGINATE_CONCURRENCY` at a
+    time), then yielded in order.
+    Closing the generator early (e.g. with `contextlib.aclosing`) cancels any page
+    requests still in flight, so a consumer that stops after a page downloads
+    nothing more.
+
+    Yields:
+        Lists of result dicts; together they hold at most `max_records` items.
+    """
     if "limit" in params:
         # Defensive: a stray `limit` would force the SDK to use it as page_size
         # and re-introduce the bug this helper is designed to avoid.
@@ -79,15 +264,605 @@ async def paginate(
             "paginate() params must not contain 'limit'; use max_records to cap results."
         )
 
-    def _collect() -> list[dict[str, Any]]:
-        results: list[dict[str, Any]] = []
-        optimal_page_size = min(max_records, 100)
-        for item in pd_client.iter_all(
-            entity, params=params, page_size=optimal_page_size
-        ):
-            results.append(item)
-            if len(results) >= max_records:
-                break
-        return results
-
-    return await safe_execute_async(_collect, operation_name)
+    if positions is None:
+        positions = utils.PagePositions()
+    positions.begin(int(params.get("offset", 0)))
+
+    if max_records <= MAX_PAGE_SIZE:
+        page = await _fetch_single_page(
+            pd_client,
+            entity,
+            params,
+            max_records=max_records,
+            operation_name=operation_name,
+        )
+        items: list[dict[str, Any]] = []
+        for item in page:
+            if item:
+                positions.take()
+                items.append(item)
+            else:
+                positions.drop()
+        yield items
+        return
+
+    # Items already seen (by `id`) are skipped, in case records shift between pages
+    # while they are being fetched.
+    seen: set[Any] = set()
+    remaining = max_records
+    async with aclosing(
+        _iter_offset_pages(
+            pd_client,
+            entity,
+            params,
+            max_records=max_records,
+            operation_name=operation_name,
+        )
+    ) as pages:
+        async for page in pages:
+            items = []
+            for item in page:
+                item_id = item.get("id") if item else None
+                if not item or (item_id is not None and item_id in seen):
+                    positions.drop()
+                    continue
+                if item_id is not None:
+                    seen.add(item_id)
+                positions.take()
+                items.append(item)
+                if len(items) >= remaining:
+                    break
+            remaining -= len(items)
+            yield items
+            if remaining <= 0:
+                return
+
+
+def _item_id(item: dict[str, Any]) -> Any:
+    return item.get("id")
+
+
+def iter_sliced_pages(
+    pd_client: Any,
+    entity: str,
+    params: dict[str, Any],
+    slices: list[dict[str, Any]],
+    *,
+    key: Callable[[dict[str, Any]], Any] | None,
+    max_records: int,
+    operation_name: str,
+    identity: Callable[[dict[str, Any]], Any] = _item_id,
+    positions: utils.PagePositions | None = None,
+) -> AsyncGenerator[list[dict[str, Any]]]:
+    """Yield the pages of a query that is split into slices, merged into one stream.
+
+    With a single slice this is `iter_pages` on `params` updated with that slice.
+    Otherwise every slice is its own `iter_pages` stream and the streams are combined
+    by `merge_pages`. A cursor for such a query holds one `offset` per slice (see
+    `utils.PagePositions`), so resuming it requests every slice from where it
+    stopped; slices added since (e.g. a new time window) start from the beginning.
+    A record returned by two slices is only deduplicated within one call, so it may
+    be returned again after a cursor if the cursor falls between its two copies.
+
+    Args:
+        pd_client: The PagerDuty REST API client
+        entity: The endpoint path (e.g. "/incidents")
+        params: The query parameters (must NOT contain a `limit` key)
+        slices: Parameter overrides, one per slice, that together cover the query
+            exactly once (e.g. time windows, or chunks of an ID filter)
+        key: The sort key every slice is ordered by, or None to return the slices
+            one after another
+        max_records: Hard cap on the number of records returned
+        operation_name: Descriptive name for error logging
+        identity: Returns the value records are deduplicated on across slices
+            (default: `id`; see `merge_pages`)
+        positions: Tracks the yielded records, as in `iter_pages`
+
+    Raises:
+        ValidationError: If `params` holds per-slice offsets for more slices than given
+
+    Returns:
+        An async generator of result pages, as from `iter_pages`
+    """
+    if len(slices) == 1:
+        return iter_pages(
+            pd_client,
+            entity,
+            {**params, **slices[0]},
+            max_records=max_records,
+            operation_name=operation_name,
+            positions=positions,
+        )
+
+    query = {name: value for name, value in params.items() if name != "offset"}
+    offset = params.get("offset", 0)
+    if isinstance(offset, list):
+        if len(offset) > len(slices):
+            raise utils.ValidationError(
+                "Invalid `cursor`. Pass the `next_cursor` value from a previous response unchanged."
+            )
+        offsets = offset + [0] * (len(slices) - len(offset))
+        skip = 0
+    else:
+        # A single offset into the merged stream, from a cursor issued while the
+        # query fit in one slice: every slice is read from its start and skipped.
+        offsets = [0] * len(slices)
+        skip = int(offset)
+    slice_positions = [utils.PagePositions() for _ in slices]
+    streams = [
+        iter_pages(
+            pd_client,
+            entity,
+            {**query, **overrides, **({"offset": start} if start else {})},
+            # Any one slice may hold every record the merged stream needs.
+            max_records=skip + max_records,
+            operation_name=operation_name,
+            positions=slice_position,
+        )
+        for overrides, start, slice_position in zip(
+            slices, offsets, slice_positions, strict=True
+        )
+    ]
+    if positions is not None:
+        positions.begin_merge(slice_positions)
+    return merge_pages(
+        streams,
+        key=key,
+        max_records=max_records,
+        skip=skip,
+        identity=identity,
+        positions=positions,
+    )
+
+
+async def merge_pages(
+    streams: list[AsyncGenerator[list[dict[str, Any]]]],
+    *,
+    key: Callable[[dict[str, Any]], Any] | None,
+    max_records: int,
+    skip: int = 0,
+    identity: Callable[[dict[str, Any]], Any] = _item_id,
+    positions: utils.PagePositions | None = None,
+) -> AsyncGenerator[list[dict[str, Any]]]:
+    """Merge page streams that are each sorted by `key` into one sorted page stream.
+
+    Each stream is typically an `iter_pages` generator over one slice of a query,
+    e.g. one time window. The next page of every stream whose buffered items have
+    run out is requested concurrently (at most `PAGINATE_CONCURRENCY` at a time),
+    and a stream is only advanced once its buffered items have been merged, so
+    streams whose items sort last cost just their first page until they are needed.
+    Items seen before (by `identity`) are dropped, so slices may overlap at their edges.
+    Closing the generator early closes every stream.
+
+    Args:
+        streams: Async generators of raw item pages, each sorted by `key`
+        key: Returns the sort key of an item, or None to yield the streams' items
+            one stream after another (their first pages are still fetched concurrently)
+        max_records: Hard cap on the number of items yielded
+        skip: Number of merged items to drop before yielding, e.g. to resume from a cursor
+        identity: Returns the value items are deduplicated on, or None for an item
+            that is never dropped (default: the item's `id`)
+        positions: Optionally records which stream each item came from and whether it
+            was yielded (see `utils.PagePositions.begin_merge`)
+
+    Yields:
+        Lists of result dicts; together they hold at most `max_records` items.
+    """
+    semaphore = asyncio.Semaphore(PAGINATE_CONCURRENCY)
+    buffers: list[deque[dict[str, Any]]] = [deque() for _ in streams]
+    live = set(range(len(streams)))
+
+    async def _refill(index: int) -> None:
+        async with semaphore:
+            try:
+                page = await anext(streams[index])
+            except StopAsyncIteration:
+                live.discard(index)
+                return
+        buffers[index].extend(page)
+
+    def _next_stream() -> int | None:
+        """Return the stream holding the next item, or None if a stream needs a page."""
+        if key is None:
+            first = min(live)
+            return first if buffers[first] else None
+        if not all(buffers[i] for i in live):
+            return None
+        return min(live, key=lambda i: key(buffers[i][0]))
+
+    seen: set[Any] = set()
+    remaining = max_records
+    async with AsyncExitStack() as stack:
+        for stream in streams:
+            await stack.enter_async_context(aclosing(stream))
+        while remaining > 0 and live:
+            empty = [index for index in live if not buffers[index]]
+            if _next_stream() is None:
+                tasks = [asyncio.ensure_future(_refill(index)) for index in empty]
+                try:
+                    await asyncio.gather(*tasks)
+                except BaseException:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    raise
+                continue
+
+            page: list[dict[str, Any]] = []
+            while remaining > 0 and live:
+                index = _next_stream()
+                if index is None:
+                    break
+                item = buffers[index].popleft()
+                item_id = identity(item)
+                duplicate = item_id is not None and item_id in seen
+                if item_id is not None:
+                    seen.add(item_id)
+                if duplicate or skip > 0:
+                    if not duplicate:
+                        skip -= 1
+                    if positions is not None:
+                        positions.drop(index)
+                    continue
+                page.append(item)
+                if positions is not None:
+                    positions.take(index)
+                remaining -= 1
+            if page:
+                yield page
+
+
+async def _fetch_single_page(
+    pd_client: Any,
+    entity: str,
+    params: dict[str, Any],
+    *,
+    max_records: int,
+    operation_name: str,
+) -> list[dict[str, Any]]:
+    """Fetch at most one page (`max_records` <= 100) through the client's `iter_all`."""
+    optimal_page_size = min(max_records, MAX_PAGE_SIZE)
+
+    if isinstance(pd_client, AsyncRestClient):
+
+        async def _collect_async() -> list[dict[str, Any]]:
+            results: list[dict[str, Any]] = []
+            try:
+                async for item in pd_client.iter_all(
+                    entity, params=params, page_size=optimal_page_size
+                ):
+                    results.append(item)
+                    if len(results) >= max_records:
+                        break
+            except Exception as e:
+                logger.error(f"Failed to execute {operation_name}: {e}")
+                raise
+            return results
+
+        async def _request() -> list[dict[str, Any]]:
+            return await resilience.call_with_resilience(
+                "GET",
+                entity,
+                _collect_async,
+                idempotent=True,
+                operation_name=operation_name,
+            )
+
+    else:
+
+        def _collect() -> list[dict[str, Any]]:
+            results: list[dict[str, Any]] = []
+            for item in pd_client.iter_all(
+                entity, params=params, page_size=optimal_page_size
+            ):
+                results.append(item)
+                if len(results) >= max_records:
+                    break
+            return results
+
+        async def _request() -> list[dict[str, Any]]:
+            return await resilience.call_with_resilience(
+                "GET",
+                entity,
+                lambda: safe_execute_async(_collect, operation_name),
+                idempotent=True,
+                operation_name=operation_name,
+            )
+
+    return await _cached_single_flight(
+        _request_key(pd_client, "iter_all", entity, params, max_records),
+        entity,
+        _request,
+    )
+
+
+async def _iter_offset_pages(
+    pd_client: Any,
+    entity: str,
+    params: dict[str, Any],
+    *,
+    max_records: int,
+    operation_name: str,
+) -> AsyncGenerator[list[dict[str, Any]]]:
+    """Yield raw pages by offset, requesting the remaining offsets concurrently.
+
+    Iteration starts at `params["offset"]` (default 0). The first page is fetched
+    with `total=true`; its `total` tells us which offsets remain. Endpoints that do
+    not report a total are walked one page at a time.
+    """
+    wrapper = entity.rstrip("/").split("/")[-1]
+    query = dict(params)
+    start = int(query.pop("offset", 0))
+    # PagerDuty rejects classic pagination requests past ITERATION_LIMIT records.
+    end = min(start + max_records, ITERATION_LIMIT)
+    if start >= end:
+        return
+
+    async def _fetch(offset: int, **extra: Any) -> dict[str, Any]:
+        return await jget(
+            pd_client,
+            entity,
+            params={
+                **query,
+                "limit": min(MAX_PAGE_SIZE, ITERATION_LIMIT - offset),
+                "offset": offset,
+                **extra,
+            },
+            operation_name=operation_name,
+        )
+
+    first = await _fetch(start, total="true")
+    page = first.get(wrapper, [])
+    yield page
+    more = bool(first.get("more"))
+    total = first.get("total")
+
+    if more and isinstance(total, int):
+        semaphore = asyncio.Semaphore(PAGINATE_CONCURRENCY)
+
+        async def _fetch_bounded(offset: int) -> list[dict[str, Any]]:
+            async with semaphore:
+                body = await _fetch(offset)
+            return body.get(wrapper, [])
+
+        tasks = [
+            asyncio.ensure_future(_fetch_bounded(offset))
+            for offset in range(start + len(page), min(end, total), MAX_PAGE_SIZE)
+        ]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # Mark failures of pages nobody awaited as retrieved.
+                    task.exception()
+        return
+
+    offset = start + len(page)
+    while more and page and offset < end:
+        body = await _fetch(offset)
+        page = body.get(wrapper, [])
+        yield page
+        more = bool(body.get("more"))
+        offset += len(page)
+
+
+# In-flight reads by request key (see `_single_flight`).
+_in_flight: dict[tuple, asyncio.Future] = {}
+_single_flight_stats = {"started": 0, "coalesced": 0}
+
+# HTTP method and whether it is safe to retry, for each client method the helpers call.
+_METHODS = {
+    "jget": ("GET", True),
+    "list_all": ("GET", True),
+    "jput": ("PUT", False),
+    "jpost": ("POST", False),
+}
+
+
+async def _call(
+    pd_client: Any, method: str, url: str, operation_name: str, **kwargs: Any
+) -> Any:
+    """Invoke a client method on whichever transport backs `pd_client`.
+
+    Only keyword arguments that are not None are forwarded, so the SDK sees the same
+    call it would if invoked directly. Calls go through the endpoint's circuit breaker,
+    and reads are retried on transient failures (see `resilience`).
+    """
+    kwargs = {key: value for key, value in kwargs.items() if value is not None}
+    http_method, idempotent = _METHODS[method]
+
+    if isinstance(pd_client, AsyncRestClient):
+
+        async def _attempt() -> Any:
+            try:
+                return await getattr(pd_client, method)(url, **kwargs)
+            except Exception as e:
+                logger.error(f"Failed to execute {operation_name}: {e}")
+                raise
+
+    else:
+
+        async def _attempt() -> Any:
+            return await safe_execute_async(
+                lambda: getattr(pd_client, method)(url, **kwargs), operation_name
+            )
+
+    async def _request() -> Any:
+        return await resilience.call_with_resilience(
+            http_method,
+            url,
+            _attempt,
+            idempotent=idempotent,
+            operation_name=operation_name,
+        )
+
+    if not idempotent:
+        result = await _request()
+        await cache.invalidate(http_method, url)
+        return result
+    return await _cached_single_flight(
+        _request_key(pd_client, method, url, kwargs.get("params")), url, _request
+    )
+
+
+def _request_key(
+    pd_client: Any, method: str, url: str, params: dict[str, Any] | None, *extra: Any
+) -> tuple:
+    """Identify a read by token, client method, path and normalized params."""
+    return (
+        getattr(pd_client, "token_key", id(pd_client)),
+        method,
+        url,
+        json.dumps(params or {}, sort_keys=True, default=str),
+        *extra,
+    )
+
+
+async def _cached_single_flight(
+    key: tuple, url: str, request: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Serve a read from the response cache, coalescing concurrent misses."""
+    return await cache.read_through(
+        json.dumps(key, default=str), url, lambda: _single_flight(key, request)
+    )
+
+
+async def _single_flight(key: tuple, request: Callable[[], Awaitable[Any]]) -> Any:
+    """Run `request`, or join an identical request that is already in flight.
+
+    The first caller for a key starts the request; concurrent callers with the same
+    key await the same task instead of sending a duplicate request to PagerDuty.
+    The task's result is never handed out: every caller, the first included, gets
+    its own deep copy, so no caller can see another's mutations, even one that
+    joins after the first caller has started using its result. The shared request
+    is shielded, so one caller giving up does not cancel it for the others.
+    """
+    if key in _in_flight:
+        _single_flight_stats["coalesced"] += 1
+        return copy.deepcopy(await asyncio.shield(_in_flight[key]))
+
+    task = asyncio.ensure_future(request())
+    _in_flight[key] = task
+
+    def _forget(done: asyncio.Future) -> None:
+        if _in_flight.get(key) is done:
+            del _in_flight[key]
+        # Retrieve the outcome so a failure nobody awaited is not reported as unhandled.
+        if not done.cancelled():
+            done.exception()
+
+    task.add_done_callback(_forget)
+    _single_flight_stats["started"] += 1
+    return copy.deepcopy(await asyncio.shield(task))
+
+
+def single_flight_stats() -> dict[str, Any]:
+    """Return counters for request coalescing.
+
+    Returns:
+        Dict[str, Any]: `in_flight` requests, reads `started`, and reads `coalesced`
+            into a request that was already in flight
+    """
+    return {"in_flight": len(_in_flight), **_single_flight_stats}
+
+
+metrics.register_collector("single_flight", single_flight_stats)
+
+
+async def jget(
+    pd_client: Any,
+    url: str,
+    *,
+    params: dict[str, Any] | None = None,
+    operation_name: str,
+) -> Any:
+    """Perform a GET request and return the JSON-decoded body.
+
+    Args:
+        pd_client: The PagerDuty REST API client (sync SDK or `AsyncRestClient`)
+        url: The endpoint path (e.g. "/incidents/P123")
+        params: Query parameters for the request (optional)
+        operation_name: Descriptive name for error logging
+
+    Returns:
+        The JSON-decoded response body
+    """
+    return await _call(pd_client, "jget", url, operation_name, params=params)
+
+
+async def jput(
+    pd_client: Any,
+    url: str,
+    *,
+    json: dict[str, Any],
+    headers: dict[str, str] | None = None,
+    operation_name: str,
+) -> Any:
+    """Perform a PUT request and return the JSON-decoded body.
+
+    Args:
+        pd_client: The PagerDuty REST API client (sync SDK or `AsyncRestClient`)
+        url: The endpoint path (e.g. "/incidents/P123")
+        json: The request body
+        headers: Additional request headers, e.g. `From` (optional)
+        operation_name: Descriptive name for error logging
+
+    Returns:
+        The JSON-decoded response body
+    """
+    return await _call(
+        pd_client, "jput", url, operation_name, json=json, headers=headers
+    )
+
+
+async def jpost(
+    pd_client: Any,
+    url: str,
+    *,
+    json: dict[str, Any],
+    headers: dict[str, str] | None = None,
+    operation_name: str,
+) -> Any:
+    """Perform a POST request and return the JSON-decoded body.
+
+    Args:
+        pd_client: The PagerDuty REST API client (sync SDK or `AsyncRestClient`)
+        url: The endpoint path (e.g. "/incidents/P123/notes")
+        json: The request body
+        headers: Additional request headers, e.g. `From` (optional)
+        operation_name: Descriptive name for error logging
+
+    Returns:
+        The JSON-decoded response body
+    """
+    return await _call(
+        pd_client, "jpost", url, operation_name, json=json, headers=headers
+    )
+
+
+async def list_all(
+    pd_client: Any,
+    entity: str,
+    *,
+    params: dict[str, Any],
+    operation_name: str,
+) -> list[dict[str, Any]]:
+    """Fetch every result of a paginated list endpoint, without a cap.
+
+    Only for internal helpers that need the complete set (e.g. user-context building);
+    caller-facing list tools must use `paginate` instead.
+
+    Args:
+        pd_client: The PagerDuty REST API client (sync SDK or `AsyncRestClient`)
+        entity: The endpoint path (e.g. "/services")
+        params: Query parameters for the request
+        operation_name: Descriptive name for error logging
+
+    Returns:
+        A list of every result dict
+    """
+    return await _call(pd_client, "list_all", entity, operation_name, params=params)
@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import hashlib
 import logging
@@ -7,12 +8,14 @@ import threading
 import time
 import webbrowser
 from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any
 from urllib.parse import parse_qs, urlencode, urlparse
 
 import keyring
 import keyring.errors
 import requests
 
+from . import utils
 from .errors import PagerDutyAuthError
 
 logger = logging.getLogger(__name__)
@@ -52,7 +55,80 @@ DEFAULT_TOKEN_EXPIRY_SECONDS = 86400  # 24 hours
 OAUTH_CALLBACK_TIMEOUT_SECONDS = 30
 OAUTH_TOTAL_TIMEOUT_SECONDS = 300
 
+# Fraction of a token's remaining lifetime after which the background refresher renews it.
+OAUTH_REFRESH_FRACTION = utils.get_env_float(
+    "PAGERDUTY_OAUTH_REFRESH_FRACTION", 0.8, minimum=0.1, maximum=0.95
+)
+# How often the refresher checks again when there is no refreshable token yet.
+OAUTH_REFRESH_POLL_SECONDS = 60.0
+# How long the refresher waits after a failed refresh before trying again.
+OAUTH_REFRESH_RETRY_SECONDS = 30.0
+
 _get_token_lock = threading.Lock()
+# Serializes refresh-token exchanges between the background refresher and get_token.
+_refresh_lock = threading.Lock()
+
+# Process-level copy of the current access token, its expiry and the time it is due for
+# proactive refresh (epoch seconds), so the keyring is only consulted at startup, after
+# expiry, or after an auth failure.
+_token_cache: dict[str, Any] = {"token": None, "expiry": 0.0, "refresh_at": 0.0}
+_token_cache_lock = threading.Lock()
+
+
+def get_cached_token() -> str | None:
+    """Return the in-memory access token if it has not expired.
+
+    Returns:
+        Optional[str]: The cached access token, or None if absent or expired
+    """
+    with _token_cache_lock:
+        token = _token_cache["token"]
+        if token and time.time() < _token_cache["expiry"]:
+            return token
+    return None
+
+
+def invalidate_cached_token() -> None:
+    """Drop the in-memory access token so the next lookup re-reads the keyring."""
+    with _token_cache_lock:
+        if _token_cache["token"]:
+            logger.info("Invalidating cached OAuth access token")
+        _token_cache["token"] = None
+        _token_cache["expiry"] = 0.0
+        _token_cache["refresh_at"] = 0.0
+
+
+def reject_token(token: str) -> None:
+    """Mark an access token the API rejected (HTTP 401) as expired.
+
+    The in-memory copy is dropped and, if the keyring still holds the same token, its
+    stored expiry is cleared, so the next `get_token` refreshes the token (or starts
+    a new authorization) instead of reading the rejected one back. A token that has
+    already been replaced is left alone.
+
+    Args:
+        token: The access token the API rejected
+    """
+    with _token_cache_lock:
+        if _token_cache["token"] == token:
+            logger.info("Invalidating rejected OAuth access token")
+            _token_cache["token"] = None
+            _token_cache["expiry"] = 0.0
+            _token_cache["refresh_at"] = 0.0
+    try:
+        if keyring.get_password(KEYRING_SERVICE, KEYRING_KEY_ACCESS_TOKEN) == token:
+            keyring.set_password(KEYRING_SERVICE, KEYRING_KEY_TOKEN_EXPIRY, "0")
+    except Exception as e:
+        logger.warning(f"Failed to mark rejected OAuth token expired in keyring: {e}")
+
+
+def _cache_token(token: str, expiry: float) -> None:
+    now = time.time()
+    lifetime = max(0.0, expiry - now)
+    with _token_cache_lock:
+        _token_cache["token"] = token
+        _token_cache["expiry"] = expiry
+        _token_cache["refresh_at"] = now + lifetime * OAUTH_REFRESH_FRACTION
 
 
 def safe_delete_password(service, username):
@@ -161,6 +237,7 @@ def _store_tokens(token_data):
                 f"Keyring access failed: {e}. On headless Linux, install 'keyrings.alt' or set PAGERDUTY_API_TOKEN instead."
             ) from e
 
+    _cache_token(access_token, expiry)
     return access_token
 
 
@@ -232,10 +309,162 @@ class CallbackHandler(BaseHTTPRequestHandler):
         return
 
 
+def _refresh_with_retries(refresh_token):
+    """Exchange a refresh token for a new access token, retrying transient failures.
+
+    Runs blocking network calls and sleeps between attempts, so it must not be called
+    on the event loop.
+
+    Args:
+        refresh_token: The refresh token from a previous OAuth flow
+
+    Returns:
+        Optional[str]: The new access token, or None if PagerDuty rejected the refresh
+            token (stored tokens are cleared so the next lookup re-authorizes)
+
+    Raises:
+        PagerDutyAuthError: If the refresh keeps failing or keyring access fails
+    """
+    max_retries = 3
+    last_error = None
+    for attempt in range(max_retries):
+        try:
+            token_data = refresh_access_token(refresh_token)
+            return _store_tokens(token_data)
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and 400 <= e.response.status_code < 500:
+                logger.warning(
+                    f"Token refresh failed ({e.response.status_code}), clearing stored tokens"
+                )
+                safe_delete_password(KEYRING_SERVICE, KEYRING_KEY_ACCESS_TOKEN)
+                safe_delete_password(KEYRING_SERVICE, KEYRING_KEY_TOKEN_EXPIRY)
+                safe_delete_password(KEYRING_SERVICE, KEYRING_KEY_REFRESH_TOKEN)
+                return None
+            last_error = e
+        except Exception as e:
+            last_error = e
+        if attempt < max_retries - 1:
+            delay = 2**attempt
+            logger.warning(
+                f"Token refresh failed (attempt {attempt + 1}/{max_retries}): {last_error}, retrying in {delay}s"
+            )
+            time.sleep(delay)
+    raise PagerDutyAuthError(
+        f"Token refresh failed after {max_retries} attempts: {last_error}"
+    )
+
+
+def _load_keyring_token() -> str | None:
+    """Load a still-valid access token from the keyring into memory, without re-authorizing.
+
+    Returns:
+        Optional[str]: The stored access token, or None if absent or expired
+
+    Raises:
+        PagerDutyAuthError: If keyring access fails
+    """
+    try:
+        token = keyring.get_password(KEYRING_SERVICE, KEYRING_KEY_ACCESS_TOKEN)
+        expiry_str = keyring.get_password(KEYRING_SERVICE, KEYRING_KEY_TOKEN_EXPIRY)
+    except Exception as e:
+        raise PagerDutyAuthError(
+            f"Keyring access failed: {e}. On headless Linux, install 'keyrings.alt' or set PAGERDUTY_API_TOKEN instead."
+        ) from e
+    if not token or not expiry_str:
+        return None
+    try:
+        expiry = float(expiry_str)
+    except ValueError:
+        logger.warning("Corrupt token expiry in keyring: %r", expiry_str)
+        return None
+    if time.time() >= expiry:
+        return None
+    _cache_token(token, expiry)
+    return token
+
+
+def refresh_token_if_due() -> float | None:
+    """Renew the access token if it has reached its proactive refresh point.
+
+    Blocking; the background refresher runs it on the PagerDuty executor.
+
+    Returns:
+        Optional[float]: Seconds until the next refresh is due, or None if there is no
+            token that can be refreshed (no stored token, refresh token or client secret)
+
+    Raises:
+        PagerDutyAuthError: If the refresh keeps failing or keyring access fails
+    """
+    if get_cached_token() is None and _load_keyring_token() is None:
+        return None
+
+    with _refresh_lock:
+        with _token_cache_lock:
+            refresh_at = _token_cache["refresh_at"]
+        if time.time() < refresh_at:
+            return refresh_at - time.time()
+
+        try:
+            refresh_token = keyring.get_password(
+                KEYRING_SERVICE, KEYRING_KEY_REFRESH_TOKEN
+            )
+        except Exception as e:
+            raise PagerDutyAuthError(
+                f"Keyring access failed: {e}. On headless Linux, install 'keyrings.alt' or set PAGERDUTY_API_TOKEN instead."
+            ) from e
+        if not refresh_token or not os.getenv("PAGERDUTY_CLIENT_SECRET"):
+            return None
+
+        logger.info("Proactively refreshing OAuth access token")
+        if _refresh_with_retries(refresh_token) is None:
+            invalidate_cached_token()
+            return None
+
+    with _token_cache_lock:
+        refresh_at = _token_cache["refresh_at"]
+    return max(0.0, refresh_at - time.time())
+
+
+def token_refresh_enabled() -> bool:
+    """Return True if OAuth with token refresh is the active authentication method.
+
+    Returns:
+        bool: Whether the background token refresher should run
+    """
+    client_id = os.getenv("PAGERDUTY_CLIENT_ID", DEFAULT_CLIENT_ID)
+    return bool(
+        client_id
+        and os.getenv("PAGERDUTY_CLIENT_SECRET")
+        and not os.getenv("PAGERDUTY_API_TOKEN")
+    )
+
+
+async def run_token_refresher() -> None:
+    """Keep the OAuth access token fresh until cancelled.
+
+    Renews the token once `OAUTH_REFRESH_FRACTION` of its lifetime has passed, so tool
+    calls always find a valid token in memory and never refresh on the request path.
+    Refreshes run on the PagerDuty executor so retries never block the event loop.
+    """
+    from .async_utils import get_executor
+
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            delay = await loop.run_in_executor(get_executor(), refresh_token_if_due)
+        except Exception as e:
+            logger.warning(f"Background OAuth token refresh failed: {e}")
+            delay = OAUTH_REFRESH_RETRY_SECONDS
+        if delay is None:
+            delay = OAUTH_REFRESH_POLL_SECONDS
+        await asyncio.sleep(max(delay, 1.0))
+
+
 def get_token():
     """Get or refresh OAuth access token for PagerDuty API.
 
     This function implements the complete OAuth flow with PKCE:
+    0. Returns the in-memory token if it is still valid (no keyring access)
     1. Checks keyring for existing valid token
     2. Attempts token refresh if expired (requires PAGERDUTY_CLIENT_SECRET)
     3. Falls back to full OAuth authorization flow if needed
@@ -246,6 +475,9 @@ def get_token():
     - Exchanges authorization code for access token using PKCE
     - Stores tokens securely in OS keyring
 
+    Every step past the in-memory token blocks, so tool calls go through
+    `client.load_oauth_token`, which runs this on the PagerDuty executor.
+
     Returns:
         str: Valid OAuth access token
 
@@ -257,6 +489,9 @@ def get_token():
         PAGERDUTY_CLIENT_ID: OAuth client ID (optional, defaults to DEFAULT_CLIENT_ID)
         PAGERDUTY_CLIENT_SECRET: OAuth client secret (optional, enables token refresh)
     """
+    if cached := get_cached_token():
+        return cached
+
     try:
         token = keyring.get_password(KEYRING_SERVICE, KEYRING_KEY_ACCESS_TOKEN)
     except Exception as e:
@@ -275,6 +510,7 @@ def get_token():
         if expiry_str:
             try:
                 if time.time() < float(expiry_str):
+                    _cache_token(token, float(expiry_str))
                     return token
             except ValueError:
                 logger.warning("Corrupt token expiry in keyring: %r", expiry_str)
@@ -291,40 +527,13 @@ def get_token():
         client_secret = os.getenv("PAGERDUTY_CLIENT_SECRET")
 
         if refresh_token and client_secret:
-            max_retries = 3
-            last_error = None
-            for attempt in range(max_retries):
-                try:
-                    token_data = refresh_access_token(refresh_token)
-                    return _store_tokens(token_data)
-                except requests.exceptions.HTTPError as e:
-                    if e.response is not None and 400 <= e.response.status_code < 500:
-                        logger.warning(
-                            f"Token refresh failed ({e.response.status_code}), clearing stored tokens"
-                        )
-                        safe_delete_password(KEYRING_SERVICE, KEYRING_KEY_ACCESS_TOKEN)
-                        safe_delete_password(KEYRING_SERVICE, KEYRING_KEY_TOKEN_EXPIRY)
-                        safe_delete_password(KEYRING_SERVICE, KEYRING_KEY_REFRESH_TOKEN)
-                        break
-                    last_error = e
-                    if attempt < max_retries - 1:
-                        delay = 2**attempt
-                        logger.warning(
-                            f"Token refresh failed (attempt {attempt + 1}/{max_retries}): {e}, retrying in {delay}s"
-                        )
-                        time.sleep(delay)
-                except Exception as e:
-                    last_error = e
-                    if attempt < max_retries - 1:
-                        delay = 2**attempt
-                        logger.warning(
-                            f"Token refresh failed (attempt {attempt + 1}/{max_retries}): {e}, retrying in {delay}s"
-                        )
-                        time.sleep(delay)
-            else:
-                raise PagerDutyAuthError(
-                    f"Token refresh failed after {max_retries} attempts: {last_error}"
-                )
+            with _refresh_lock:
+                # The background refresher may have renewed the token while we waited.
+                if cached := get_cached_token():
+                    return cached
+                new_token = _refresh_with_retries(refresh_token)
+            if new_token:
+                return new_token
         else:
             safe_delete_password(KEYRING_SERVICE, KEYRING_KEY_ACCESS_TOKEN)
             safe_delete_password(KEYRING_SERVICE, KEYRING_KEY_TOKEN_EXPIRY)
@@ -0,0 +1,566 @@
+"""Read-through cache for PagerDuty responses on slow-changing resources.
+
+Teams, services, escalation policies, schedules and users rarely change, so GET
+responses for them are cached per token, path and normalized params for a
+per-resource TTL. Entries are stored as JSON, so every hit returns a fresh copy.
+A successful write drops the cached entries for the resources it can change, as
+listed in `WRITE_INVALIDATES`; everything else is only refreshed by its TTL.
+
+Entries older than their TTL but within `PAGERDUTY_CACHE_STALE_SECONDS` of it are
+served immediately and refreshed in the background, so the request that lands
+just after expiry does not pay for the refetch. `track_fetch_times` reports how
+old the served data is.
+
+The storage is pluggable: any object implementing `CacheBackend` can replace the
+default in-memory LRU via `set_backend`. Setting `PAGERDUTY_CACHE_PATH` persists
+entries to a SQLite database instead, so a restarted server starts warm.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Protocol
+from urllib.parse import urlparse
+
+from . import metrics, utils
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached response stays fresh, per resource (the first path segment).
+# Override with e.g. PAGERDUTY_CACHE_TTL_TEAMS; 0 disables caching for that resource.
+# Resources not listed here, such as incidents, are never cached.
+RESOURCE_TTL_SECONDS = {
+    resource: utils.get_env_float(f"PAGERDUTY_CACHE_TTL_{resource.upper()}", 300.0)
+    for resource in ("escalation_policies", "schedules", "services", "teams", "users")
+}
+
+# Cached resources that a successful write can change, by HTTP method and written
+# resource. Updating incidents (acknowledge, resolve, reassign) changes the `status`
+# of their services; incident notes change nothing cached. A write to a cached
+# resource always drops that resource as well. Cached responses not listed here can
+# only go stale through changes made outside this server, within their TTL.
+WRITE_INVALIDATES: dict[tuple[str, str], tuple[str, ...]] = {
+    ("PUT", "incidents"): ("services",),
+}
+
+# Seconds past its TTL that an entry is still served while it is refreshed in the
+# background; 0 makes every request after expiry wait for the refetch.
+CACHE_STALE_SECONDS = utils.get_env_float("PAGERDUTY_CACHE_STALE_SECONDS", 300.0)
+
+# Upper bound on the JSON size of all cached entries, in memory or in the database.
+CACHE_MAX_BYTES = utils.get_env_int("PAGERDUTY_CACHE_MAX_BYTES", 32 * 1024 * 1024)
+
+# SQLite database to persist cached responses to; unset keeps the cache in memory.
+CACHE_PATH = os.environ.get("PAGERDUTY_CACHE_PATH", "").strip()
+
+# Seconds after which persisted entries are pruned from the database, whatever their
+# TTL. Entries are only served until their TTL plus `CACHE_STALE_SECONDS`.
+CACHE_MAX_AGE_SECONDS = utils.get_env_float(
+    "PAGERDUTY_CACHE_MAX_AGE_SECONDS", 7 * 24 * 3600.0
+)
+
+
+class CacheBackend(Protocol):
+    """Storage for serialized responses.
+
+    Backends whose `blocking` attribute is true (the default for backends that do
+    not set it) are called from a worker thread, so slow storage never stalls the
+    event loop.
+    """
+
+    blocking: bool
+
+    def get(self, key: str) -> tuple[str, float] | None:
+        """Return the value stored under `key` and when it was fetched, or None."""
+        ...
+
+    def set(self, key: str, value: str, *, resource: str, ttl: float) -> None:
+        """Store `value` under `key` for at least `ttl` seconds, tagged with its resource."""
+        ...
+
+    def invalidate(self, resource: str) -> None:
+        """Drop every entry tagged with `resource`."""
+        ...
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        ...
+
+    def stats(self) -> dict[str, Any]:
+        """Return a JSON-serializable snapshot for `metrics://runtime`."""
+        ...
+
+
+class MemoryCache:
+    """In-process LRU cache bounded by the total size of its serialized entries."""
+
+    blocking = False
+
+    def __init__(self, *, max_bytes: int):
+        self.max_bytes = max_bytes
+        # key -> (fetched_at, ttl, resource, value)
+        self._entries: OrderedDict[str, tuple[float, float, str, str]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> tuple[str, float] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] + entry[1] <= time.time():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[3], entry[0]
+
+    def set(self, key: str, value: str, *, resource: str, ttl: float) -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.time(), ttl, resource, value)
+            self._bytes += len(value)
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, resource: str) -> None:
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if e[2] == resource]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    def _remove(self, key: str) -> None:
+        value = self._entries.pop(key)[3]
+        self._bytes -= len(value)
+
+
+class SqliteCache:
+    """Cache persisted to a SQLite database, so entries survive restarts.
+
+    Rows are served until their TTL passes and pruned on every write once that has
+    passed or they are `max_age` seconds old. Like `MemoryCache`, the total size of
+    the stored values is capped at `max_bytes`; the oldest rows are evicted first.
+    The database holds account data, so it is created readable by the current user
+    only. Storage errors are logged and treated as misses, so a broken database
+    never fails a tool call.
+    """
+
+    blocking = True
+
+    def __init__(self, path: str, *, max_age: float, max_bytes: int):
+        self.path = path
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+        self._evictions = 0
+        _restrict_to_owner(path)
+        self._conn = sqlite3.connect(
+            path, timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, resource TEXT NOT NULL, "
+            "fetched_at REAL NOT NULL, expires_at REAL NOT NULL, value TEXT NOT NULL)"
+        )
+        for column in ("resource", "expires_at", "fetched_at"):
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS responses_{column} ON responses ({column})"
+            )
+        self._bytes = self._stored_bytes()
+        self._prune()
+        self._evict()
+
+    def get(self, key: str) -> tuple[str, float] | None:
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT value, fetched_at FROM responses "
+                    "WHERE key = ? AND expires_at > ?",
+                    (key, time.time()),
+                ).fetchone()
+            except sqlite3.Error as e:
+                self._log_error("read", e)
+                row = None
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return row[0], row[1]
+
+    def set(self, key: str, value: str, *, resource: str, ttl: float) -> None:
+        if len(value) > self.max_bytes:
+            return
+        fetched_at = time.time()
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN")
+                self._delete("key = ?", (key,))
+                self._conn.execute(
+                    "INSERT INTO responses "
+                    "(key, resource, fetched_at, expires_at, value) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        resource,
+                        fetched_at,
+                        fetched_at + ttl,
+                        value,
+                    ),
+                )
+                self._bytes += len(value)
+                self._prune()
+                self._evict()
+                self._conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                self._log_error("write", e)
+                self._rollback()
+
+    def invalidate(self, resource: str) -> None:
+        with self._lock:
+            try:
+                self._delete("resource = ?", (resource,))
+            except sqlite3.Error as e:
+                self._log_error("invalidate", e)
+
+    def clear(self) -> None:
+        with self._lock:
+            try:
+                self._conn.execute("DELETE FROM responses")
+                self._bytes = 0
+            except sqlite3.Error as e:
+                self._log_error("clear", e)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            try:
+                entries = self._conn.execute(
+                    "SELECT COUNT(*) FROM responses"
+                ).fetchone()[0]
+            except sqlite3.Error:
+                entries = None
+            return {
+                "backend": "sqlite",
+                "path": self.path,
+                "entries": entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "max_age_seconds": self.max_age,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "errors": self._errors,
+            }
+
+    def _prune(self) -> None:
+        """Delete rows past their TTL or older than `max_age`."""
+        now = time.time()
+        self._delete("expires_at <= ? OR fetched_at <= ?", (now, now - self.max_age))
+
+    def _evict(self) -> None:
+        """Delete the oldest rows until the stored values fit in `max_bytes`."""
+        while self._bytes > self.max_bytes:
+            row = self._conn.execute(
+                "SELECT key FROM responses ORDER BY fetched_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                self._bytes = 0
+                return
+            self._delete("key = ?", (row[0],))
+            self._evictions += 1
+
+    def _delete(self, condition: str, params: tuple[Any, ...]) -> None:
+        """Delete the rows matching `condition`, keeping the byte total current."""
+        size, count = self._conn.execute(
+            "SELECT COALESCE(SUM(LENGTH(value)), 0), COUNT(*) FROM responses "
+            f"WHERE {condition}",
+            params,
+        ).fetchone()
+        if count:
+            self._conn.execute(f"DELETE FROM responses WHERE {condition}", params)
+            self._bytes -= size
+
+    def _stored_bytes(self) -> int:
+        return self._conn.execute(
+            "SELECT COALESCE(SUM(LENGTH(value)), 0) FROM responses"
+        ).fetchone()[0]
+
+    def _rollback(self) -> None:
+        """Undo a failed write and recount the stored bytes it may have changed."""
+        try:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            self._bytes = self._stored_bytes()
+        except sqlite3.Error as e:
+            self._log_error("rollback", e)
+
+    def _log_error(self, operation: str, error: sqlite3.Error) -> None:
+        self._errors += 1
+        logger.warning(f"Response cache {operation} failed for {self.path}: {error}")
+
+
+def _restrict_to_owner(path: str) -> None:
+    """Create the file at `path` if needed, readable and writable by its owner only.
+
+    SQLite creates its WAL and shared-memory files with the database's permissions.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    os.close(fd)
+    os.chmod(path, 0o600)
+
+
+def _default_backend() -> CacheBackend:
+    """Return the backend selected by the environment."""
+    if CACHE_PATH:
+        try:
+            return SqliteCache(
+                os.path.expanduser(CACHE_PATH),
+                max_age=CACHE_MAX_AGE_SECONDS,
+                max_bytes=CACHE_MAX_BYTES,
+            )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(
+                f"Could not open response cache at {CACHE_PATH}, keeping it in memory: {e}"
+            )
+    return MemoryCache(max_bytes=CACHE_MAX_BYTES)
+
+
+_backend: CacheBackend = _default_backend()
+_revalidations: dict[str, asyncio.Task] = {}
+_revalidation_stats = {"started": 0, "failed": 0}
+_fetch_times: ContextVar[list[float] | None] = ContextVar(
+    "pagerduty_cache_fetch_times", default=None
+)
+_bypassed: ContextVar[bool] = ContextVar("pagerduty_cache_bypassed", default=False)
+
+
+def set_backend(backend: CacheBackend) -> None:
+    """Replace the cache storage.
+
+    Args:
+        backend (CacheBackend): The new storage; entries in the old one are not carried over
+    """
+    global _backend
+    _backend = backend
+
+
+def get_backend() -> CacheBackend:
+    """Return the current cache storage.
+
+    Returns:
+        CacheBackend: The active backend
+    """
+    return _backend
+
+
+def resource_for(url: str) -> str:
+    """Return the resource a request path belongs to.
+
+    Args:
+        url (str): The API path or full URL (e.g. "/teams/P123/members")
+
+    Returns:
+        str: The first path segment (e.g. "teams")
+    """
+    path = urlparse(url).path or url
+    return path.strip("/").split("/", 1)[0]
+
+
+async def read_through(key: str, url: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Return the cached response for `key`, or fetch and cache it.
+
+    Requests for resources without a TTL are passed straight to `fetch`. An entry
+    older than its TTL that the backend still holds is returned as is, and
+    refreshed in the background. Inside `bypass` every read is fetched. The time
+    the returned data was fetched is recorded for `track_fetch_times`.
+
+    Args:
+        key (str): Identifies the request, including the token it was made with
+        url (str): The request path, used to pick the resource TTL
+        fetch: Performs the request on a miss
+
+    Returns:
+        The response, from the cache or from `fetch`
+    """
+    resource = resource_for(url)
+    ttl = RESOURCE_TTL_SECONDS.get(resource, 0.0)
+    fetch_times = _fetch_times.get()
+    if ttl > 0 and not _bypassed.get():
+        cached = await _call_backend(_backend.get, key)
+        if cached is not None:
+            value, fetched_at = cached
+            if time.time() - fetched_at >= ttl:
+                _revalidate_in_background(key, url, fetch)
+            if fetch_times is not None:
+                fetch_times.append(fetched_at)
+            return json.loads(value)
+
+    if fetch_times is not None:
+        fetch_times.append(time.time())
+    if ttl <= 0:
+        return await fetch()
+    return await _fetch_and_store(key, url, fetch)
+
+
+async def _fetch_and_store(
+    key: str, url: str, fetch: Callable[[], Awaitable[Any]]
+) -> Any:
+    resource = resource_for(url)
+    value = await fetch()
+    try:
+        serialized = json.dumps(value)
+    except (TypeError, ValueError) as e:
+        logger.debug(f"Not caching response for {url}: {e}")
+        return value
+    await _call_backend(
+        _backend.set,
+        key,
+        serialized,
+        resource=resource,
+        ttl=RESOURCE_TTL_SECONDS[resource] + CACHE_STALE_SECONDS,
+    )
+    return value
+
+
+async def _call_backend(method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Call a backend method, on a worker thread if the backend may block."""
+    if getattr(_backend, "blocking", True):
+        return await asyncio.to_thread(method, *args, **kwargs)
+    return method(*args, **kwargs)
+
+
+def _revalidate_in_background(
+    key: str, url: str, fetch: Callable[[], Awaitable[Any]]
+) -> None:
+    """Refresh a stale entry without making the caller wait for it."""
+    if key in _revalidations:
+        return
+    _revalidation_stats["started"] += 1
+    task = asyncio.create_task(_fetch_and_store(key, url, fetch))
+    _revalidations[key] = task
+
+    def _done(done: asyncio.Task) -> None:
+        if _revalidations.get(key) is done:
+            del _revalidations[key]
+        if not done.cancelled() and done.exception() is not None:
+            _revalidation_stats["failed"] += 1
+            logger.warning(f"Background refresh of {url} failed: {done.exception()}")
+
+    task.add_done_callback(_done)
+
+
+@contextmanager
+def track_fetch_times() -> Iterator[list[float]]:
+    """Collect when the data behind every read in this context was fetched.
+
+    Reads made by tasks started inside the context are collected too. Cache hits
+    report when the entry was fetched; everything else reports the time of the read.
+
+    Yields:
+        List[float]: The fetch times, as epoch seconds, filled in as reads complete
+    """
+    fetch_times: list[float] = []
+    token = _fetch_times.set(fetch_times)
+    try:
+        yield fetch_times
+    finally:
+        _fetch_times.reset(token)
+
+
+@contextmanager
+def bypass() -> Iterator[None]:
+    """Send every read in this context to the network, refreshing the cached entries.
+
+    Reads made by tasks started inside the context bypass the cache too. Use it for
+    data that is cached elsewhere and must be rebuilt from current responses.
+    """
+    token = _bypassed.set(True)
+    try:
+        yield
+    finally:
+        _bypassed.reset(token)
+
+
+def invalidated_by(method: str, url: str) -> tuple[str, ...]:
+    """Return the cached resources that a successful write can change.
+
+    Args:
+        method (str): The HTTP method of the write (e.g. "PUT")
+        url (str): The path that was written to (e.g. "/incidents/P123")
+
+    Returns:
+        Tuple[str, ...]: The resources whose cached responses must be dropped
+    """
+    resource = resource_for(url)
+    resources = WRITE_INVALIDATES.get((method, resource), ())
+    if resource in RESOURCE_TTL_SECONDS:
+        resources = (resource, *resources)
+    return resources
+
+
+async def invalidate(method: str, url: str) -> None:
+    """Drop the cached responses that a successful write can have changed.
+
+    Args:
+        method (str): The HTTP method of the write (e.g. "PUT")
+        url (str): The path that was written to (e.g. "/incidents/P123")
+    """
+    for resource in invalidated_by(method, url):
+        await _call_backend(_backend.invalidate, resource)
+
+
+def clear() -> None:
+    """Drop every cached response."""
+    _backend.clear()
+    _revalidations.clear()
+
+
+def cache_stats() -> dict[str, Any]:
+    """Return a snapshot of the response cache.
+
+    Returns:
+        Dict[str, Any]: The backend's counters, plus `revalidations` with the
+            background refreshes `in_flight`, `started` and `failed`
+    """
+    return {
+        **_backend.stats(),
+        "revalidations": {"in_flight": len(_revalidations), **_revalidation_stats},
+    }
+
+
+metrics.register_collector("response_cache", cache_stats)
@@ -1,5 +1,11 @@
+import asyncio
+import functools
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
 from importlib.metadata import version
 
 import pagerduty
@@ -7,6 +13,8 @@ from dotenv import load_dotenv
 from fastmcp.server.dependencies import get_http_request
 from starlette.requests import Request
 
+from . import rate_limit, utils
+from .async_client import AsyncRestClient, async_transport_enabled
 from .errors import PagerDutyAuthError
 
 # Load environment variables from .env file
@@ -14,15 +22,151 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on the number of per-token clients kept alive for header-authenticated
+# requests. Each client owns its own HTTP connection pool, so this also caps the
+# number of idle keep-alive connection pools held open to the PagerDuty API.
+CLIENT_POOL_MAX_SIZE = utils.get_env_int("PAGERDUTY_CLIENT_POOL_MAX_SIZE", 64)
+
+# Pooled clients that have not been handed out for this many seconds are closed
+# and dropped, so tokens that stop sending traffic do not hold connections open.
+CLIENT_POOL_IDLE_SECONDS = utils.get_env_float(
+    "PAGERDUTY_CLIENT_POOL_IDLE_SECONDS", 600.0, minimum=1.0
+)
+
 
 class _RestClient(pagerduty.RestApiV2Client):
+    # Invoked when the API rejects the client's credentials (HTTP 401).
+    on_unauthorized: Callable[[], None] | None = None
+    # Network errors are raised on the first attempt: reads are retried with backoff
+    # by `resilience.call_with_resilience`, and writes are never retried, as with the
+    # async transport.
+    max_network_attempts = 0
+
+    def __init__(self, api_key: str, *args, **kwargs):
+        super().__init__(api_key, *args, **kwargs)
+        self.token_key = utils.token_key(api_key)
+
     @property
     def user_agent(self) -> str:
         return f"pagerduty_mcp_server/{version('pagerduty_mcp_server')} {super().user_agent}"
 
+    def request(self, method, url, **kwargs):
+        """Send a request through the token's rate limit scheduler.
+
+        Replaces the SDK's blind sleep on HTTP 429: each attempt waits for a slot in the
+        token's budget, and a 429 requeues the request until the limit resets.
+        """
+        for _attempt in range(rate_limit.MAX_RATE_LIMIT_ATTEMPTS):
+            rate_limit.limiter.acquire(self.token_key)
+            try:
+                return super().request(method, url, **kwargs)
+            except rate_limit.RateLimited as e:
+                response = e.response
+                logger.debug(
+                    f"{method} {url}: Hit API rate limit (status 429); requeueing request"
+                )
+        raise pagerduty.HttpError(
+            f"{method} {url}: API responded with non-success status ({response.status_code})",
+            response,
+        )
+
+    def postprocess(self, response, suffix=None):
+        super().postprocess(response, suffix=suffix)
+        rate_limit.limiter.observe(
+            self.token_key, response.status_code, response.headers
+        )
+        if response.status_code == 401 and self.on_unauthorized is not None:
+            self.on_unauthorized()
+        if response.status_code == 429:
+            raise rate_limit.RateLimited(response)
+
+
+# Either transport may back a client; helpers in `async_utils` dispatch on the type.
+ApiClient = _RestClient | AsyncRestClient
+
+
+class ClientPool:
+    """Bounded LRU pool of PagerDuty API clients keyed by a hash of their token.
+
+    Reusing a client per token keeps its HTTP connections alive between tool calls,
+    so header-authenticated traffic avoids a new TLS handshake on every request.
+    Clients idle for longer than `idle_seconds` are closed on the next access, and
+    the least recently used client is closed once `max_size` is exceeded.
+    """
+
+    def __init__(self, *, max_size: int, idle_seconds: float):
+        self.max_size = max_size
+        self.idle_seconds = idle_seconds
+        self._clients: OrderedDict[str, tuple[ApiClient, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def get(self, token: str, factory: Callable[[str], ApiClient]) -> ApiClient:
+        """Return the pooled client for `token`, creating it with `factory` if needed.
+
+        Args:
+            token: The authentication token
+            factory: Callable that builds a new client from a token
+
+        Returns:
+            ApiClient: The client associated with the token
+        """
+        key = utils.token_key(token)
+        now = time.monotonic()
+        with self._lock:
+            evicted = self._evict_idle(now)
+            entry = self._clients.get(key)
+            if entry is not None:
+                pd_client = entry[0]
+                self._clients[key] = (pd_client, now)
+                self._clients.move_to_end(key)
+            else:
+                pd_client = factory(token)
+                self._clients[key] = (pd_client, now)
+                while len(self._clients) > self.max_size:
+                    evicted.append(self._clients.popitem(last=False)[1][0])
+        for stale_client in evicted:
+            _close_quietly(stale_client)
+        return pd_client
+
+    def clear(self) -> None:
+        """Close and drop every pooled client."""
+        with self._lock:
+            pooled = [pd_client for pd_client, _ in self._clients.values()]
+            self._clients.clear()
+        for pd_client in pooled:
+            _close_quietly(pd_client)
+
+    def _evict_idle(self, now: float) -> list[ApiClient]:
+        evicted = []
+        while self._clients:
+            key, (pd_client, last_used) = next(iter(self._clients.items()))
+            if now - last_used < self.idle_seconds:
+                break
+            del self._clients[key]
+            evicted.append(pd_client)
+        return evicted
+
+
+def _close_quietly(pd_client: ApiClient) -> None:
+    """Close a client dropped from the pool, logging any failure.
+
+    Synchronous clients close their session at once; `AsyncRestClient.close`
+    schedules `aclose()` on the running event loop.
+    """
+    try:
+        pd_client.close()
+    except Exception as e:
+        logger.debug(f"Failed to close pooled PagerDuty client: {e}")
+
 
 class PagerDutyClient:
-    _env_client: pagerduty.RestApiV2Client | None = None
+    _pool = ClientPool(
+        max_size=CLIENT_POOL_MAX_SIZE, idle_seconds=CLIENT_POOL_IDLE_SECONDS
+    )
+    _env_client: ApiClient | None = None
     _env_token: str | None = None
 
     @staticmethod
@@ -40,7 +184,10 @@ class PagerDutyClient:
 
     @staticmethod
     def _get_oauth_token() -> str | None:
-        """Try to get OAuth token from keyring or run interactive OAuth flow for local use.
+        """Try to get OAuth token from memory, the keyring, or an interactive OAuth flow for local use.
+
+        The token is cached in memory by `auth.get_token`, so the keyring is only read
+        at startup, after the token expires, or after the API rejects it.
 
         OAuth is configured if either:
         - PAGERDUTY_CLIENT_ID environment variable is set, OR
@@ -67,6 +214,22 @@ class PagerDutyClient:
             logger.error(f"OAuth authentication failed: {e}")
             raise PagerDutyAuthError(str(e)) from e
 
+    @staticmethod
+    def _create_oauth_client(token: str) -> ApiClient:
+        """Create a client for an OAuth token that marks the token expired on HTTP 401.
+
+        Args:
+            token: The OAuth access token
+
+        Returns:
+            ApiClient: A configured client
+        """
+        from .auth import reject_token
+
+        pd_client = PagerDutyClient._create_client_with_token(token)
+        pd_client.on_unauthorized = functools.partial(reject_token, token)
+        return pd_client
+
     @staticmethod
     def _get_env_token() -> str | None:
         """Try to get auth token from environment variable.
@@ -77,20 +240,24 @@ class PagerDutyClient:
         return os.environ.get("PAGERDUTY_API_TOKEN")
 
     @staticmethod
-    def _create_client_with_token(token: str) -> pagerduty.RestApiV2Client:
+    def _create_client_with_token(token: str) -> ApiClient:
         """Create a new PagerDuty client with the given token.
 
         Args:
             token: The authentication token to use
 
         Returns:
-            pagerduty.RestApiV2Client: A configured client
+            ApiClient: A configured client, backed by the asyncio transport when
+                `PAGERDUTY_ASYNC_TRANSPORT` is enabled and the synchronous SDK otherwise
         """
-        if token.startswith("pdus+_"):
-            return _RestClient(token, auth_type="bearer")
+        auth_type = "bearer" if token.startswith("pdus+_") else None
+        if async_transport_enabled():
+            return AsyncRestClient(token, auth_type=auth_type or "token")
+        if auth_type:
+            return _RestClient(token, auth_type=auth_type)
         return _RestClient(token)
 
-    def get_client(self) -> pagerduty.RestApiV2Client:
+    def get_client(self) -> ApiClient:
         """Get a PagerDuty API client.
 
         Authentication priority:
@@ -99,7 +266,7 @@ class PagerDutyClient:
         3. OAuth token from keyring (local interactive use only)
 
         Returns:
-            pagerduty.RestApiV2Client: A configured PagerDuty API client
+            ApiClient: A configured PagerDuty API client
 
         Raises:
             PagerDutyAuthError: If no valid auth token is found
@@ -107,7 +274,9 @@ class PagerDutyClient:
         has_request_context, request_token = self._get_request_token()
 
         if request_token:
-            return self._create_client_with_token(request_token)
+            return PagerDutyClient._pool.get(
+                request_token, self._create_client_with_token
+            )
 
         if current_token := self._get_env_token():
             if (
@@ -127,7 +296,7 @@ class PagerDutyClient:
             raise PagerDutyAuthError(message)
 
         if token := self._get_oauth_token():
-            return self._create_client_with_token(token)
+            return PagerDutyClient._pool.get(token, self._create_oauth_client)
 
         message = "No auth token found. Set PAGERDUTY_API_TOKEN or authenticate locally via OAuth."
         logger.error(message)
@@ -138,7 +307,31 @@ class PagerDutyClient:
 client = PagerDutyClient()
 
 
-def create_client() -> pagerduty.RestApiV2Client:
+async def load_oauth_token() -> None:
+    """Make sure the next `create_client()` finds its OAuth token in memory.
+
+    Reading the keyring, refreshing an expired token and the interactive OAuth flow
+    all block, so when the OAuth token is the one `create_client()` will use and it
+    is not in memory, it is obtained on the PagerDuty executor here instead of on the
+    event loop. Returns at once for header and environment tokens.
+
+    Raises:
+        PagerDutyAuthError: If OAuth is configured but fails
+    """
+    from .async_utils import get_executor
+    from .auth import get_cached_token
+
+    has_request_context, request_token = PagerDutyClient._get_request_token()
+    if request_token or has_request_context or PagerDutyClient._get_env_token():
+        return
+    if get_cached_token() is not None:
+        return
+    await asyncio.get_running_loop().run_in_executor(
+        get_executor(), PagerDutyClient._get_oauth_token
+    )
+
+
+def create_client() -> ApiClient:
     """Get a PagerDuty API client.
 
     Authentication priority:
@@ -147,7 +340,7 @@ def create_client() -> pagerduty.RestApiV2Client:
     3. OAuth token from keyring (local interactive use only)
 
     Returns:
-        pagerduty.RestApiV2Client: A configured PagerDuty API client
+        ApiClient: A configured PagerDuty API client
 
     Raises:
         PagerDutyAuthError: If no valid auth token is found
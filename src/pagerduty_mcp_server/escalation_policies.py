@@ -4,7 +4,13 @@ import logging
 from typing import Any
 
 from . import utils
-from .async_utils import DEFAULT_MAX_RESULTS, paginate, safe_execute_async
+from .async_utils import (
+    DEFAULT_MAX_RESULTS,
+    ID_FILTER_CHUNK_SIZE,
+    iter_sliced_pages,
+    jget,
+    list_all,
+)
 from .client import create_client
 from .models.escalation_policy import EscalationPolicy
 
@@ -23,6 +29,7 @@ async def list_escalation_policies(
     user_ids: list[str] | None = None,
     team_ids: list[str] | None = None,
     limit: int | None = None,
+    cursor: str | None = None,
     include: list[str] | None = None,
 ) -> dict[str, Any]:
     """List escalation policies based on the given criteria. Exposed in `get_escalation_policies`.
@@ -32,6 +39,7 @@ async def list_escalation_policies(
         user_ids (List[str]): Filter results to only escalation policies that include the given user IDs (optional)
         team_ids (List[str]): Filter results to only escalation policies assigned to teams with the given IDs (optional)
         limit (int): Limit the number of results returned (optional)
+        cursor (str): Continuation cursor from a previous response's `metadata.next_cursor` (optional). Resumes that query, ignoring the other filters
         include (List[str]): List of fields to include in the response. If specified, only these fields will be returned for each escalation policy
 
     Returns:
@@ -51,16 +59,38 @@ async def list_escalation_policies(
     if team_ids:
         params["team_ids[]"] = team_ids
 
+    max_records = limit or DEFAULT_MAX_RESULTS
+    if cursor is not None:
+        params, cursor_limit = utils.decode_cursor(cursor, ESCALATION_POLICIES_URL)
+        max_records = limit or cursor_limit
+
     try:
-        response = await paginate(
+        # Long ID filters are queried in chunks, each sorted by name so their
+        # results can be merged back into one name-ordered list.
+        slices = utils.split_id_filters(
+            params, ["user_ids[]", "team_ids[]"], ID_FILTER_CHUNK_SIZE
+        )
+        if len(slices) > 1:
+            slices = [{**overrides, "sort_by": "name"} for overrides in slices]
+        positions = utils.PagePositions()
+        pages = iter_sliced_pages(
             pd_client,
             ESCALATION_POLICIES_URL,
-            params=params,
-            max_records=limit or DEFAULT_MAX_RESULTS,
+            params,
+            slices,
+            key=lambda policy: (policy.get("name") or "").lower(),
+            max_records=max_records,
             operation_name="list escalation policies",
+            positions=positions,
         )
-        return utils.parse_list_response(
-            response, EscalationPolicy, "escalation_policies", include=include
+        return await utils.parse_list_pages(
+            pages,
+            EscalationPolicy,
+            "escalation_policies",
+            include=include,
+            next_cursor=utils.make_next_cursor(
+                ESCALATION_POLICIES_URL, params, max_records, positions
+            ),
         )
     except Exception as e:
         utils.handle_api_error(e)
@@ -88,9 +118,10 @@ async def show_escalation_policy(
     pd_client = create_client()
 
     try:
-        response = await safe_execute_async(
-            lambda: pd_client.jget(f"{ESCALATION_POLICIES_URL}/{policy_id}"),
-            f"fetch escalation policy {policy_id}",
+        response = await jget(
+            pd_client,
+            f"{ESCALATION_POLICIES_URL}/{policy_id}",
+            operation_name=f"fetch escalation policy {policy_id}",
         )
         try:
             policy_data = response["escalation_policy"]
@@ -146,9 +177,11 @@ async def fetch_escalation_policy_ids(*, user_id: str | None = None) -> list[str
     params = {"user_ids[]": [user_id]}
 
     try:
-        response = await safe_execute_async(
-            lambda: pd_client.list_all(ESCALATION_POLICIES_URL, params=params),
-            "fetch escalation policy IDs",
+        response = await list_all(
+            pd_client,
+            ESCALATION_POLICIES_URL,
+            params=params,
+            operation_name="fetch escalation policy IDs",
         )
         return [result["id"] for result in response if result and result.get("id")]
     except Exception as e:
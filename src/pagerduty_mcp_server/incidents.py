@@ -1,12 +1,22 @@
 """PagerDuty incident operations."""
 
+import asyncio
 import logging
 import os
 import re
+from collections.abc import AsyncGenerator, Awaitable
+from datetime import timedelta
 from typing import Any
 
 from . import utils
-from .async_utils import DEFAULT_MAX_RESULTS, paginate, safe_execute_async
+from .async_utils import (
+    DEFAULT_MAX_RESULTS,
+    ID_FILTER_CHUNK_SIZE,
+    iter_sliced_pages,
+    jget,
+    jpost,
+    jput,
+)
 from .client import create_client
 from .models.incident import Incident
 from .models.note import Note
@@ -24,6 +34,19 @@ DEFAULT_URGENCIES = ["high", "low"]
 
 AUTORESOLVE_TYPE = "service_reference"
 
+# Incident queries over longer ranges are split into windows of this many days,
+# fetched concurrently and merged by `created_at`. PagerDuty rejects ranges over 180.
+INCIDENT_WINDOW_DAYS = min(utils.get_env_int("PAGERDUTY_INCIDENT_WINDOW_DAYS", 31), 180)
+
+# Incidents fetched at the same time by `show_incidents`.
+BATCH_FETCH_CONCURRENCY = utils.get_env_int("PAGERDUTY_BATCH_FETCH_CONCURRENCY", 8)
+
+# PagerDuty accepts at most this many incidents per `PUT /incidents` request.
+BULK_UPDATE_MAX_INCIDENTS = 250
+
+# Chunks of a bulk status update sent to PagerDuty at the same time.
+BULK_UPDATE_CONCURRENCY = utils.get_env_int("PAGERDUTY_BULK_UPDATE_CONCURRENCY", 4)
+
 """
 Incidents API Helpers
 """
@@ -38,6 +61,7 @@ async def list_incidents(
     since: str | None = None,
     until: str | None = None,
     limit: int | None = None,
+    cursor: str | None = None,
     include: list[str] | None = None,
 ) -> dict[str, Any]:
     """List PagerDuty incidents based on specified filters. Exposed in `get_incidents`.
@@ -54,9 +78,12 @@ async def list_incidents(
             - 'high' - High urgency incidents (included by default)
             - 'low' - Low urgency incidents (included by default)
             Defaults to ['high', 'low'] if not specified.
-        since (str): Start of date range in ISO8601 format (optional). Default is 1 month ago
+        since (str): Start of date range in ISO8601 format (optional). Default is 1 month ago.
+            Ranges longer than `INCIDENT_WINDOW_DAYS` are fetched as concurrent windows
+            and returned oldest first
         until (str): End of date range in ISO8601 format (optional). Default is now
         limit (int): Limit the number of results returned (optional)
+        cursor (str): Continuation cursor from a previous response's `metadata.next_cursor` (optional). Resumes that query, ignoring the other filters
         include (List[str]): List of fields to include in the response. If specified, only these fields will be returned for each incident.
 
     Returns:
@@ -98,26 +125,74 @@ async def list_incidents(
         utils.validate_iso8601_timestamp(until, "until")
         params["until"] = until
 
+    max_records = limit or DEFAULT_MAX_RESULTS
+    if cursor is not None:
+        params, cursor_limit = utils.decode_cursor(cursor, INCIDENTS_URL)
+        max_records = limit or cursor_limit
+
     try:
-        response = await paginate(
-            pd_client,
-            INCIDENTS_URL,
-            params=params,
-            max_records=limit or DEFAULT_MAX_RESULTS,
-            operation_name="list incidents",
-        )
-        metadata = _calculate_incident_metadata(response)
-        return utils.parse_list_response(
-            response,
+        positions = utils.PagePositions()
+        pages = _iter_incident_pages(pd_client, params, max_records, positions)
+        metadata = _calculate_incident_metadata([])
+        return await utils.parse_list_pages(
+            pages,
             Incident,
             "incidents",
             include=include,
             additional_metadata=metadata,
+            on_page=lambda page: _add_incident_metadata(metadata, page),
+            next_cursor=utils.make_next_cursor(
+                INCIDENTS_URL, params, max_records, positions
+            ),
         )
     except Exception as e:
         utils.handle_api_error(e)
 
 
+def _iter_incident_pages(
+    pd_client: Any,
+    params: dict[str, Any],
+    max_records: int,
+    positions: utils.PagePositions,
+) -> AsyncGenerator[list[dict[str, Any]]]:
+    """Return the pages of an incident query, splitting it when it is too large.
+
+    A range longer than `INCIDENT_WINDOW_DAYS` is queried one window at a time, and
+    `service_ids`/`team_ids` filters longer than `ID_FILTER_CHUNK_SIZE` one chunk at
+    a time. Each part is sorted by `created_at` and the parts are merged into a single
+    stream in `created_at` order. An `offset` in `params` (from a cursor) then holds
+    where each part resumes.
+    """
+    windows = None
+    if params.get("since") is not None:
+        windows = utils.split_time_range(
+            params["since"], params.get("until"), timedelta(days=INCIDENT_WINDOW_DAYS)
+        )
+    slices = [
+        {**window, **chunk}
+        for window in (
+            [{"since": since, "until": until} for since, until in windows]
+            if windows is not None
+            else [{}]
+        )
+        for chunk in utils.split_id_filters(
+            params, ["service_ids", "team_ids"], ID_FILTER_CHUNK_SIZE
+        )
+    ]
+    if len(slices) > 1:
+        slices = [{**overrides, "sort_by": "created_at:asc"} for overrides in slices]
+    return iter_sliced_pages(
+        pd_client,
+        INCIDENTS_URL,
+        params,
+        slices,
+        key=lambda incident: incident.get("created_at") or "",
+        max_records=max_records,
+        operation_name="list incidents",
+        positions=positions,
+    )
+
+
 async def show_incident(
     *,
     incident_id: str,
@@ -148,81 +223,44 @@ async def show_incident(
     _validate_incident_id(incident_id)
 
     pd_client = create_client()
-    params = {"include[]": "body"}
-
-    try:
-        incident_metadata = {}
 
-        response = await safe_execute_async(
-            lambda: pd_client.jget(f"{INCIDENTS_URL}/{incident_id}", params=params),
-            f"fetch incident {incident_id}",
+    # (response key, metadata count key, description) -> fetch, for each requested sub-resource
+    sub_fetches: dict[tuple[str, str, str], Awaitable[dict[str, Any]]] = {}
+    if include_past_incidents:
+        sub_fetches[
+            ("incidents", "past_incidents", f"past incidents for {incident_id}")
+        ] = _list_past_incidents(incident_id=incident_id, include=include)
+    if include_related_incidents:
+        sub_fetches[
+            ("incidents", "related_incidents", f"related incidents for {incident_id}")
+        ] = _list_related_incidents(incident_id=incident_id, include=include)
+    if include_notes:
+        sub_fetches[("notes", "notes", f"notes for incident {incident_id}")] = (
+            _list_notes(incident_id=incident_id)
         )
-        try:
-            incident_data = response["incident"]
-        except KeyError:
-            raise RuntimeError(
-                f"Failed to fetch or process incident {incident_id}: 'incident'"
-            )
 
-        parsed_main_incident = {}
-        if incident_data:
-            model = Incident.model_validate(incident_data)
-            parsed_main_incident = model.to_clean_dict(include_fields=include)
-
-        if include_past_incidents:
-            try:
-                past_incidents_response = await _list_past_incidents(
-                    incident_id=incident_id
-                )
-                if past_incidents_response and past_incidents_response.get("incidents"):
-                    parsed_main_incident["past_incidents"] = past_incidents_response[
-                        "incidents"
-                    ]
-
-                if parsed_main_incident.get("past_incidents"):
-                    incident_metadata["past_incidents_count"] = len(
-                        parsed_main_incident["past_incidents"]
-                    )
-            except Exception as e_past:
-                logger.error(
-                    f"Error fetching past incidents for {incident_id}: {e_past}"
-                )
+    # Sub-resources only need the incident ID, so fetch them alongside the incident.
+    sub_tasks = {
+        spec: asyncio.ensure_future(fetch) for spec, fetch in sub_fetches.items()
+    }
+    try:
+        incident_metadata = {}
 
-        if include_related_incidents:
-            try:
-                related_incidents_response = await _list_related_incidents(
-                    incident_id=incident_id
-                )
-                if related_incidents_response and related_incidents_response.get(
-                    "incidents"
-                ):
-                    parsed_main_incident["related_incidents"] = (
-                        related_incidents_response["incidents"]
-                    )
-
-                if parsed_main_incident.get("related_incidents"):
-                    incident_metadata["related_incidents_count"] = len(
-                        parsed_main_incident["related_incidents"]
-                    )
-            except Exception as e_related:
-                logger.error(
-                    f"Error fetching related incidents for {incident_id}: {e_related}"
-                )
+        parsed_main_incident = await _fetch_incident(pd_client, incident_id, include)
 
-        if include_notes:
-            try:
-                notes_response = await _list_notes(incident_id=incident_id)
-                if notes_response and notes_response.get("notes"):
-                    parsed_main_incident["notes"] = notes_response["notes"]
-
-                if parsed_main_incident.get("notes"):
-                    incident_metadata["notes_count"] = len(
-                        parsed_main_incident["notes"]
-                    )
-            except Exception as e_notes:
-                logger.error(
-                    f"Error fetching notes for incident {incident_id}: {e_notes}"
-                )
+        sub_results = await asyncio.gather(*sub_tasks.values(), return_exceptions=True)
+        for (list_key, field, description), result in zip(
+            sub_tasks, sub_results, strict=True
+        ):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                logger.error(f"Error fetching {description}: {result}")
+                continue
+            if result and result.get(list_key):
+                parsed_main_incident[field] = result[list_key]
+            if parsed_main_incident.get(field):
+                incident_metadata[f"{field}_count"] = len(parsed_main_incident[field])
 
         return utils.api_response_handler(
             results=parsed_main_incident,
@@ -231,6 +269,92 @@ async def show_incident(
         )
     except Exception as e:
         utils.handle_api_error(e)
+    finally:
+        # If the incident fetch failed, its sub-resources are no longer needed.
+        for task in sub_tasks.values():
+            task.cancel()
+        await asyncio.gather(*sub_tasks.values(), return_exceptions=True)
+
+
+async def show_incidents(
+    *,
+    incident_ids: list[str],
+    include_notes: bool | None = False,
+    include: list[str] | None = None,
+) -> dict[str, Any]:
+    """Get detailed information about many incidents in one call. Exposed as MCP server tool.
+
+    The incidents are fetched with one client, at most `BATCH_FETCH_CONCURRENCY` at
+    a time. An incident that cannot be fetched does not fail the call; it is
+    reported in `metadata.failed` instead.
+
+    Args:
+        incident_ids (List[str]): The IDs or numbers of the incidents to get. Duplicates are ignored
+        include_notes (Optional[bool]): If True, includes notes for each incident. Defaults to False.
+        include (List[str]): List of fields to include in the response. If specified, only these fields will be returned for each incident.
+
+    Returns:
+        See the "Standard Response Format" section in `tools.md` for the complete standard response structure.
+        The response will contain the incidents in request order, with `fetched_count`,
+        `failed_count` and `failed` (a list of `{"incident_id": ..., "error": ...}`) in the metadata.
+
+    Raises:
+        ValueError: If incident_ids is empty or contains an invalid ID
+    """
+    if not incident_ids:
+        raise ValueError("incident_ids cannot be empty")
+    for incident_id in incident_ids:
+        _validate_incident_id(incident_id)
+
+    unique_ids = list(dict.fromkeys(incident_ids))
+    pd_client = create_client()
+    semaphore = asyncio.Semaphore(BATCH_FETCH_CONCURRENCY)
+
+    async def _fetch(incident_id: str) -> dict[str, Any]:
+        async with semaphore:
+            if not include_notes:
+                return await _fetch_incident(pd_client, incident_id, include)
+            incident, notes = await asyncio.gather(
+                _fetch_incident(pd_client, incident_id, include),
+                _fetch_notes(pd_client, incident_id),
+                return_exceptions=True,
+            )
+        if isinstance(incident, BaseException):
+            raise incident
+        if isinstance(notes, BaseException):
+            if not isinstance(notes, Exception):
+                raise notes
+            logger.error(f"Error fetching notes for incident {incident_id}: {notes}")
+        elif notes:
+            incident["notes"] = notes
+        return incident
+
+    results = await asyncio.gather(
+        *(_fetch(incident_id) for incident_id in unique_ids), return_exceptions=True
+    )
+
+    fetched: list[dict[str, Any]] = []
+    failed: list[dict[str, str]] = []
+    for incident_id, result in zip(unique_ids, results, strict=True):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            response = getattr(result, "response", None)
+            error = response.text if response is not None else str(result)
+            logger.error(f"Error fetching incident {incident_id}: {error}")
+            failed.append({"incident_id": incident_id, "error": error})
+        elif result:
+            fetched.append(result)
+
+    return utils.api_response_handler(
+        results=fetched,
+        resource_name="incidents",
+        additional_metadata={
+            "fetched_count": len(fetched),
+            "failed_count": len(failed),
+            "failed": failed,
+        },
+    )
 
 
 """
@@ -310,13 +434,12 @@ async def update_incident_status(
     }
 
     try:
-        response = await safe_execute_async(
-            lambda: pd_client.jput(
-                f"{INCIDENTS_URL}/{incident_id}",
-                json=payload,
-                headers={"From": from_email},
-            ),
-            f"{status} incident {incident_id}",
+        response = await jput(
+            pd_client,
+            f"{INCIDENTS_URL}/{incident_id}",
+            json=payload,
+            headers={"From": from_email},
+            operation_name=f"{status} incident {incident_id}",
         )
         try:
             incident_data = response["incident"]
@@ -338,6 +461,113 @@ async def update_incident_status(
         utils.handle_api_error(e)
 
 
+async def update_incidents_status(
+    *,
+    incident_ids: list[str],
+    status: str,
+    include: list[str] | None = None,
+) -> dict[str, Any]:
+    """Update the status of many PagerDuty incidents (acknowledge or resolve).
+
+    The incidents are sent through `PUT /incidents` in chunks of at most
+    `BULK_UPDATE_MAX_INCIDENTS`, with up to `BULK_UPDATE_CONCURRENCY` chunks in
+    flight. The current user's email is looked up once for the whole batch. A chunk
+    that fails does not stop the others; its incidents are reported as failed.
+
+    Args:
+        incident_ids (List[str]): The IDs of the incidents to update. Duplicates are ignored
+        status (str): The new status ('acknowledged' or 'resolved')
+        include (List[str]): List of fields to include for each updated incident
+
+    Returns:
+        Dict with the updated incidents in standard response format. The metadata
+        contains `updated_count`, `failed_count` and `failed`, a list of
+        `{"incident_id": ..., "error": ...}` for each incident that was not updated.
+
+    Raises:
+        ValueError: If incident_ids is empty or contains an invalid ID, or status is invalid
+    """
+    if not incident_ids:
+        raise ValueError("incident_ids cannot be empty")
+    for incident_id in incident_ids:
+        _validate_incident_id(incident_id)
+
+    valid_statuses = ["acknowledged", "resolved"]
+    if status not in valid_statuses:
+        raise ValueError(
+            f"Invalid status '{status}'. Valid values are: {valid_statuses}"
+        )
+
+    unique_ids = list(dict.fromkeys(incident_ids))
+    pd_client = create_client()
+    from_email = await _get_current_user_email()
+    semaphore = asyncio.Semaphore(BULK_UPDATE_CONCURRENCY)
+
+    async def _update_chunk(chunk: list[str]) -> list[dict[str, Any]]:
+        payload = {
+            "incidents": [
+                {"id": incident_id, "type": "incident_reference", "status": status}
+                for incident_id in chunk
+            ]
+        }
+        async with semaphore:
+            response = await jput(
+                pd_client,
+                INCIDENTS_URL,
+                json=payload,
+                headers={"From": from_email},
+                operation_name=f"{status} {len(chunk)} incidents",
+            )
+        try:
+            return response["incidents"]
+        except KeyError:
+            raise RuntimeError("Response missing 'incidents' field")
+
+    chunks = [
+        unique_ids[start : start + BULK_UPDATE_MAX_INCIDENTS]
+        for start in range(0, len(unique_ids), BULK_UPDATE_MAX_INCIDENTS)
+    ]
+    results = await asyncio.gather(
+        *(_update_chunk(chunk) for chunk in chunks), return_exceptions=True
+    )
+
+    projection = Incident.projection(include)
+    updated: list[dict[str, Any]] = []
+    failed: list[dict[str, str]] = []
+    for chunk, result in zip(chunks, results, strict=True):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            response = getattr(result, "response", None)
+            error = response.text if response is not None else str(result)
+            logger.error(f"Failed to {status} incidents {chunk}: {error}")
+            failed.extend({"incident_id": i, "error": error} for i in chunk)
+            continue
+
+        returned = {item.get("id"): item for item in result if item}
+        for incident_id in chunk:
+            if incident_id not in returned:
+                failed.append(
+                    {
+                        "incident_id": incident_id,
+                        "error": "Incident missing from PagerDuty response",
+                    }
+                )
+                continue
+            model = projection.model_validate(returned[incident_id])
+            updated.append(model.to_clean_dict(include_fields=include))
+
+    return utils.api_response_handler(
+        results=updated,
+        resource_name="incidents",
+        additional_metadata={
+            "updated_count": len(updated),
+            "failed_count": len(failed),
+            "failed": failed,
+        },
+    )
+
+
 async def create_incident_note(
     *,
     incident_id: str,
@@ -371,13 +601,12 @@ async def create_incident_note(
     }
 
     try:
-        response = await safe_execute_async(
-            lambda: pd_client.jpost(
-                f"{INCIDENTS_URL}/{incident_id}/notes",
-                json=payload,
-                headers={"From": from_email},
-            ),
-            f"add note to incident {incident_id}",
+        response = await jpost(
+            pd_client,
+            f"{INCIDENTS_URL}/{incident_id}/notes",
+            json=payload,
+            headers={"From": from_email},
+            operation_name=f"add note to incident {incident_id}",
         )
         try:
             note_data = response["note"]
@@ -404,11 +633,14 @@ Incidents Private Helpers
 """
 
 
-async def _list_past_incidents(*, incident_id: str) -> dict[str, Any]:
+async def _list_past_incidents(
+    *, incident_id: str, include: list[str] | None = None
+) -> dict[str, Any]:
     """List incidents from the past 6 months that are similar to the input incident, and were generated on the same service as the parent incident.
 
     Args:
         incident_id (str): The ID or number of the incident to find similar incidents for
+        include (List[str]): Fields to return for each past incident, as for the incident itself (optional)
 
     Returns:
         See the "Standard Response Format" section in `tools.md` for the complete standard response structure.
@@ -425,9 +657,10 @@ async def _list_past_incidents(*, incident_id: str) -> dict[str, Any]:
     pd_client = create_client()
 
     try:
-        response = await safe_execute_async(
-            lambda: pd_client.jget(f"{INCIDENTS_URL}/{incident_id}/past_incidents"),
-            f"fetch past incidents for {incident_id}",
+        response = await jget(
+            pd_client,
+            f"{INCIDENTS_URL}/{incident_id}/past_incidents",
+            operation_name=f"fetch past incidents for {incident_id}",
         )
         try:
             past_incidents = response["past_incidents"]
@@ -436,13 +669,14 @@ async def _list_past_incidents(*, incident_id: str) -> dict[str, Any]:
                 f"Failed to fetch past incidents for {incident_id}: Response missing 'past_incidents' field"
             )
 
+        projection = Incident.projection(include)
         parsed_response = []
         for item in past_incidents:
             incident_data = item.get("incident", {})
             parsed_incident = {}
             if incident_data:
-                model = Incident.model_validate(incident_data)
-                parsed_incident = model.to_clean_dict()
+                model = projection.model_validate(incident_data)
+                parsed_incident = model.to_clean_dict(include_fields=include)
 
             parsed_response.append(
                 {
@@ -459,11 +693,14 @@ async def _list_past_incidents(*, incident_id: str) -> dict[str, Any]:
         utils.handle_api_error(e)
 
 
-async def _list_related_incidents(*, incident_id: str) -> dict[str, Any]:
+async def _list_related_incidents(
+    *, incident_id: str, include: list[str] | None = None
+) -> dict[str, Any]:
     """List the 20 most recent related incidents that are impacting other services and responders.
 
     Args:
         incident_id (str): The ID or number of the incident to get related incidents for
+        include (List[str]): Fields to return for each related incident, as for the incident itself (optional)
 
     Returns:
         See the "Standard Response Format" section in `tools.md` for the complete standard response structure.
@@ -480,9 +717,10 @@ async def _list_related_incidents(*, incident_id: str) -> dict[str, Any]:
     pd_client = create_client()
 
     try:
-        response = await safe_execute_async(
-            lambda: pd_client.jget(f"{INCIDENTS_URL}/{incident_id}/related_incidents"),
-            f"fetch related incidents for {incident_id}",
+        response = await jget(
+            pd_client,
+            f"{INCIDENTS_URL}/{incident_id}/related_incidents",
+            operation_name=f"fetch related incidents for {incident_id}",
         )
         try:
             related_incidents = response["related_incidents"]
@@ -491,13 +729,14 @@ async def _list_related_incidents(*, incident_id: str) -> dict[str, Any]:
                 f"Failed to fetch related incidents for {incident_id}: Response missing 'related_incidents' field"
             )
 
+        projection = Incident.projection(include)
         parsed_response = []
         for item in related_incidents:
             incident_data = item["incident"]
             parsed_incident = {}
             if incident_data:
-                model = Incident.model_validate(incident_data)
-                parsed_incident = model.to_clean_dict()
+                model = projection.model_validate(incident_data)
+                parsed_incident = model.to_clean_dict(include_fields=include)
 
             relationships = item.get("relationships", [])
             parsed_response.append(
@@ -540,24 +779,7 @@ async def _list_notes(*, incident_id: str) -> dict[str, Any]:
     pd_client = create_client()
 
     try:
-        response = await safe_execute_async(
-            lambda: pd_client.jget(f"{INCIDENTS_URL}/{incident_id}/notes"),
-            f"fetch notes for incident {incident_id}",
-        )
-        try:
-            notes = response["notes"]
-        except KeyError:
-            raise RuntimeError(
-                f"Failed to fetch notes for incident {incident_id}: Response missing 'notes' field"
-            )
-
-        parsed_response = []
-        for note in notes:
-            if not note:
-                continue
-            model = Note.model_validate(note)
-            parsed_response.append(model.to_clean_dict())
-
+        parsed_response = await _fetch_notes(pd_client, incident_id)
         return utils.api_response_handler(
             results=parsed_response, resource_name="notes"
         )
@@ -565,6 +787,69 @@ async def _list_notes(*, incident_id: str) -> dict[str, Any]:
         utils.handle_api_error(e)
 
 
+async def _fetch_incident(
+    pd_client: Any, incident_id: str, include: list[str] | None
+) -> dict[str, Any]:
+    """Fetch one incident with its body and return it cleaned. Internal helper function.
+
+    Args:
+        pd_client: The API client to use
+        incident_id (str): The ID or number of the incident
+        include (List[str]): Fields to keep, or None for all
+
+    Returns:
+        Dict[str, Any]: The cleaned incident, or an empty dict if PagerDuty returned none
+
+    Raises:
+        RuntimeError: If the response has no 'incident' field
+    """
+    response = await jget(
+        pd_client,
+        f"{INCIDENTS_URL}/{incident_id}",
+        params={"include[]": "body"},
+        operation_name=f"fetch incident {incident_id}",
+    )
+    try:
+        incident_data = response["incident"]
+    except KeyError:
+        raise RuntimeError(
+            f"Failed to fetch or process incident {incident_id}: 'incident'"
+        )
+
+    if not incident_data:
+        return {}
+    model = Incident.projection(include).model_validate(incident_data)
+    return model.to_clean_dict(include_fields=include)
+
+
+async def _fetch_notes(pd_client: Any, incident_id: str) -> list[dict[str, Any]]:
+    """Fetch the notes of one incident and return them cleaned. Internal helper function.
+
+    Args:
+        pd_client: The API client to use
+        incident_id (str): The ID or number of the incident
+
+    Returns:
+        List[Dict[str, Any]]: The cleaned notes
+
+    Raises:
+        RuntimeError: If the response has no 'notes' field
+    """
+    response = await jget(
+        pd_client,
+        f"{INCIDENTS_URL}/{incident_id}/notes",
+        operation_name=f"fetch notes for incident {incident_id}",
+    )
+    try:
+        notes = response["notes"]
+    except KeyError:
+        raise RuntimeError(
+            f"Failed to fetch notes for incident {incident_id}: Response missing 'notes' field"
+        )
+
+    return [Note.model_validate(note).to_clean_dict() for note in notes if note]
+
+
 def _count_incident_statuses(incidents: list[dict[str, Any]]) -> dict[str, int]:
     """Count incidents by status. Internal helper function.
 
@@ -647,3 +932,19 @@ def _calculate_incident_metadata(incidents: list[dict[str, Any]]) -> dict[str, A
         "autoresolve_count": autoresolve_count,
         "no_data_count": no_data_count,
     }
+
+
+def _add_incident_metadata(
+    metadata: dict[str, Any], incidents: list[dict[str, Any]]
+) -> None:
+    """Add the counts for another page of incidents to metadata built by `_calculate_incident_metadata`. Internal helper function.
+
+    Args:
+        metadata (Dict[str, Any]): Metadata to update in place
+        incidents (List[Dict[str, Any]]): List of incident objects
+    """
+    page_metadata = _calculate_incident_metadata(incidents)
+    for status, count in page_metadata["status_counts"].items():
+        metadata["status_counts"][status] += count
+    metadata["autoresolve_count"] += page_metadata["autoresolve_count"]
+    metadata["no_data_count"] += page_metadata["no_data_count"]
@@ -0,0 +1,109 @@
+"""In-process runtime metrics for the PagerDuty MCP Server.
+
+Components register a collector that returns a JSON-serializable snapshot of their
+state; `snapshot()` gathers every collector and is exposed through the
+`metrics://runtime` resource.
+"""
+
+import logging
+import math
+import threading
+from collections.abc import Callable, Sequence
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (in seconds) for latency histograms, from 1ms to 30s.
+DEFAULT_LATENCY_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+_collectors: dict[str, Callable[[], dict[str, Any]]] = {}
+_collectors_lock = threading.Lock()
+
+
+class Histogram:
+    """Thread-safe fixed-bucket histogram with cumulative (`le`) bucket counts."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record a single observation.
+
+        Args:
+            value (float): The observed value, in the histogram's unit
+        """
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the observation count, sum and cumulative bucket counts.
+
+        Returns:
+            Dict[str, Any]: `count`, `sum` and `buckets`, where `buckets` maps each upper bound
+                (and "+Inf") to the number of observations less than or equal to it
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total = self._count
+            value_sum = self._sum
+        cumulative: dict[str, int] = {}
+        running = 0
+        for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+            running += count
+            cumulative["+Inf" if bound == math.inf else f"{bound:g}"] = running
+        return {"count": total, "sum": value_sum, "buckets": cumulative}
+
+
+def register_collector(name: str, collector: Callable[[], dict[str, Any]]) -> None:
+    """Register a callable whose snapshot is reported under `name`.
+
+    Args:
+        name (str): The key for this component in `snapshot()`
+        collector (Callable[[], Dict[str, Any]]): Returns the component's current metrics
+    """
+    with _collectors_lock:
+        _collectors[name] = collector
+
+
+def snapshot() -> dict[str, Any]:
+    """Collect the current metrics from every registered component.
+
+    Returns:
+        Dict[str, Any]: Mapping of component name to its metrics. A collector that raises
+            is reported as `{"error": "<message>"}` instead of failing the whole snapshot.
+    """
+    with _collectors_lock:
+        collectors = dict(_collectors)
+    result: dict[str, Any] = {}
+    for name, collector in sorted(collectors.items()):
+        try:
+            result[name] = collector()
+        except Exception as e:
+            logger.error(f"Metrics collector {name} failed: {e}")
+            result[name] = {"error": str(e)}
+    return result
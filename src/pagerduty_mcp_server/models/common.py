@@ -1,8 +1,13 @@
 """Common Pydantic models for PagerDuty resources."""
 
-from typing import Any
+import copy
+import functools
+from typing import Any, ClassVar
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+# Most projection models kept at once; the least recently used is dropped beyond it.
+PROJECTION_CACHE_SIZE = 256
 
 
 class PagerDutyBaseModel(BaseModel):
@@ -12,6 +17,36 @@ class PagerDutyBaseModel(BaseModel):
         use_enum_values=True,
     )
 
+    # Fields that the model's validators derive from one another. A projection that
+    # includes any field of a group includes the whole group and keeps the model
+    # validators; one that includes none of them drops the model validators.
+    projection_groups: ClassVar[tuple[frozenset[str], ...]] = ()
+
+    @classmethod
+    def projection(cls, include: list[str] | None) -> type["PagerDutyBaseModel"]:
+        """Return a model that validates and serializes only the given fields.
+
+        Validating with the projection skips the fields the caller will not see, so
+        `projection(include).model_validate(data).to_clean_dict(include_fields=include)`
+        gives the same result as the full model at a fraction of the cost. Projections
+        are cached per model and set of model fields they keep, up to
+        `PROJECTION_CACHE_SIZE` of them.
+
+        Args:
+            include: Field names to keep, or None for all fields
+
+        Returns:
+            The projection model, or this model if nothing can be left out.
+        """
+        if include is None:
+            return cls
+        by_name = _fields_by_name(cls)
+        names = {by_name[field] for field in include if field in by_name}
+        for group in cls.projection_groups:
+            if names & group:
+                names |= group
+        return _projection(cls, frozenset(names))
+
     def to_clean_dict(self, include_fields: list[str] | None = None) -> dict[str, Any]:
         """Serialize to dictionary with empty fields excluded, optionally filtering to specific fields.
 
@@ -99,3 +134,66 @@ class IdOnly(PagerDutyBaseModel):
     )
     self: str | None = Field(None, exclude=True, description="Excluded: API URL")
     html_url: str | None = Field(None, exclude=True, description="Excluded: Web UI URL")
+
+
+@functools.cache
+def _fields_by_name(model_class: type[PagerDutyBaseModel]) -> dict[str, str]:
+    """Map each field's name and aliases to the field, for one model class."""
+    by_name: dict[str, str] = {}
+    for name, info in model_class.model_fields.items():
+        for alias in (info.alias, info.serialization_alias, name):
+            if alias is not None:
+                by_name[alias] = name
+    return by_name
+
+
+@functools.lru_cache(maxsize=PROJECTION_CACHE_SIZE)
+def _projection(
+    model_class: type[PagerDutyBaseModel], names: frozenset[str]
+) -> type[PagerDutyBaseModel]:
+    """Derive the projection of `model_class` onto the model fields `names`."""
+    fields = model_class.model_fields
+    grouped = frozenset().union(*model_class.projection_groups)
+
+    decorators = model_class.__pydantic_decorators__
+    if (
+        names == set(fields)
+        or decorators.field_serializers
+        or decorators.model_serializers
+        or decorators.computed_fields
+        or (decorators.model_validators and not grouped)
+    ):
+        # Nothing to leave out, or no way to tell what the model's own
+        # validators and serializers need.
+        return model_class
+
+    namespace: dict[str, Any] = {
+        "__module__": model_class.__module__,
+        "__doc__": model_class.__doc__,
+        "__annotations__": {},
+        "model_config": model_class.model_config,
+    }
+    for name in fields:
+        if name in names:
+            namespace["__annotations__"][name] = fields[name].annotation
+            namespace[name] = copy.copy(fields[name])
+
+    for name, decorator in decorators.field_validators.items():
+        targets = [field for field in decorator.info.fields if field in names]
+        if targets:
+            func = getattr(decorator.func, "__func__", decorator.func)
+            namespace[name] = field_validator(*targets, mode=decorator.info.mode)(
+                classmethod(func)
+            )
+    if names & grouped:
+        for name, model_decorator in decorators.model_validators.items():
+            # model_validator is overloaded per mode, so the mode is passed untyped.
+            mode: Any = model_decorator.info.mode
+            namespace[name] = model_validator(mode=mode)(model_decorator.func)
+
+    fields_label = "_".join(sorted(names))
+    return type(
+        f"{model_class.__name__}Projection_{fields_label}",
+        (PagerDutyBaseModel,),
+        namespace,
+    )
@@ -1,6 +1,6 @@
 """Pydantic models for PagerDuty Incidents."""
 
-from typing import Any
+from typing import Any, ClassVar
 
 from pydantic import Field, model_validator
 
@@ -109,6 +109,11 @@ class Incident(PagerDutyBaseModel):
         None, exclude=True, description="Excluded: First trigger log entry reference"
     )
 
+    # extract_body_details derives body_details and client_url from body.
+    projection_groups: ClassVar[tuple[frozenset[str], ...]] = (
+        frozenset({"body", "body_details", "client_url"}),
+    )
+
     @model_validator(mode="after")
     def extract_body_details(self):
         """Extract body_details from the nested body structure."""
@@ -4,7 +4,7 @@ import logging
 from typing import Any
 
 from . import utils
-from .async_utils import DEFAULT_MAX_RESULTS, paginate
+from .async_utils import DEFAULT_MAX_RESULTS, ID_FILTER_CHUNK_SIZE, iter_sliced_pages
 from .client import create_client
 from .models.oncall import Oncall
 
@@ -26,6 +26,7 @@ async def list_oncalls(
     until: str | None = None,
     limit: int | None = None,
     earliest: bool | None = None,
+    cursor: str | None = None,
     include: list[str] | None = None,
 ) -> dict[str, Any]:
     """List the on-call entries during a given time range.
@@ -38,6 +39,7 @@ async def list_oncalls(
         since (str): Start of date range in ISO8601 format (optional). Default is 1 month ago
         until (str): End of date range in ISO8601 format (optional). Default is now
         limit (int): Limit the number of results returned (optional)
+        cursor (str): Continuation cursor from a previous response's `metadata.next_cursor` (optional). Resumes that query, ignoring the other filters
         earliest (bool): If True, only returns the earliest on-call for each combination of escalation policy, escalation level, and user. Useful for determining when the "next" on-calls are for a given set of filters. (optional)
         include (List[str]): List of fields to include in the response. If specified, only these fields will be returned for each on-call entry
 
@@ -67,14 +69,56 @@ async def list_oncalls(
     if earliest is not None:
         params["earliest"] = earliest
 
+    max_records = limit or DEFAULT_MAX_RESULTS
+    if cursor is not None:
+        params, cursor_limit = utils.decode_cursor(cursor, ONCALLS_URL)
+        max_records = limit or cursor_limit
+
     try:
-        response = await paginate(
+        # Long ID filters are queried in chunks. The API documents no order for
+        # on-calls, so the chunks' results are returned one chunk after another,
+        # minus entries an earlier chunk already returned.
+        slices = utils.split_id_filters(
+            params,
+            ["schedule_ids[]", "user_ids[]", "escalation_policy_ids[]"],
+            ID_FILTER_CHUNK_SIZE,
+        )
+        positions = utils.PagePositions()
+        pages = iter_sliced_pages(
             pd_client,
             ONCALLS_URL,
-            params=params,
-            max_records=limit or DEFAULT_MAX_RESULTS,
+            params,
+            slices,
+            key=None,
+            max_records=max_records,
             operation_name="list oncalls",
+            positions=positions,
+            identity=_oncall_identity,
+        )
+        return await utils.parse_list_pages(
+            pages,
+            Oncall,
+            "oncalls",
+            include=include,
+            next_cursor=utils.make_next_cursor(
+                ONCALLS_URL, params, max_records, positions
+            ),
         )
-        return utils.parse_list_response(response, Oncall, "oncalls", include=include)
     except Exception as e:
         utils.handle_api_error(e)
+
+
+def _oncall_identity(oncall: dict[str, Any]) -> tuple:
+    """Identify an on-call entry, which has no `id` of its own.
+
+    The same entry matches several chunks of an ID filter when, e.g., its user and its
+    schedule fall in different chunks.
+    """
+    return (
+        (oncall.get("user") or {}).get("id"),
+        (oncall.get("schedule") or {}).get("id"),
+        (oncall.get("escalation_policy") or {}).get("id"),
+        oncall.get("escalation_level"),
+        oncall.get("start"),
+        oncall.get("end"),
+    )
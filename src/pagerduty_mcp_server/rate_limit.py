@@ -0,0 +1,272 @@
+"""Per-token scheduling for PagerDuty's REST API rate limit.
+
+PagerDuty limits REST API requests per token. Every upstream request first reserves a
+slot from its token's bucket and waits if the budget is spent, so concurrent tool calls
+queue instead of failing with HTTP 429. Buckets start at `RATE_LIMIT_PER_MINUTE` and are
+corrected from the `ratelimit-*` response headers and from `Retry-After` on 429s.
+"""
+
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+from . import metrics, utils
+
+logger = logging.getLogger(__name__)
+
+# Default request budget per token until PagerDuty reports the actual limit.
+RATE_LIMIT_PER_MINUTE = utils.get_env_int("PAGERDUTY_RATE_LIMIT_PER_MINUTE", 960)
+RATE_LIMIT_PERIOD_SECONDS = 60.0
+
+# Attempts allowed for a single request that keeps receiving HTTP 429 before giving up.
+MAX_RATE_LIMIT_ATTEMPTS = 10
+# Cooldown after a 429 without `Retry-After` or `ratelimit-reset`, doubled on each
+# consecutive 429 up to the maximum.
+RATE_LIMIT_BASE_DELAY_SECONDS = 1.5
+RATE_LIMIT_MAX_DELAY_SECONDS = 60.0
+
+# Buckets kept before the least recently used token's bucket is dropped.
+MAX_TRACKED_TOKENS = 1024
+
+
+class RateLimited(Exception):
+    """Raised from a client's response hook when the API answers HTTP 429.
+
+    Lets the synchronous SDK client hand the retry back to the scheduler instead of
+    sleeping blindly inside the SDK.
+    """
+
+    def __init__(self, response: Any):
+        super().__init__("API responded with HTTP 429 (rate limit exceeded)")
+        self.response = response
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> float | None:
+    value = headers.get(name)
+    if not isinstance(value, str):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class TokenBucket:
+    """Token bucket tracking one API token's request budget."""
+
+    def __init__(
+        self,
+        limit: int = RATE_LIMIT_PER_MINUTE,
+        period: float = RATE_LIMIT_PERIOD_SECONDS,
+    ):
+        self.limit = limit
+        self.period = period
+        self._tokens = float(limit)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._consecutive_429s = 0
+        self._remaining: int | None = None
+        self._requests = 0
+        self._queued = 0
+        self._waiting = 0
+        self._wait_seconds = 0.0
+        self._rate_limited = 0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        rate = self.limit / self.period
+        self._tokens = min(
+            float(self.limit), self._tokens + (now - self._updated) * rate
+        )
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Reserve a request slot.
+
+        Slots are handed out in arrival order, so a caller that has to wait is queued
+        behind earlier reservations rather than competing with them.
+
+        Returns:
+            float: Seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            self._requests += 1
+            wait = max(
+                0.0,
+                -self._tokens * self.period / self.limit,
+                self._blocked_until - now,
+            )
+            if wait > 0:
+                self._queued += 1
+                self._wait_seconds += wait
+            return wait
+
+    @contextlib.contextmanager
+    def waiting(self) -> Iterator[None]:
+        """Count the caller as queued on this bucket for the duration of the block."""
+        with self._lock:
+            self._waiting += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    def observe(self, status: int, headers: Mapping[str, str]) -> None:
+        """Correct the budget from a response's rate limit headers.
+
+        Args:
+            status (int): The response status code
+            headers (Mapping[str, str]): The response headers
+        """
+        limit = _header_float(headers, "ratelimit-limit")
+        remaining = _header_float(headers, "ratelimit-remaining")
+        reset = _header_float(headers, "ratelimit-reset")
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if limit is not None and limit >= 1:
+                self.limit = int(limit)
+            if remaining is not None:
+                self._remaining = int(remaining)
+                self._tokens = min(self._tokens, remaining)
+                if remaining <= 0 and reset is not None:
+                    self._blocked_until = max(self._blocked_until, now + reset)
+            if status == 429:
+                self._rate_limited += 1
+                self._consecutive_429s += 1
+                retry_after = _header_float(headers, "retry-after")
+                if retry_after is None:
+                    retry_after = reset
+                if retry_after is None:
+                    retry_after = min(
+                        RATE_LIMIT_BASE_DELAY_SECONDS
+                        * 2 ** (self._consecutive_429s - 1),
+                        RATE_LIMIT_MAX_DELAY_SECONDS,
+                    )
+                self._tokens = min(self._tokens, 0.0)
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+            else:
+                self._consecutive_429s = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return the bucket's current budget and usage counters.
+
+        Returns:
+            Dict[str, Any]: limit, available and remaining budget, requests, queued and
+                waiting requests, total wait time and 429 responses
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                "limit_per_minute": round(self.limit * 60.0 / self.period),
+                "available": max(0, int(self._tokens)),
+                "remaining_reported": self._remaining,
+                "blocked_seconds": round(max(0.0, self._blocked_until - now), 3),
+                "requests": self._requests,
+                "queued_requests": self._queued,
+                "waiting": self._waiting,
+                "wait_seconds_total": round(self._wait_seconds, 3),
+                "rate_limited_responses": self._rate_limited,
+            }
+
+
+class RateLimiter:
+    """Registry of per-token buckets that every upstream request goes through."""
+
+    def __init__(self, max_tokens: int = MAX_TRACKED_TOKENS):
+        self.max_tokens = max_tokens
+        self._buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def bucket(self, key: str) -> TokenBucket:
+        """Return the bucket for a token key, creating it on first use.
+
+        Args:
+            key (str): The token key (see `utils.token_key`)
+
+        Returns:
+            TokenBucket: The token's bucket
+        """
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket()
+                self._buckets[key] = bucket
+                if len(self._buckets) > self.max_tokens:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+            return bucket
+
+    def acquire(self, key: str) -> float:
+        """Wait (blocking the calling thread) until the token may send a request.
+
+        Args:
+            key (str): The token key
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        bucket = self.bucket(key)
+        wait = bucket.reserve()
+        if wait > 0:
+            logger.debug(f"Rate limit budget spent; queueing request for {wait:.2f}s")
+            with bucket.waiting():
+                time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, key: str) -> float:
+        """Wait (without blocking the event loop) until the token may send a request.
+
+        Args:
+            key (str): The token key
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        bucket = self.bucket(key)
+        wait = bucket.reserve()
+        if wait > 0:
+            logger.debug(f"Rate limit budget spent; queueing request for {wait:.2f}s")
+            with bucket.waiting():
+                await asyncio.sleep(wait)
+        return wait
+
+    def observe(self, key: str, status: int, headers: Mapping[str, str]) -> None:
+        """Update the token's bucket from a response.
+
+        Args:
+            key (str): The token key
+            status (int): The response status code
+            headers (Mapping[str, str]): The response headers
+        """
+        self.bucket(key).observe(status, headers)
+
+    def clear(self) -> None:
+        """Forget every tracked bucket."""
+        with self._lock:
+            self._buckets.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return per-token budget usage, keyed by a short token key prefix.
+
+        Returns:
+            Dict[str, Any]: Mapping of token key prefix to `TokenBucket.stats()`
+        """
+        with self._lock:
+            buckets = list(self._buckets.items())
+        return {key[:12]: bucket.stats() for key, bucket in buckets}
+
+
+limiter = RateLimiter()
+metrics.register_collector("rate_limits", limiter.stats)
@@ -0,0 +1,322 @@
+"""Retry and circuit breaking for upstream PagerDuty calls.
+
+Idempotent reads are retried with jittered exponential backoff when PagerDuty fails
+transiently (5xx, timeouts, network errors). Each endpoint also has a circuit breaker:
+after repeated upstream failures it opens and fails fast with `CircuitOpenError`, then
+lets a limited number of half-open probe requests through to detect recovery. This
+keeps tool latency bounded and executor threads free while PagerDuty is degraded.
+"""
+
+import asyncio
+import logging
+import random
+import re
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+from urllib.parse import urlparse
+
+import pagerduty
+
+from . import metrics, utils
+from .errors import PagerDutyError
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without httpx installed
+    httpx = None  # type: ignore[assignment]
+
+try:
+    import httpx2
+except ImportError:  # pragma: no cover - depends on the SDK release's HTTP backend
+    httpx2 = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Total attempts (including the first) for an idempotent request that fails transiently.
+RETRY_MAX_ATTEMPTS = utils.get_env_int("PAGERDUTY_RETRY_MAX_ATTEMPTS", 3)
+RETRY_BASE_DELAY_SECONDS = utils.get_env_float("PAGERDUTY_RETRY_BASE_DELAY", 0.5)
+RETRY_MAX_DELAY_SECONDS = 8.0
+
+# Consecutive upstream failures that open an endpoint's circuit.
+CIRCUIT_FAILURE_THRESHOLD = utils.get_env_int("PAGERDUTY_CIRCUIT_FAILURE_THRESHOLD", 5)
+# Seconds an open circuit fails fast before letting a half-open probe through.
+CIRCUIT_RESET_SECONDS = utils.get_env_float(
+    "PAGERDUTY_CIRCUIT_RESET_SECONDS", 30.0, minimum=1.0
+)
+# Concurrent probe requests allowed while a circuit is half-open.
+CIRCUIT_HALF_OPEN_PROBES = 1
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_RESOURCE_SEGMENT = re.compile(r"^[a-z_]+$")
+
+
+class CircuitOpenError(PagerDutyError):
+    """Raised instead of calling an endpoint whose circuit breaker is open."""
+
+
+def endpoint_key(method: str, url: str) -> str:
+    """Return the circuit breaker key for a request, with resource IDs normalized.
+
+    Args:
+        method (str): The HTTP method
+        url (str): The API path or full URL
+
+    Returns:
+        str: e.g. "GET /incidents/{id}/notes" for "/incidents/PABC123/notes"
+    """
+    path = urlparse(url).path or url
+    segments = [
+        segment if _RESOURCE_SEGMENT.match(segment) else "{id}"
+        for segment in path.strip("/").split("/")
+        if segment
+    ]
+    return f"{method.upper()} /{'/'.join(segments)}"
+
+
+def is_transient_error(e: BaseException) -> bool:
+    """Return True if an exception indicates PagerDuty is failing rather than the request.
+
+    Args:
+        e (BaseException): The exception raised by an upstream call
+
+    Returns:
+        bool: True for 5xx and 408 responses, timeouts and network errors
+    """
+    if isinstance(e, pagerduty.HttpError):
+        status = getattr(e.response, "status_code", None)
+        return status is not None and (status >= 500 or status == 408)
+    if isinstance(e, CircuitOpenError):
+        return False
+    if type(e) is pagerduty.Error:
+        # The SDK raises a bare `Error` from the network error that ended its
+        # request loop; bare errors without one (e.g. unsupported methods) are final.
+        return e.__cause__ is not None and is_transient_error(e.__cause__)
+    if httpx is not None and isinstance(e, httpx.TransportError):
+        return True
+    if httpx2 is not None and isinstance(e, httpx2.TransportError):
+        return True
+    return isinstance(e, (TimeoutError, ConnectionError))
+
+
+class RetryPolicy:
+    """Jittered exponential backoff ("full jitter") for transient upstream failures."""
+
+    def __init__(
+        self,
+        max_attempts: int = RETRY_MAX_ATTEMPTS,
+        base_delay: float = RETRY_BASE_DELAY_SECONDS,
+        max_delay: float = RETRY_MAX_DELAY_SECONDS,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def should_retry(self, e: BaseException, attempt: int) -> bool:
+        """Return True if a failed attempt should be retried.
+
+        Args:
+            e (BaseException): The exception raised by the attempt
+            attempt (int): The zero-based number of the attempt that failed
+
+        Returns:
+            bool: Whether another attempt is allowed and the error is transient
+        """
+        return attempt + 1 < self.max_attempts and is_transient_error(e)
+
+    def delay(self, attempt: int) -> float:
+        """Return a randomized delay before retrying after the given attempt.
+
+        Args:
+            attempt (int): The zero-based number of the attempt that failed
+
+        Returns:
+            float: Seconds to wait, uniformly drawn from 0 to the capped exponential bound
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker for one endpoint."""
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_seconds: float = CIRCUIT_RESET_SECONDS,
+        half_open_probes: int = CIRCUIT_HALF_OPEN_PROBES,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.half_open_probes = half_open_probes
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._times_opened = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    def before_call(self, key: str) -> None:
+        """Admit a call, or fail fast if the circuit is open.
+
+        Args:
+            key (str): The endpoint key, for the error message
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a probe in flight
+        """
+        with self._lock:
+            if self.state == OPEN:
+                remaining = self._opened_at + self.reset_seconds - time.monotonic()
+                if remaining > 0:
+                    self._rejected += 1
+                    raise CircuitOpenError(
+                        f"PagerDuty is failing for {key}; not sending requests for another {remaining:.0f}s. Try again shortly."
+                    )
+                self.state = HALF_OPEN
+                self._probes_in_flight = 0
+            if self.state == HALF_OPEN:
+                if self._probes_in_flight >= self.half_open_probes:
+                    self._rejected += 1
+                    raise CircuitOpenError(
+                        f"PagerDuty is failing for {key}; a recovery probe is in progress. Try again shortly."
+                    )
+                self._probes_in_flight += 1
+
+    def record_success(self) -> None:
+        """Record a call that reached a healthy endpoint, closing the circuit."""
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info("PagerDuty endpoint recovered; closing circuit")
+            self.state = CLOSED
+            self._failures = 0
+            self._probes_in_flight = 0
+
+    def record_cancelled(self) -> None:
+        """Release the probe slot of a call that was cancelled before it finished."""
+        with self._lock:
+            if self.state == HALF_OPEN and self._probes_in_flight > 0:
+                self._probes_in_flight -= 1
+
+    def record_failure(self) -> None:
+        """Record an upstream failure, opening the circuit once the threshold is reached."""
+        with self._lock:
+            self._failures += 1
+            if self.state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    self._times_opened += 1
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+                self._probes_in_flight = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return the breaker's state and counters.
+
+        Returns:
+            Dict[str, Any]: state, consecutive failures, times opened and rejected calls
+        """
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self._failures,
+                "times_opened": self._times_opened,
+                "rejected_calls": self._rejected,
+            }
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+retry_policy = RetryPolicy()
+
+
+def get_breaker(key: str) -> CircuitBreaker:
+    """Return the circuit breaker for an endpoint key, creating it on first use.
+
+    Args:
+        key (str): The endpoint key (see `endpoint_key`)
+
+    Returns:
+        CircuitBreaker: The endpoint's breaker
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = _breakers[key] = CircuitBreaker()
+        return breaker
+
+
+def reset_breakers() -> None:
+    """Forget every circuit breaker, closing all circuits."""
+    with _breakers_lock:
+        _breakers.clear()
+
+
+def breaker_stats() -> dict[str, Any]:
+    """Return the state of every endpoint's circuit breaker.
+
+    Returns:
+        Dict[str, Any]: Mapping of endpoint key to `CircuitBreaker.stats()`
+    """
+    with _breakers_lock:
+        breakers = sorted(_breakers.items())
+    return {key: breaker.stats() for key, breaker in breakers}
+
+
+metrics.register_collector("circuit_breakers", breaker_stats)
+
+
+async def call_with_resilience(
+    method: str,
+    url: str,
+    func: Callable[[], Awaitable[Any]],
+    *,
+    idempotent: bool,
+    operation_name: str,
+) -> Any:
+    """Run an upstream call behind its endpoint's circuit breaker, retrying idempotent calls.
+
+    Args:
+        method (str): The HTTP method, used for the endpoint key
+        url (str): The API path, used for the endpoint key
+        func (Callable[[], Awaitable[Any]]): Starts one attempt of the call
+        idempotent (bool): Whether transient failures may be retried
+        operation_name (str): Descriptive name for logging
+
+    Returns:
+        Any: The result of the first successful attempt
+
+    Raises:
+        CircuitOpenError: If the endpoint's circuit is open
+        Exception: The last attempt's error, if it is not retried
+    """
+    key = endpoint_key(method, url)
+    breaker = get_breaker(key)
+    attempt = 0
+    while True:
+        breaker.before_call(key)
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            breaker.record_cancelled()
+            raise
+        except Exception as e:
+            if is_transient_error(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            if not idempotent or not retry_policy.should_retry(e, attempt):
+                raise
+            delay = retry_policy.delay(attempt)
+            logger.warning(
+                f"{operation_name} failed transiently (attempt {attempt + 1}/{retry_policy.max_attempts}): {e}; retrying in {delay:.2f}s"
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+            continue
+        breaker.record_success()
+        return result
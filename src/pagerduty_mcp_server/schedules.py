@@ -4,7 +4,7 @@ import logging
 from typing import Any
 
 from . import utils
-from .async_utils import DEFAULT_MAX_RESULTS, paginate, safe_execute_async
+from .async_utils import DEFAULT_MAX_RESULTS, iter_pages, jget
 from .client import create_client
 from .models.schedule import Schedule
 from .models.user import User
@@ -22,6 +22,7 @@ async def list_schedules(
     *,
     query: str | None = None,
     limit: int | None = None,
+    cursor: str | None = None,
     include: list[str] | None = None,
 ) -> dict[str, Any]:
     """List existing PagerDuty schedules. Returns all schedules that match the given search criteria. Exposed in `get_schedules`.
@@ -29,6 +30,7 @@ async def list_schedules(
     Args:
         query (str): Filter schedules whose names contain the search query (optional)
         limit (int): Limit the number of results returned (optional)
+        cursor (str): Continuation cursor from a previous response's `metadata.next_cursor` (optional). Resumes that query, ignoring the other filters
         include (List[str]): List of fields to include in the response. If specified, only these fields will be returned for each schedule
 
     Returns:
@@ -45,16 +47,29 @@ async def list_schedules(
     if query:
         params["query"] = query
 
+    max_records = limit or DEFAULT_MAX_RESULTS
+    if cursor is not None:
+        params, cursor_limit = utils.decode_cursor(cursor, SCHEDULES_URL)
+        max_records = limit or cursor_limit
+
     try:
-        response = await paginate(
+        positions = utils.PagePositions()
+        pages = iter_pages(
             pd_client,
             SCHEDULES_URL,
             params=params,
-            max_records=limit or DEFAULT_MAX_RESULTS,
+            max_records=max_records,
             operation_name="list schedules",
+            positions=positions,
         )
-        return utils.parse_list_response(
-            response, Schedule, "schedules", include=include
+        return await utils.parse_list_pages(
+            pages,
+            Schedule,
+            "schedules",
+            include=include,
+            next_cursor=utils.make_next_cursor(
+                SCHEDULES_URL, params, max_records, positions
+            ),
         )
     except Exception as e:
         utils.handle_api_error(e)
@@ -97,9 +112,11 @@ async def show_schedule(
         params["until"] = until
 
     try:
-        response = await safe_execute_async(
-            lambda: pd_client.jget(f"{SCHEDULES_URL}/{schedule_id}", params=params),
-            f"fetch schedule {schedule_id}",
+        response = await jget(
+            pd_client,
+            f"{SCHEDULES_URL}/{schedule_id}",
+            params=params,
+            operation_name=f"fetch schedule {schedule_id}",
         )
         try:
             schedule_data = response["schedule"]
@@ -157,11 +174,11 @@ async def list_users_oncall(
         params["until"] = until
 
     try:
-        response = await safe_execute_async(
-            lambda: pd_client.jget(
-                f"{SCHEDULES_URL}/{schedule_id}/users", params=params
-            ),
-            f"fetch users oncall for schedule {schedule_id}",
+        response = await jget(
+            pd_client,
+            f"{SCHEDULES_URL}/{schedule_id}/users",
+            params=params,
+            operation_name=f"fetch users oncall for schedule {schedule_id}",
         )
         try:
             users_data = response["users"]
@@ -1,6 +1,12 @@
 """PagerDuty MCP Server main module."""
 
-from collections.abc import Awaitable, Callable
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
 from functools import wraps
 from importlib.metadata import version
 from pathlib import Path
@@ -10,8 +16,11 @@ from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
 
 from . import (
+    auth,
+    client,
     escalation_policies,
     incidents,
+    metrics,
     oncalls,
     schedules,
     services,
@@ -28,26 +37,110 @@ from .models.service import Service
 from .models.team import Team
 from .models.user import User
 
+logger = logging.getLogger(__name__)
+
+# Prefetch the user context and reference data before serving; see `warm_up`.
+# `--warm-up` on the command line sets this too.
+WARM_UP_ON_START = os.environ.get("PAGERDUTY_WARM_UP", "").strip().lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+# Longest startup waits for the warm-up before serving with whatever it fetched.
+WARM_UP_TIMEOUT_SECONDS = utils.get_env_float("PAGERDUTY_WARM_UP_TIMEOUT_SECONDS", 15.0)
+
 instructions = f"""
 PagerDuty MCP Server v{version("pagerduty_mcp_server")}
 
 REQUIRED READING: You MUST read all tool documentation using the resource `docs://tools` before using any tools. Failure to read the tools documentation may result in incorrect or incomplete results.
 """
 
+
+async def warm_up() -> None:
+    """Prefetch what the first tool calls for the configured token need.
+
+    Builds the user context and fetches the results of the default `get_teams`,
+    `get_services` and `get_escalation_policies` calls into the response cache,
+    concurrently. The requests also open the connections to the API, so the first
+    interactive call does not pay for TLS handshakes. Only runs for a token from
+    `PAGERDUTY_API_TOKEN`, so startup never triggers an interactive OAuth flow.
+    Failures are logged and never stop the server from starting.
+    """
+    if not os.environ.get("PAGERDUTY_API_TOKEN"):
+        logger.info("Skipping warm-up: PAGERDUTY_API_TOKEN is not set")
+        return
+
+    async def _warm_user_scoped() -> None:
+        user_context = await users.build_user_context()
+        await asyncio.gather(
+            services.list_services(team_ids=user_context["team_ids"]),
+            escalation_policies.list_escalation_policies(
+                user_ids=[user_context["user_id"]], team_ids=user_context["team_ids"]
+            ),
+        )
+
+    started = time.monotonic()
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                _warm_user_scoped(), teams.list_teams(), return_exceptions=True
+            ),
+            timeout=WARM_UP_TIMEOUT_SECONDS,
+        )
+    except TimeoutError:
+        logger.warning(
+            f"Warm-up did not finish within {WARM_UP_TIMEOUT_SECONDS}s; serving anyway"
+        )
+        return
+
+    failures = [r for r in results if isinstance(r, Exception)]
+    for failure in failures:
+        logger.warning(f"Warm-up fetch failed: {failure}")
+    logger.info(
+        f"Warm-up finished in {time.monotonic() - started:.2f}s"
+        f" with {len(failures)} failed fetches"
+    )
+
+
+@contextlib.asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Warm caches if enabled, then run background tasks, such as the OAuth token refresher, for the server's lifetime."""
+    if WARM_UP_ON_START:
+        await warm_up()
+    tasks: list[asyncio.Task] = []
+    if auth.token_refresh_enabled():
+        tasks.append(asyncio.create_task(auth.run_token_refresher()))
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+
 mcp = FastMCP(
     name="pagerduty_mcp_server",
     instructions=instructions,
+    lifespan=lifespan,
 )
 
 
 def tool_error_boundary(
     func: Callable[..., Awaitable[dict[str, Any]]],
 ) -> Callable[..., Awaitable[dict[str, Any]]]:
-    """Convert common tool failures into ToolError so FastMCP sets isError=true."""
+    """Convert common tool failures into ToolError so FastMCP sets isError=true.
+
+    Also loads the OAuth token off the event loop before the tool runs, so the tool's
+    `create_client()` calls never block on the keyring or a token refresh.
+    """
 
     @wraps(func)
     async def wrapper(*args, **kwargs) -> dict[str, Any]:
         try:
+            await client.load_oauth_token()
             return await func(*args, **kwargs)
         except ToolError:
             raise
@@ -73,6 +166,17 @@ def get_tool_documentation() -> str:
         return f.read()
 
 
+"""
+Runtime Metrics
+"""
+
+
+@mcp.resource("metrics://runtime")
+def get_runtime_metrics() -> str:
+    """Runtime metrics for sizing the server, such as PagerDuty executor utilization."""
+    return json.dumps(metrics.snapshot(), indent=2)
+
+
 """
 Escalation Policies Tools
 """
@@ -89,6 +193,7 @@ async def get_escalation_policies(
     user_ids: list[str] | None = None,
     team_ids: list[str] | None = None,
     limit: int | None = None,
+    cursor: str | None = None,
     include: list[str] | None = None,
 ) -> dict[str, Any]:
     """Get PagerDuty escalation policies by filters or get details for a specific policy ID.
@@ -100,8 +205,25 @@ async def get_escalation_policies(
         user_ids (List[str]): Policies that include these user IDs (optional, excludes current_user_context). Not used if `policy_id` is provided.
         team_ids (List[str]): Policies assigned to these team IDs (optional, excludes current_user_context). Not used if `policy_id` is provided.
         limit (int): Limit the number of results (optional). Not used if `policy_id` is provided.
+        cursor (str): Continuation cursor from a previous response's `metadata.next_cursor` (optional). Resumes that query where it stopped; cannot be used with other filters.
         include (List[str]): List of fields to include in the response. If specified, only these fields will be returned for each escalation policy
     """
+    if cursor is not None:
+        disallowed_filters_present = (
+            policy_id is not None
+            or query is not None
+            or user_ids is not None
+            or team_ids is not None
+        )
+        if disallowed_filters_present:
+            raise ValueError(
+                "When `cursor` is provided, other filters (like policy_id, query, user_ids, team_ids) cannot be used. See `docs://tools` for more information."
+            )
+
+        return await escalation_policies.list_escalation_policies(
+            cursor=cursor, limit=limit, include=include
+        )
+
     if policy_id is not None:
         disallowed_filters_present = (
             query is not None
@@ -153,6 +275,7 @@ Incidents Tools
 async def get_incidents(
     *,
     incident_id: str | None = None,
+    incident_ids: list[str] | None = None,
     current_user_context: bool = True,
     service_ids: list[str] | None = None,
     team_ids: list[str] | None = None,
@@ -164,28 +287,52 @@ async def get_incidents(
     include_past_incidents: bool | None = False,
     include_related_incidents: bool | None = False,
     include_notes: bool | None = False,
+    cursor: str | None = None,
     include: list[str] | None = None,
 ) -> dict[str, Any]:
     """Get PagerDuty incidents by filters or get details for a specific incident ID or number.
 
     Args:
         incident_id (str): The incident ID or number to retrieve (optional, cannot be used with any other filters).
+        incident_ids (List[str]): Several incident IDs or numbers to retrieve in one call (optional, cannot be used with `incident_id` or any other filters). Use this instead of repeated calls with `incident_id`.
         current_user_context (bool): Filter by current user's context (default: True). Not used if `incident_id` is provided.
         service_ids (List[str]): Filter by services (optional, excludes current_user_context). Not used if `incident_id` is provided.
         team_ids (List[str]): Filter by teams (optional, excludes current_user_context). Not used if `incident_id` is provided.
         statuses (List[str]): Filter by status (optional). Not used if `incident_id` is provided. Must be input as a list of strings, valid values are `["triggered", "acknowledged", "resolved"]`. Defaults to all statuses.
         urgencies (List[str]): Filter by urgency (optional). Not used if `incident_id` is provided. Must be input as a list of strings, valid values are `["high", "low"]`. Defaults to all urgencies. Account must have the urgencies ability to do this.
-        since (str): Start of query range in ISO8601 format (default range: 1 month, max range: 6 months). Not used if `incident_id` is provided.
-        until (str): End of query range in ISO8601 format (default range: 1 month, max range: 6 months). Not used if `incident_id` is provided.
+        since (str): Start of query range in ISO8601 format (default range: 1 month; longer ranges, such as a quarter or a year, are supported). Not used if `incident_id` is provided.
+        until (str): End of query range in ISO8601 format (default range: 1 month; longer ranges, such as a quarter or a year, are supported). Not used if `incident_id` is provided.
         limit (int): Max results (optional). Not used if `incident_id` is provided.
+        cursor (str): Continuation cursor from a previous response's `metadata.next_cursor` (optional). Resumes that query where it stopped; cannot be used with other filters.
         include_past_incidents (Optional[bool]): If True and `incident_id` is provided, includes similar past incidents in the response. Defaults to False. Cannot be used without `incident_id`.
         include_related_incidents (Optional[bool]): If True and `incident_id` is provided, includes related incidents impacting other services/responders in the response. Defaults to False. Cannot be used without `incident_id`.
-        include_notes (Optional[bool]): If True, includes notes for each incident in the response. Defaults to False.
+        include_notes (Optional[bool]): If True and `incident_id` or `incident_ids` is provided, includes notes for each incident in the response. Defaults to False.
         include (List[str]): List of fields to include in the response. If specified, only these fields will be returned for each incident
     """
+    if cursor is not None:
+        disallowed_filters_present = (
+            incident_id is not None
+            or incident_ids is not None
+            or service_ids is not None
+            or team_ids is not None
+            or statuses is not None
+            or urgencies is not None
+            or since is not None
+            or until is not None
+        )
+        if disallowed_filters_present:
+            raise ValueError(
+                "When `cursor` is provided, other filters (like incident_id, service_ids, team_ids, statuses, etc.) cannot be used. See `docs://tools` for more information."
+            )
+
+        return await incidents.list_incidents(
+            cursor=cursor, limit=limit, include=include
+        )
+
     if incident_id is not None:
         disallowed_filters_present = (
-            service_ids is not None
+            incident_ids is not None
+            or service_ids is not None
             or team_ids is not None
             or statuses is not None
             or since is not None
@@ -207,6 +354,27 @@ async def get_incidents(
 
         return incident_response
 
+    if incident_ids is not None:
+        disallowed_filters_present = (
+            service_ids is not None
+            or team_ids is not None
+            or statuses is not None
+            or urgencies is not None
+            or since is not None
+            or until is not None
+            or limit is not None
+            or bool(include_past_incidents)
+            or bool(include_related_incidents)
+        )
+        if disallowed_filters_present:
+            raise ValueError(
+                "When `incident_ids` is provided, only `include_notes` and `include` can be used. See `docs://tools` for more information."
+            )
+
+        return await incidents.show_incidents(
+            incident_ids=incident_ids, include_notes=include_notes, include=include
+        )
+
     if include_past_incidents or include_related_incidents or include_notes:
         raise ValueError(
             "`include_past_incidents`, `include_related_incidents`, and `include_notes` can only be used when a specific `incident_id` is provided. See `docs://tools` for more information."
@@ -226,7 +394,7 @@ async def get_incidents(
         )
 
     if since and until:
-        utils.validate_timestamp_range(since, until)
+        utils.validate_timestamp_range(since, until, max_days=None)
 
     incidents_response = await incidents.list_incidents(
         service_ids=service_ids,
@@ -284,6 +452,48 @@ async def resolve_incident(
     )
 
 
+@mcp.tool()
+@tool_error_boundary
+@validation.validate_include_parameter(Incident)
+async def acknowledge_incidents(
+    *,
+    incident_ids: list[str],
+    include: list[str] | None = None,
+) -> dict[str, Any]:
+    """Acknowledge many PagerDuty incidents in one call. Use this instead of repeated `acknowledge_incident` calls when handling several incidents.
+
+    Args:
+        incident_ids (List[str]): The IDs of the incidents to acknowledge (required).
+        include (List[str]): List of fields to include in the response. If specified, only these fields will be returned for each incident.
+    """
+    return await incidents.update_incidents_status(
+        incident_ids=incident_ids,
+        status="acknowledged",
+        include=include,
+    )
+
+
+@mcp.tool()
+@tool_error_boundary
+@validation.validate_include_parameter(Incident)
+async def resolve_incidents(
+    *,
+    incident_ids: list[str],
+    include: list[str] | None = None,
+) -> dict[str, Any]:
+    """Resolve many PagerDuty incidents in one call. Use this instead of repeated `resolve_incident` calls when handling several incidents.
+
+    Args:
+        incident_ids (List[str]): The IDs of the incidents to resolve (required).
+        include (List[str]): List of fields to include in the response. If specified, only these fields will be returned for each incident.
+    """
+    return await incidents.update_incidents_status(
+        incident_ids=incident_ids,
+        status="resolved",
+        include=include,
+    )
+
+
 @mcp.tool()
 @tool_error_boundary
 async def add_incident_note(
@@ -321,6 +531,7 @@ async def get_oncalls(
     until: str | None = None,
     limit: int | None = None,
     earliest: bool | None = None,
+    cursor: str | None = None,
     include: list[str] | None = None,
 ) -> dict[str, Any]:
     """List on-call entries for schedules, policies, or time ranges.
@@ -339,9 +550,26 @@ async def get_oncalls(
         since (str): Start of query range in ISO8601 format (default: current datetime)
         until (str): End of query range in ISO8601 format (default: current datetime, max range: 90 days in the future). Cannot be before `since`.
         limit (int): Max results (optional)
+        cursor (str): Continuation cursor from a previous response's `metadata.next_cursor` (optional). Resumes that query where it stopped; cannot be used with other filters.
         earliest (bool): Only earliest on-call per policy/level/user combo (optional)
         include (List[str]): List of fields to include in the response. If specified, only these fields will be returned for each on-call entry
     """
+    if cursor is not None:
+        disallowed_filters_present = (
+            schedule_ids is not None
+            or user_ids is not None
+            or escalation_policy_ids is not None
+            or since is not None
+            or until is not None
+            or earliest is not None
+        )
+        if disallowed_filters_present:
+            raise ValueError(
+                "When `cursor` is provided, other filters (like schedule_ids, user_ids, since, etc.) cannot be used. See `docs://tools` for more information."
+            )
+
+        return await oncalls.list_oncalls(cursor=cursor, limit=limit, include=include)
+
     if current_user_context:
         if user_ids is not None:
             raise ValueError(
@@ -384,6 +612,7 @@ async def get_schedules(
     limit: int | None = None,
     since: str | None = None,
     until: str | None = None,
+    cursor: str | None = None,
     include: list[str] | None = None,
 ) -> dict[str, Any]:
     """Get PagerDuty schedules by filters or get details for a specific schedule ID.
@@ -392,10 +621,27 @@ async def get_schedules(
         schedule_id (str): The schedule ID to retrieve details for (optional, cannot be used with query or limit).
         query (str): Filter schedules whose names contain the search query (optional). Not used if `schedule_id` is provided.
         limit (int): Limit the number of results returned (optional). Not used if `schedule_id` is provided.
+        cursor (str): Continuation cursor from a previous response's `metadata.next_cursor` (optional). Resumes that query where it stopped; cannot be used with other filters.
         since (str): Start time for overrides/final schedule details (ISO8601, optional). Only used if `schedule_id` is provided. Defaults to 2 weeks before 'until' if 'until' is given.
         until (str): End time for overrides/final schedule details (ISO8601, optional). Only used if `schedule_id` is provided. Defaults to 2 weeks after 'since' if 'since' is given.
         include (List[str]): List of fields to include in the response. If specified, only these fields will be returned for each schedule
     """
+    if cursor is not None:
+        disallowed_filters_present = (
+            schedule_id is not None
+            or query is not None
+            or since is not None
+            or until is not None
+        )
+        if disallowed_filters_present:
+            raise ValueError(
+                "When `cursor` is provided, other filters (like schedule_id, query) cannot be used. See `docs://tools` for more information."
+            )
+
+        return await schedules.list_schedules(
+            cursor=cursor, limit=limit, include=include
+        )
+
     if schedule_id is not None:
         if query is not None or limit is not None:
             raise ValueError(
@@ -453,6 +699,7 @@ async def get_services(
     team_ids: list[str] | None = None,
     query: str | None = None,
     limit: int | None = None,
+    cursor: str | None = None,
     include: list[str] | None = None,
 ) -> dict[str, Any]:
     """Get PagerDuty services by filters or get details for a specific service ID.
@@ -463,8 +710,20 @@ async def get_services(
         team_ids (List[str]): Filter results to only services assigned to teams with the given IDs (optional, cannot be used with current_user_context). Not used if `service_id` is provided.
         query (str): Filter services whose names contain the search query (optional). Not used if `service_id` is provided.
         limit (int): Limit the number of results (optional). Not used if `service_id` is provided.
+        cursor (str): Continuation cursor from a previous response's `metadata.next_cursor` (optional). Resumes that query where it stopped; cannot be used with other filters.
         include (List[str]): List of fields to include in the response. If specified, only these fields will be returned for each service
     """
+    if cursor is not None:
+        disallowed_filters_present = (
+            service_id is not None or team_ids is not None or query is not None
+        )
+        if disallowed_filters_present:
+            raise ValueError(
+                "When `cursor` is provided, other filters (like service_id, team_ids, query) cannot be used. See `docs://tools` for more information."
+            )
+
+        return await services.list_services(cursor=cursor, limit=limit, include=include)
+
     if service_id is not None:
         disallowed_filters_present = (
             team_ids is not None or query is not None or limit is not None
@@ -506,6 +765,7 @@ async def get_teams(
     team_id: str | None = None,
     query: str | None = None,
     limit: int | None = None,
+    cursor: str | None = None,
     include: list[str] | None = None,
 ) -> dict[str, Any]:
     """Get PagerDuty teams by filters or get details for a specific team ID.
@@ -514,8 +774,18 @@ async def get_teams(
         team_id (str): The team ID to retrieve (optional, cannot be used with any other filters).
         query (str): Filter teams whose names contain the search query (optional). Not used if `team_id` is provided.
         limit (int): Limit the number of results returned (optional). Not used if `team_id` is provided.
+        cursor (str): Continuation cursor from a previous response's `metadata.next_cursor` (optional). Resumes that query where it stopped; cannot be used with other filters.
         include (List[str]): List of fields to include in the response. If specified, only these fields will be returned for each team
     """
+    if cursor is not None:
+        disallowed_filters_present = team_id is not None or query is not None
+        if disallowed_filters_present:
+            raise ValueError(
+                "When `cursor` is provided, other filters (like team_id, query) cannot be used. See `docs://tools` for more information."
+            )
+
+        return await teams.list_teams(cursor=cursor, limit=limit, include=include)
+
     if team_id is not None:
         disallowed_filters_present = query is not None or limit is not None
         if disallowed_filters_present:
@@ -543,6 +813,7 @@ async def get_users(
     team_ids: list[str] | None = None,
     query: str | None = None,
     limit: int | None = None,
+    cursor: str | None = None,
     include: list[str] | None = None,
 ) -> dict[str, Any]:
     """Get PagerDuty users by filters or get details for a specific user ID.
@@ -553,8 +824,20 @@ async def get_users(
         team_ids (List[str]): Filter results to only users assigned to teams with the given IDs (optional, cannot be used with current_user_context). Not used if `user_id` is provided.
         query (str): Filter users whose names contain the search query (optional). Not used if `user_id` is provided.
         limit (int): Limit the number of results (optional). Not used if `user_id` is provided.
+        cursor (str): Continuation cursor from a previous response's `metadata.next_cursor` (optional). Resumes that query where it stopped; cannot be used with other filters.
         include (List[str]): List of fields to include in the response. If specified, only these fields will be returned for each user
     """
+    if cursor is not None:
+        disallowed_filters_present = (
+            user_id is not None or team_ids is not None or query is not None
+        )
+        if disallowed_filters_present:
+            raise ValueError(
+                "When `cursor` is provided, other filters (like user_id, team_ids, query) cannot be used. See `docs://tools` for more information."
+            )
+
+        return await users.list_users(cursor=cursor, limit=limit, include=include)
+
     if user_id is not None:
         disallowed_filters_present = (
             team_ids is not None or query is not None or limit is not None
@@ -585,7 +868,7 @@ async def get_users(
 
 @mcp.tool()
 @tool_error_boundary
-async def build_user_context() -> dict[str, Any]:
+async def build_user_context(refresh: bool = False) -> dict[str, Any]:
     """Validate and build the current user's context into a dictionary with the following format:
         {
             "user_id": str,
@@ -599,5 +882,8 @@ async def build_user_context() -> dict[str, Any]:
         - Oncalls
         - Services
         - Users
+
+    Args:
+        refresh (bool): Rebuild the context instead of reusing the cached one, e.g. after team membership changes (default: False)
     """
-    return await users.build_user_context()
+    return await users.build_user_context(refresh=refresh)
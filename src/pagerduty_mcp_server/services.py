@@ -4,7 +4,7 @@ import logging
 from typing import Any
 
 from . import utils
-from .async_utils import DEFAULT_MAX_RESULTS, paginate, safe_execute_async
+from .async_utils import DEFAULT_MAX_RESULTS, iter_pages, jget, list_all
 from .client import create_client
 from .models.service import Service
 
@@ -22,6 +22,7 @@ async def list_services(
     team_ids: list[str] | None = None,
     query: str | None = None,
     limit: int | None = None,
+    cursor: str | None = None,
     include: list[str] | None = None,
 ) -> dict[str, Any]:
     """List existing PagerDuty services. Exposed as MCP server tool.
@@ -30,6 +31,7 @@ async def list_services(
         team_ids (List[str]): Filter results to only services assigned to teams with the given IDs (optional)
         query (str): Filter services whose names contain the search query (optional)
         limit (int): Limit the number of results returned (optional)
+        cursor (str): Continuation cursor from a previous response's `metadata.next_cursor` (optional). Resumes that query, ignoring the other filters
         include (List[str]): List of fields to include in the response. If specified, only these fields will be returned for each service
 
     Returns:
@@ -53,15 +55,30 @@ async def list_services(
     if query:
         params["query"] = query
 
+    max_records = limit or DEFAULT_MAX_RESULTS
+    if cursor is not None:
+        params, cursor_limit = utils.decode_cursor(cursor, SERVICES_URL)
+        max_records = limit or cursor_limit
+
     try:
-        response = await paginate(
+        positions = utils.PagePositions()
+        pages = iter_pages(
             pd_client,
             SERVICES_URL,
             params=params,
-            max_records=limit or DEFAULT_MAX_RESULTS,
+            max_records=max_records,
             operation_name="list services",
+            positions=positions,
+        )
+        return await utils.parse_list_pages(
+            pages,
+            Service,
+            "services",
+            include=include,
+            next_cursor=utils.make_next_cursor(
+                SERVICES_URL, params, max_records, positions
+            ),
         )
-        return utils.parse_list_response(response, Service, "services", include=include)
     except Exception as e:
         utils.handle_api_error(e)
 
@@ -89,9 +106,10 @@ async def show_service(
     pd_client = create_client()
 
     try:
-        response = await safe_execute_async(
-            lambda: pd_client.jget(f"{SERVICES_URL}/{service_id}"),
-            f"fetch service {service_id}",
+        response = await jget(
+            pd_client,
+            f"{SERVICES_URL}/{service_id}",
+            operation_name=f"fetch service {service_id}",
         )
         try:
             service_data = response["service"]
@@ -144,8 +162,8 @@ async def fetch_service_ids(*, team_ids: list[str]) -> list[str]:
         "team_ids[]": team_ids
     }  # PagerDuty API expects array parameters with [] suffix
     try:
-        services_response = await safe_execute_async(
-            lambda: pd_client.list_all(SERVICES_URL, params=params), "fetch service IDs"
+        services_response = await list_all(
+            pd_client, SERVICES_URL, params=params, operation_name="fetch service IDs"
         )
         parsed_response = []
         for result in services_response:
@@ -4,7 +4,7 @@ import logging
 from typing import Any
 
 from . import utils
-from .async_utils import DEFAULT_MAX_RESULTS, paginate, safe_execute_async
+from .async_utils import DEFAULT_MAX_RESULTS, iter_pages, jget
 from .client import create_client
 from .models.team import Team
 
@@ -21,6 +21,7 @@ async def list_teams(
     *,
     query: str | None = None,
     limit: int | None = None,
+    cursor: str | None = None,
     include: list[str] | None = None,
 ) -> dict[str, Any]:
     """List teams in your PagerDuty account. Exposed as MCP server tool.
@@ -28,6 +29,7 @@ async def list_teams(
     Args:
         query (str): Filter teams whose names contain the search query (optional)
         limit (int): Limit the number of results returned (optional)
+        cursor (str): Continuation cursor from a previous response's `metadata.next_cursor` (optional). Resumes that query, ignoring the other filters
         include (List[str]): List of fields to include in the response. If specified, only these fields will be returned for each team
 
     Returns:
@@ -44,15 +46,30 @@ async def list_teams(
     if query:
         params["query"] = query
 
+    max_records = limit or DEFAULT_MAX_RESULTS
+    if cursor is not None:
+        params, cursor_limit = utils.decode_cursor(cursor, TEAMS_URL)
+        max_records = limit or cursor_limit
+
     try:
-        response = await paginate(
+        positions = utils.PagePositions()
+        pages = iter_pages(
             pd_client,
             TEAMS_URL,
             params=params,
-            max_records=limit or DEFAULT_MAX_RESULTS,
+            max_records=max_records,
             operation_name="list teams",
+            positions=positions,
+        )
+        return await utils.parse_list_pages(
+            pages,
+            Team,
+            "teams",
+            include=include,
+            next_cursor=utils.make_next_cursor(
+                TEAMS_URL, params, max_records, positions
+            ),
         )
-        return utils.parse_list_response(response, Team, "teams", include=include)
     except Exception as e:
         utils.handle_api_error(e)
 
@@ -80,8 +97,8 @@ async def show_team(
     pd_client = create_client()
 
     try:
-        response = await safe_execute_async(
-            lambda: pd_client.jget(f"{TEAMS_URL}/{team_id}"), f"fetch team {team_id}"
+        response = await jget(
+            pd_client, f"{TEAMS_URL}/{team_id}", operation_name=f"fetch team {team_id}"
         )
         try:
             team_data = response["team"]
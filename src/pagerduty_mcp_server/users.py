@@ -1,10 +1,15 @@
 """PagerDuty user operations."""
 
+import asyncio
+import copy
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable
 from typing import Any
 
-from . import escalation_policies, services, teams, utils
-from .async_utils import DEFAULT_MAX_RESULTS, paginate, safe_execute_async
+from . import cache, escalation_policies, metrics, services, teams, utils
+from .async_utils import DEFAULT_MAX_RESULTS, iter_pages, jget
 from .client import create_client
 from .models.user import User
 
@@ -12,11 +17,38 @@ USERS_URL = "/users"
 
 logger = logging.getLogger(__name__)
 
+# How long a token's user context is reused before it is rebuilt. 0 disables the cache.
+USER_CONTEXT_TTL_SECONDS = utils.get_env_float(
+    "PAGERDUTY_USER_CONTEXT_TTL_SECONDS", 300.0
+)
 
-async def build_user_context() -> dict[str, Any]:
+# Fraction of the TTL after which a cache hit also rebuilds the context in the
+# background, so callers keep getting cached contexts while it refreshes.
+USER_CONTEXT_REFRESH_FRACTION = 0.8
+
+# Upper bound on the number of tokens whose user context is kept. Header-authenticated
+# deployments see one entry per token, so the least recently used is dropped beyond this.
+USER_CONTEXT_CACHE_MAX_SIZE = utils.get_env_int(
+    "PAGERDUTY_USER_CONTEXT_CACHE_MAX_SIZE", 64
+)
+
+# Built contexts by token key (see `utils.token_key`), least recently used first,
+# with the monotonic times they were built and last handed out.
+_user_context_cache: OrderedDict[str, tuple[float, float, dict[str, Any]]] = (
+    OrderedDict()
+)
+_user_context_builds: dict[str, asyncio.Task] = {}
+_user_context_stats = {"hits": 0, "misses": 0, "background_refreshes": 0}
+
+
+async def build_user_context(*, refresh: bool = False) -> dict[str, Any]:
     """Validate and build the current user's context. Exposed as MCP server tool.
 
-    See the "Standard Response Format" section in `tools.md` for the complete standard response structure.
+    Contexts are cached per API token for `PAGERDUTY_USER_CONTEXT_TTL_SECONDS`, and
+    rebuilt in the background once most of the TTL has passed.
+
+    Args:
+        refresh (bool): Discard the token's cached context and rebuild it (default: False)
 
     Returns:
         See the "Standard Response Format" section in `tools.md` for the complete standard response structure.
@@ -25,48 +57,161 @@ async def build_user_context() -> dict[str, Any]:
     Raises:
         See the "Error Handling" section in `tools.md` for common error scenarios.
     """
-    try:
-        user = await _show_current_user()
-        if not user:
-            raise ValueError("Failed to get current user data")
-
-        context = {
-            "user_id": str(user.get("id", "")).strip(),
-            "name": user.get("name", ""),
-            "email": user.get("email", ""),
-            "team_ids": [],
-            "service_ids": [],
-            "escalation_policy_ids": [],
-        }
-
-        if not context["user_id"]:
-            raise ValueError("Invalid user data: missing or empty user ID")
-
-        team_ids = teams.fetch_team_ids(user=user)
-        context["team_ids"] = [
-            str(tid).strip() for tid in team_ids if tid and str(tid).strip()
-        ]
-
-        if context["team_ids"]:
-            service_ids = await services.fetch_service_ids(team_ids=context["team_ids"])
-            context["service_ids"] = [
-                str(sid).strip() for sid in service_ids if sid and str(sid).strip()
-            ]
-
-        escalation_policy_ids = await escalation_policies.fetch_escalation_policy_ids(
-            user_id=context["user_id"]
-        )
-        context["escalation_policy_ids"] = [
-            str(epid).strip()
-            for epid in escalation_policy_ids
-            if epid and str(epid).strip()
-        ]
-
-        return context
+    if USER_CONTEXT_TTL_SECONDS <= 0:
+        return await _build_user_context()
 
+    try:
+        key = create_client().token_key
     except Exception as e:
         utils.handle_api_error(e)
 
+    now = time.monotonic()
+    _evict_idle_user_contexts(now)
+    cached = None if refresh else _user_context_cache.get(key)
+    if cached is not None:
+        built_at, _last_used, context = cached
+        age = now - built_at
+        if age < USER_CONTEXT_TTL_SECONDS:
+            _user_context_stats["hits"] += 1
+            _user_context_cache[key] = (built_at, now, context)
+            _user_context_cache.move_to_end(key)
+            if age >= USER_CONTEXT_TTL_SECONDS * USER_CONTEXT_REFRESH_FRACTION:
+                _refresh_in_background(key)
+            return copy.deepcopy(context)
+
+    _user_context_stats["misses"] += 1
+    if refresh:
+        _user_context_cache.pop(key, None)
+    # Shielded so a cancelled caller does not abort a build other callers await.
+    context = await asyncio.shield(_user_context_build(key))
+    return copy.deepcopy(context)
+
+
+def invalidate_user_context() -> None:
+    """Drop every cached user context, so the next call rebuilds it."""
+    _user_context_cache.clear()
+
+
+def user_context_cache_stats() -> dict[str, Any]:
+    """Return hit/miss counters for the user context cache.
+
+    Returns:
+        Dict[str, Any]: `ttl_seconds`, `entries`, `hits`, `misses` and `background_refreshes`
+    """
+    return {
+        "ttl_seconds": USER_CONTEXT_TTL_SECONDS,
+        "entries": len(_user_context_cache),
+        **_user_context_stats,
+    }
+
+
+metrics.register_collector("user_context_cache", user_context_cache_stats)
+
+
+def _user_context_build(key: str) -> asyncio.Task:
+    """Return the in-flight context build for a token, starting one if needed."""
+    task = _user_context_builds.get(key)
+    if task is None:
+        task = asyncio.create_task(_build_and_cache_user_context(key))
+        _user_context_builds[key] = task
+
+        def _forget(done: asyncio.Task) -> None:
+            if _user_context_builds.get(key) is done:
+                del _user_context_builds[key]
+
+        task.add_done_callback(_forget)
+    return task
+
+
+async def _build_and_cache_user_context(key: str) -> dict[str, Any]:
+    context = await _build_user_context()
+    now = time.monotonic()
+    _user_context_cache[key] = (now, now, context)
+    _user_context_cache.move_to_end(key)
+    while len(_user_context_cache) > USER_CONTEXT_CACHE_MAX_SIZE:
+        _user_context_cache.popitem(last=False)
+    return context
+
+
+def _evict_idle_user_contexts(now: float) -> None:
+    """Drop contexts not handed out within the TTL.
+
+    A context is never served past its TTL, so one idle for that long is already
+    expired and would only be rebuilt on its next use.
+    """
+    while _user_context_cache:
+        _built_at, last_used, _context = next(iter(_user_context_cache.values()))
+        if now - last_used < USER_CONTEXT_TTL_SECONDS:
+            break
+        _user_context_cache.popitem(last=False)
+
+
+def _refresh_in_background(key: str) -> None:
+    """Rebuild a token's cached context without making the caller wait for it."""
+    if key in _user_context_builds:
+        return
+    _user_context_stats["background_refreshes"] += 1
+
+    def _log_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(
+                f"Background user context refresh failed: {task.exception()}"
+            )
+
+    _user_context_build(key).add_done_callback(_log_failure)
+
+
+async def _build_user_context() -> dict[str, Any]:
+    """Fetch the current user and the IDs of their teams, services and escalation policies."""
+    # The context has its own TTL (see build_user_context), so a rebuild must not be
+    # served the same cached responses it is replacing.
+    with cache.bypass():
+        try:
+            user = await _show_current_user()
+            if not user:
+                raise ValueError("Failed to get current user data")
+
+            context = {
+                "user_id": str(user.get("id", "")).strip(),
+                "name": user.get("name", ""),
+                "email": user.get("email", ""),
+                "team_ids": [],
+                "service_ids": [],
+                "escalation_policy_ids": [],
+            }
+
+            if not context["user_id"]:
+                raise ValueError("Invalid user data: missing or empty user ID")
+
+            context["team_ids"] = _clean_ids(teams.fetch_team_ids(user=user))
+
+            # Each remaining field depends only on the user, so fetch them concurrently.
+            fetches: dict[str, Awaitable[list[str]]] = {
+                "escalation_policy_ids": escalation_policies.fetch_escalation_policy_ids(
+                    user_id=context["user_id"]
+                ),
+            }
+            if context["team_ids"]:
+                fetches["service_ids"] = services.fetch_service_ids(
+                    team_ids=context["team_ids"]
+                )
+
+            tasks = [asyncio.ensure_future(fetch) for fetch in fetches.values()]
+            try:
+                results = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            for field, ids in zip(fetches, results, strict=True):
+                context[field] = _clean_ids(ids)
+
+            return context
+
+        except Exception as e:
+            utils.handle_api_error(e)
+
 
 """
 Users API Helpers
@@ -78,6 +223,7 @@ async def list_users(
     team_ids: list[str] | None = None,
     query: str | None = None,
     limit: int | None = None,
+    cursor: str | None = None,
     include: list[str] | None = None,
 ) -> dict[str, Any]:
     """List users in PagerDuty. Exposed as MCP server tool.
@@ -86,6 +232,7 @@ async def list_users(
         team_ids (List[str]): Filter results to only users assigned to teams with the given IDs (optional)
         query (str): Filter users whose names contain the search query (optional)
         limit (int): Limit the number of results returned (optional)
+        cursor (str): Continuation cursor from a previous response's `metadata.next_cursor` (optional). Resumes that query, ignoring the other filters
         include (List[str]): List of fields to include in the response. If specified, only these fields will be returned for each user
 
     Returns:
@@ -105,15 +252,30 @@ async def list_users(
     if query:
         params["query"] = query
 
+    max_records = limit or DEFAULT_MAX_RESULTS
+    if cursor is not None:
+        params, cursor_limit = utils.decode_cursor(cursor, USERS_URL)
+        max_records = limit or cursor_limit
+
     try:
-        response = await paginate(
+        positions = utils.PagePositions()
+        pages = iter_pages(
             pd_client,
             USERS_URL,
             params=params,
-            max_records=limit or DEFAULT_MAX_RESULTS,
+            max_records=max_records,
             operation_name="list users",
+            positions=positions,
+        )
+        return await utils.parse_list_pages(
+            pages,
+            User,
+            "users",
+            include=include,
+            next_cursor=utils.make_next_cursor(
+                USERS_URL, params, max_records, positions
+            ),
         )
-        return utils.parse_list_response(response, User, "users", include=include)
     except Exception as e:
         utils.handle_api_error(e)
 
@@ -141,8 +303,8 @@ async def show_user(
     pd_client = create_client()
 
     try:
-        response = await safe_execute_async(
-            lambda: pd_client.jget(f"{USERS_URL}/{user_id}"), f"fetch user {user_id}"
+        response = await jget(
+            pd_client, f"{USERS_URL}/{user_id}", operation_name=f"fetch user {user_id}"
         )
         try:
             user_data = response["user"]
@@ -178,8 +340,8 @@ async def _show_current_user() -> dict[str, Any]:
     """
     pd_client = create_client()
     try:
-        result = await safe_execute_async(
-            lambda: pd_client.jget(USERS_URL + "/me"), "fetch current user"
+        result = await jget(
+            pd_client, USERS_URL + "/me", operation_name="fetch current user"
         )
         response = result["user"]
         user = {}
@@ -191,3 +353,8 @@ async def _show_current_user() -> dict[str, Any]:
         return user
     except Exception as e:
         utils.handle_api_error(e)
+
+
+def _clean_ids(ids: list[Any]) -> list[str]:
+    """Return the non-empty IDs as stripped strings. Internal helper function."""
+    return [str(id_).strip() for id_ in ids if id_ and str(id_).strip()]
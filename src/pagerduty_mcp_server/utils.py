@@ -1,8 +1,16 @@
 """Pagerduty helper utilities"""
 
+import base64
+import hashlib
+import json
 import logging
+import os
 import sys
+import time
+from collections.abc import AsyncGenerator, Callable
+from contextlib import aclosing
 from datetime import datetime, timedelta
+from itertools import pairwise
 from typing import Any, NoReturn
 
 from . import prompts
@@ -70,38 +78,13 @@ def api_response_handler(
     if isinstance(results, dict):
         results = [results]
 
-    char_count = count_object_chars(results)
-    byte_size = count_object_size(results)
-
-    exceeded_limits = []
-    if char_count > RESPONSE_CHAR_LIMIT:
-        exceeded_limits.append(f"{RESPONSE_CHAR_LIMIT} characters")
-    if byte_size > RESPONSE_SIZE_LIMIT:
-        exceeded_limits.append(f"{RESPONSE_SIZE_LIMIT} bytes")
+    char_count, byte_size = measure_object(results)
 
+    exceeded_limits = _exceeded_limits(char_count, byte_size)
     if exceeded_limits:
-        limits_exceeded_str = " and ".join(exceeded_limits)
-        prompt_message = prompts.handle_large_results(
-            resource_name=resource_name, limits_exceeded=limits_exceeded_str
-        )
-        content = getattr(prompt_message, "content", None)
-        message = getattr(content, "text", str(prompt_message))
-        return {
-            "error": {
-                "code": "LIMIT_EXCEEDED",
-                "message": message,
-            }
-        }
-
-    metadata = {
-        "count": len(results),
-        "description": f"Found {len(results)} {'result' if len(results) == 1 else 'results'} for resource type {resource_name}",
-    }
-
-    if additional_metadata:
-        metadata.update(additional_metadata)
+        return _limit_exceeded_response(resource_name, exceeded_limits)
 
-    return {"metadata": metadata, f"{resource_name}": results}
+    return _list_response(results, resource_name, additional_metadata)
 
 
 def validate_iso8601_timestamp(timestamp: str, param_name: str) -> None:
@@ -126,7 +109,9 @@ def validate_iso8601_timestamp(timestamp: str, param_name: str) -> None:
         )
 
 
-def validate_timestamp_range(since: str, until: str) -> None:
+def validate_timestamp_range(
+    since: str, until: str, *, max_days: int | None = 180
+) -> None:
     """Validate that a timestamp range is a valid query range in the PagerDuty API.
 
     The PagerDuty API doesn't allow query ranges longer than 6 months, or querying where since == until, but the API doesn't actually return a helpful error message in either case so LLMs are unable to recover.
@@ -136,6 +121,8 @@ def validate_timestamp_range(since: str, until: str) -> None:
     Args:
         since (str): The start of the date range
         until (str): The end of the date range
+        max_days (Optional[int]): The longest accepted range in days (default: 180). None accepts any length,
+            for queries that split long ranges into windows themselves (see `split_time_range`)
 
     Raises:
         ValidationError: If the date range is not valid
@@ -150,12 +137,150 @@ def validate_timestamp_range(since: str, until: str) -> None:
             raise ValidationError(
                 "`since` and `until` cannot be the exact same timestamp."
             )
-        if (until_dt - since_dt) > timedelta(days=180):
+        if max_days is not None and (until_dt - since_dt) > timedelta(days=max_days):
             raise ValidationError(
                 "The maximum query range is 6 months. Try narrowing your query range."
             )
 
 
+def split_time_range(
+    since: str, until: str | None, window: timedelta
+) -> list[tuple[str, str]] | None:
+    """Split a query range into consecutive windows of at most `window`.
+
+    Args:
+        since (str): The start of the range, in ISO8601 format
+        until (Optional[str]): The end of the range, in ISO8601 format. None means now
+        window (timedelta): The longest window to return
+
+    Returns:
+        Optional[List[Tuple[str, str]]]: The (since, until) of each window in order,
+            sharing their boundaries, or None if the range fits in a single window.
+            The outer boundaries are the original strings.
+    """
+    since_dt = datetime.fromisoformat(since)
+    until_dt = (
+        datetime.fromisoformat(until)
+        if until is not None
+        else datetime.now(since_dt.tzinfo)
+    )
+    if until_dt - since_dt <= window:
+        return None
+
+    bounds = [since]
+    start = since_dt + window
+    while start < until_dt:
+        bounds.append(start.isoformat())
+        start += window
+    bounds.append(until if until is not None else until_dt.isoformat())
+    return list(pairwise(bounds))
+
+
+def split_id_filters(
+    params: dict[str, Any], names: list[str], chunk_size: int
+) -> list[dict[str, Any]]:
+    """Split ID list filters that are too long for one request into chunks.
+
+    Args:
+        params (Dict[str, Any]): The query parameters
+        names (List[str]): The parameters holding ID lists (e.g. "service_ids")
+        chunk_size (int): The most IDs to send in one filter
+
+    Returns:
+        List[Dict[str, Any]]: Parameter overrides, one per request. When several filters
+            are split, every combination of their chunks gets a request, so each
+            combination of IDs is queried exactly once. `[{}]` if nothing is split.
+    """
+    slices: list[dict[str, Any]] = [{}]
+    for name in names:
+        ids = params.get(name)
+        if not isinstance(ids, list):
+            continue
+        ids = list(dict.fromkeys(ids))
+        if len(ids) <= chunk_size:
+            continue
+        chunks = [ids[i : i + chunk_size] for i in range(0, len(ids), chunk_size)]
+        slices = [
+            {**overrides, name: chunk} for overrides in slices for chunk in chunks
+        ]
+    return slices
+
+
+def get_env_int(name: str, default: int, *, minimum: int = 1) -> int:
+    """Read an integer setting from the environment, falling back to a default.
+
+    Args:
+        name (str): The environment variable to read
+        default (int): The value to use when the variable is unset or invalid
+        minimum (int): The smallest accepted value (default: 1)
+
+    Returns:
+        int: The configured value, or `default` if the variable is unset, not an integer, or below `minimum`
+    """
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning("Invalid %s=%r, using %d", name, raw, default)
+        return default
+    if value < minimum:
+        logger.warning("%s=%d is below %d, using %d", name, value, minimum, default)
+        return default
+    return value
+
+
+def token_key(token: str) -> str:
+    """Return a stable, non-reversible key for an auth token.
+
+    Per-token state (pooled clients, rate limit buckets, cached reads and user
+    contexts) is stored under this key, so raw tokens are never retained.
+
+    Args:
+        token (str): The authentication token
+
+    Returns:
+        str: The hex SHA-256 digest of the token
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def get_env_float(
+    name: str,
+    default: float,
+    *,
+    minimum: float = 0.0,
+    maximum: float | None = None,
+) -> float:
+    """Read a float setting from the environment, falling back to a default.
+
+    Args:
+        name (str): The environment variable to read
+        default (float): The value to use when the variable is unset or invalid
+        minimum (float): The smallest accepted value (default: 0.0)
+        maximum (float): The largest accepted value (default: unbounded)
+
+    Returns:
+        float: The configured value, or `default` if the variable is unset, not a number, or outside `minimum`..`maximum`
+    """
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        logger.warning("Invalid %s=%r, using %g", name, raw, default)
+        return default
+    if value < minimum:
+        logger.warning("%s=%g is below %g, using %g", name, value, minimum, default)
+        return default
+    if maximum is not None and value > maximum:
+        logger.warning("%s=%g is above %g, using %g", name, value, maximum, default)
+        return default
+    return value
+
+
 def handle_api_error(e: Exception) -> NoReturn:
     """Log the error and re-raise the original exception.
 
@@ -176,83 +301,126 @@ def handle_api_error(e: Exception) -> NoReturn:
     raise e
 
 
-def count_object_size(obj: Any) -> int:
-    """Recursively count the size of a Python object in bytes.
+def measure_object(obj: Any, *, visited: set[int] | None = None) -> tuple[int, int]:
+    """Measure the character length and byte size of a Python object in one pass.
 
-    This function traverses nested structures like dictionaries and lists
-    to estimate the total memory footprint of complex objects.
+    This function traverses nested structures like dictionaries and lists once,
+    giving the totals of `count_object_chars` and `count_object_size` together.
 
     Args:
         obj (Any): The Python object to measure
+        visited (Set[int]): IDs of objects already counted (optional). Pass the same set
+            across calls to measure several objects as if they were one.
 
     Returns:
-        int: The approximate size of the object in bytes
+        Tuple[int, int]: The total character count and the approximate size in bytes
     """
     # Track visited objects to handle circular references
-    visited = set()
+    if visited is None:
+        visited = set()
+    getsizeof = sys.getsizeof
 
-    def _count_size(obj):
+    def _measure(obj):
         if id(obj) in visited:
-            return 0
+            return 0, 0
 
         visited.add(id(obj))
 
-        size = sys.getsizeof(obj)
+        if isinstance(obj, str):
+            return len(obj), getsizeof(obj)
 
+        chars = 0
+        size = getsizeof(obj)
         if isinstance(obj, dict):
             for k, v in obj.items():
-                size += _count_size(k)
-                size += _count_size(v)
+                key_chars, key_size = _measure(k)
+                value_chars, value_size = _measure(v)
+                chars += key_chars + value_chars
+                size += key_size + value_size
         elif isinstance(obj, (list, tuple, set)):
             for item in obj:
-                size += _count_size(item)
-        elif isinstance(obj, str):
-            # String size is already accounted for in sys.getsizeof
-            pass
+                item_chars, item_size = _measure(item)
+                chars += item_chars
+                size += item_size
+        else:
+            chars = len(str(obj))
 
-        return size
+        return chars, size
 
-    return _count_size(obj)
+    return _measure(obj)
 
 
-def count_object_chars(obj: Any) -> int:
-    """Recursively count the character length of a Python object.
+def count_object_size(obj: Any, *, visited: set[int] | None = None) -> int:
+    """Recursively count the size of a Python object in bytes.
+
+    Args:
+        obj (Any): The Python object to measure
+        visited (Set[int]): IDs of objects already counted (optional). Pass the same set
+            across calls to measure several objects as if they were one.
 
-    This function traverses nested structures like dictionaries and lists
-    to calculate the total character count when the object is represented as text.
+    Returns:
+        int: The approximate size of the object in bytes
+    """
+    return measure_object(obj, visited=visited)[1]
+
+
+def count_object_chars(obj: Any, *, visited: set[int] | None = None) -> int:
+    """Recursively count the character length of a Python object.
 
     Args:
         obj (Any): The Python object to measure
+        visited (Set[int]): IDs of objects already counted (optional). Pass the same set
+            across calls to measure several objects as if they were one.
 
     Returns:
         int: The total character count of the object
     """
-    # Track visited objects to handle circular references
-    visited = set()
+    return measure_object(obj, visited=visited)[0]
 
-    def _count_chars(obj):
-        if id(obj) in visited:
-            return 0
 
-        visited.add(id(obj))
+def _exceeded_limits(char_count: int, byte_size: int) -> list[str]:
+    """Return a description of each response size limit a result exceeds."""
+    exceeded_limits = []
+    if char_count > RESPONSE_CHAR_LIMIT:
+        exceeded_limits.append(f"{RESPONSE_CHAR_LIMIT} characters")
+    if byte_size > RESPONSE_SIZE_LIMIT:
+        exceeded_limits.append(f"{RESPONSE_SIZE_LIMIT} bytes")
+    return exceeded_limits
 
-        if isinstance(obj, dict):
-            count = 0
-            for k, v in obj.items():
-                count += _count_chars(k)
-                count += _count_chars(v)
-            return count
-        elif isinstance(obj, (list, tuple, set)):
-            count = 0
-            for item in obj:
-                count += _count_chars(item)
-            return count
-        elif isinstance(obj, str):
-            return len(obj)
-        else:
-            return len(str(obj))
 
-    return _count_chars(obj)
+def _limit_exceeded_response(
+    resource_name: str, exceeded_limits: list[str]
+) -> dict[str, Any]:
+    """Build the LIMIT_EXCEEDED error response for an oversized result."""
+    limits_exceeded_str = " and ".join(exceeded_limits)
+    prompt_message = prompts.handle_large_results(
+        resource_name=resource_name, limits_exceeded=limits_exceeded_str
+    )
+    content = getattr(prompt_message, "content", None)
+    message = getattr(content, "text", str(prompt_message))
+    return {
+        "error": {
+            "code": "LIMIT_EXCEEDED",
+            "message": message,
+        }
+    }
+
+
+def _list_response(
+    results: list[dict[str, Any]],
+    resource_name: str,
+    additional_metadata: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Wrap results that fit within the size limits in the standard response format."""
+    metadata = {
+        "count": len(results),
+        "description": f"Found {len(results)} {'result' if len(results) == 1 else 'results'} for resource type {resource_name}",
+    }
+
+    if additional_metadata:
+        metadata.update(additional_metadata)
+
+    return {"metadata": metadata, f"{resource_name}": results}
 
 
 def parse_list_response(
@@ -268,20 +436,300 @@ def parse_list_response(
         response (List[Dict[str, Any]]): Raw list of items from the PagerDuty API
         model_class: Pydantic model class with model_validate and to_clean_dict methods
         resource_name (str): The name of the resource (e.g., 'services', 'incidents')
-        include (List[str]): Optional list of fields to include in each item
+        include (List[str]): Optional list of fields to include in each item; only these are validated
         additional_metadata (Dict[str, Any]): Optional extra metadata to merge into the response
 
     Returns:
         Dict[str, Any]: Standardized API response via api_response_handler
     """
+    # Only the included fields are validated (see PagerDutyBaseModel.projection).
+    projection = model_class.projection(include)
     parsed = []
     for item in response:
         if not item:
             continue
-        model = model_class.model_validate(item)
+        model = projection.model_validate(item)
         parsed.append(model.to_clean_dict(include_fields=include))
     return api_response_handler(
         results=parsed,
         resource_name=resource_name,
         additional_metadata=additional_metadata,
     )
+
+
+async def parse_list_pages(
+    pages: AsyncGenerator[list[dict[str, Any]]],
+    model_class: type[PagerDutyBaseModel],
+    resource_name: str,
+    include: list[str] | None = None,
+    additional_metadata: dict[str, Any] | None = None,
+    on_page: Callable[[list[dict[str, Any]]], None] | None = None,
+    next_cursor: Callable[[int], str] | None = None,
+) -> dict[str, Any]:
+    """Parse a paginated list response page by page as the pages arrive.
+
+    Each item is validated, cleaned and counted against the response size limits
+    before the next page is requested. When the next item would exceed a limit, the
+    page iterator is closed so no further pages are downloaded. If `next_cursor` is
+    given, the items that fit are returned with a continuation cursor in
+    `metadata.next_cursor`; otherwise, or if not even one item fits, the same
+    LIMIT_EXCEEDED error as `api_response_handler` is returned.
+
+    Successful responses carry `metadata.as_of`, the UTC time the oldest data in
+    them was fetched from PagerDuty; it lies in the past when pages were served
+    from the response cache.
+
+    Args:
+        pages: Async generator of raw item pages, e.g. from `async_utils.iter_pages`
+        model_class: Pydantic model class with model_validate and to_clean_dict methods
+        resource_name (str): The name of the resource (e.g., 'services', 'incidents')
+        include (List[str]): Optional list of fields to include in each item; only these are validated
+        additional_metadata (Dict[str, Any]): Optional extra metadata to merge into the response
+        on_page (Callable): Optional callback invoked with the raw items of each page
+            that made it into the response. It runs before `additional_metadata` is
+            merged, so it may fill it in.
+        next_cursor (Callable): Optional callback that builds a continuation cursor
+            from the number of raw items consumed (see `encode_cursor`)
+
+    Returns:
+        Dict[str, Any]: Standardized API response, as from api_response_handler
+    """
+    if not resource_name or not resource_name.strip():
+        raise ValidationError("resource_name cannot be empty")
+
+    from . import cache
+
+    with cache.track_fetch_times() as fetch_times:
+        response = await _parse_pages(
+            pages,
+            model_class,
+            resource_name,
+            include,
+            additional_metadata,
+            on_page,
+            next_cursor,
+        )
+    if "metadata" in response:
+        response["metadata"]["as_of"] = _format_as_of(fetch_times)
+    return response
+
+
+async def _parse_pages(
+    pages: AsyncGenerator[list[dict[str, Any]]],
+    model_class: type[PagerDutyBaseModel],
+    resource_name: str,
+    include: list[str] | None,
+    additional_metadata: dict[str, Any] | None,
+    on_page: Callable[[list[dict[str, Any]]], None] | None,
+    next_cursor: Callable[[int], str] | None,
+) -> dict[str, Any]:
+    """Validate, clean and size-check pages for `parse_list_pages`."""
+    projection = model_class.projection(include)
+    parsed: list[dict[str, Any]] = []
+    consumed = 0
+    # Shared across items so the totals match measuring the whole list at once.
+    visited: set[int] = set()
+    char_count = 0
+    item_bytes = 0
+    async with aclosing(pages):
+        async for page in pages:
+            for index, item in enumerate(page):
+                if item:
+                    model = projection.model_validate(item)
+                    clean = model.to_clean_dict(include_fields=include)
+                    clean_chars, clean_bytes = measure_object(clean, visited=visited)
+                    char_count += clean_chars
+                    item_bytes += clean_bytes
+                    parsed.append(clean)
+                    exceeded_limits = _exceeded_limits(
+                        char_count, item_bytes + sys.getsizeof(parsed)
+                    )
+                    if exceeded_limits:
+                        parsed.pop()
+                        if not parsed or next_cursor is None:
+                            return _limit_exceeded_response(
+                                resource_name, exceeded_limits
+                            )
+                        if on_page is not None:
+                            on_page(page[:index])
+                        response = _list_response(
+                            parsed, resource_name, additional_metadata
+                        )
+                        response["metadata"]["next_cursor"] = next_cursor(consumed)
+                        return response
+                consumed += 1
+            if on_page is not None:
+                on_page(page)
+
+    return _list_response(parsed, resource_name, additional_metadata)
+
+
+def _format_as_of(fetch_times: list[float]) -> str:
+    """Format the oldest fetch time, or now if nothing was fetched, as ISO 8601 UTC."""
+    oldest = min(fetch_times, default=time.time())
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(oldest))
+
+
+class PagePositions:
+    """Upstream positions of the records a page stream yields, for resume cursors.
+
+    A cursor resumes a list query by requesting it again at an offset, so the offset
+    must count every record PagerDuty returned, including the ones the stream dropped
+    (duplicates and empty records) instead of yielding. `async_utils.iter_pages`
+    reports each record here as it goes. For a query split into slices,
+    `async_utils.merge_pages` reports which slice each merged record came from, and
+    the offset is one position per slice, so every slice resumes where it stopped.
+    """
+
+    def __init__(self) -> None:
+        self._slices: list[PagePositions] = []
+        # Upstream positions for a single stream, or records taken from each slice's
+        # stream for merged slices.
+        self._counts = [0]
+        self._start: tuple[int, ...] = (0,)
+        self._ends: list[tuple[int, ...]] = []
+
+    def begin(self, offset: int) -> None:
+        """Start tracking a stream whose first record is at upstream `offset`."""
+        self._slices = []
+        self._counts = [offset]
+        self._start = (offset,)
+        self._ends.clear()
+
+    def begin_merge(self, slices: list["PagePositions"]) -> None:
+        """Start tracking a merge of slice streams, each tracked by one of `slices`."""
+        self._slices = slices
+        self._counts = [0] * len(slices)
+        self._start = tuple(self._counts)
+        self._ends.clear()
+
+    def take(self, stream: int = 0) -> None:
+        """Record that the next record of a stream (slice index) was yielded."""
+        self._counts[stream] += 1
+        self._ends.append(tuple(self._counts))
+
+    def drop(self, stream: int = 0) -> None:
+        """Record that the next record of a stream was skipped instead of yielded."""
+        self._counts[stream] += 1
+        if self._ends:
+            self._ends[-1] = tuple(self._counts)
+        else:
+            self._start = tuple(self._counts)
+
+    def offset(self, consumed: int) -> int | list[int]:
+        """Return the upstream offset just past the first `consumed` yielded records.
+
+        Records dropped right after them are passed over too, so a query resumed
+        there does not return them again.
+
+        Args:
+            consumed (int): The number of yielded records the consumer used
+
+        Returns:
+            Union[int, List[int]]: The offset to resume the query from, or for merged
+                slices the offset to resume each slice from
+        """
+        counts = self._counts_after(consumed)
+        if not self._slices:
+            return counts[0]
+        # Each slice is a single stream, whose only count is its upstream position.
+        return [
+            positions._counts_after(count)[0]
+            for positions, count in zip(self._slices, counts, strict=True)
+        ]
+
+    def _counts_after(self, consumed: int) -> tuple[int, ...]:
+        return self._ends[consumed - 1] if consumed else self._start
+
+
+def encode_cursor(entity: str, params: dict[str, Any], limit: int) -> str:
+    """Encode the state needed to resume a list query into an opaque cursor.
+
+    Args:
+        entity (str): The endpoint path the cursor belongs to (e.g. "/incidents")
+        params (Dict[str, Any]): The query parameters, with `offset` set to the first
+            record not yet returned (or, for a query split into slices, a list with
+            the first record not yet returned from each slice)
+        limit (int): How many more records the original query asked for
+
+    Returns:
+        str: A URL-safe cursor string
+    """
+    state = {"entity": entity, "params": params, "limit": limit}
+    return base64.urlsafe_b64encode(
+        json.dumps(state, separators=(",", ":")).encode()
+    ).decode()
+
+
+def decode_cursor(cursor: str, entity: str) -> tuple[dict[str, Any], int]:
+    """Decode a cursor built by `encode_cursor` for the given endpoint.
+
+    Args:
+        cursor (str): The cursor from a previous response's `metadata.next_cursor`
+        entity (str): The endpoint path the cursor must belong to
+
+    Returns:
+        Tuple[Dict[str, Any], int]: The query parameters (including `offset`, an int
+            or a list of per-slice ints) and the number of records still wanted
+
+    Raises:
+        ValidationError: If the cursor is malformed or belongs to another endpoint
+    """
+    try:
+        state = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        valid = (
+            isinstance(state, dict)
+            and isinstance(state.get("params"), dict)
+            and _valid_offset(state["params"].get("offset"))
+            and isinstance(state.get("limit"), int)
+        )
+    except (ValueError, UnicodeError):
+        valid = False
+    if not valid:
+        raise ValidationError(
+            "Invalid `cursor`. Pass the `next_cursor` value from a previous response unchanged."
+        )
+    if state.get("entity") != entity:
+        raise ValidationError(
+            f"This `cursor` does not belong to a {entity} query. Pass it to the same tool that returned it."
+        )
+    return state["params"], state["limit"]
+
+
+def _valid_offset(offset: Any) -> bool:
+    if isinstance(offset, list):
+        return all(type(value) is int and value >= 0 for value in offset)
+    return type(offset) is int and offset >= 0
+
+
+def make_next_cursor(
+    entity: str,
+    params: dict[str, Any],
+    max_records: int,
+    positions: PagePositions | None = None,
+) -> Callable[[int], str]:
+    """Build the `next_cursor` callback of `parse_list_pages` for a list query.
+
+    Args:
+        entity (str): The endpoint path being listed
+        params (Dict[str, Any]): The query parameters, optionally with a starting `offset`
+        max_records (int): The query's cap on the number of records
+        positions (PagePositions): Optional positions of the records the query's page
+            stream yielded. Without them, every record is assumed to have been yielded.
+
+    Returns:
+        Callable[[int], str]: Maps the number of records consumed to a cursor that
+            resumes the query right after them
+    """
+    query = dict(params)
+    start = query.pop("offset", 0)
+
+    def _next_cursor(consumed: int) -> str:
+        offset = (
+            positions.offset(consumed) if positions is not None else start + consumed
+        )
+        return encode_cursor(
+            entity, {**query, "offset": offset}, max_records - consumed
+        )
+
+    return _next_cursor
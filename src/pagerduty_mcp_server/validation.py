@@ -48,21 +48,8 @@ def validate_include_fields(
     if include is None:
         return None
 
-    all_fields = set(model_class.model_fields.keys())
-
-    try:
-        schema = model_class.model_json_schema()
-        schema_fields = set(schema.get("properties", {}).keys())
-        valid_fields = all_fields | schema_fields
-    except Exception as e:
-        raise RuntimeError(
-            f"Cannot determine valid fields for {model_class.__name__}: {e}"
-        ) from e
-
-    if extra_fields:
-        valid_fields = valid_fields | set(extra_fields)
-
-    invalid_fields = set(include) - set(valid_fields)
+    valid_fields = _valid_fields(model_class, tuple(extra_fields or ()))
+    invalid_fields = set(include) - valid_fields
 
     if invalid_fields:
         invalid_list = sorted(invalid_fields)
@@ -70,7 +57,7 @@ def validate_include_fields(
 
         for invalid_field in invalid_list:
             matches = difflib.get_close_matches(
-                invalid_field, valid_fields, n=2, cutoff=0.6
+                invalid_field, sorted(valid_fields), n=2, cutoff=0.6
             )
             if matches:
                 suggestions.append(f"'{invalid_field}' -> {matches}")
@@ -86,3 +73,28 @@ def validate_include_fields(
         raise ValueError("\n".join(error_parts))
 
     return include
+
+
+@functools.cache
+def _valid_fields(
+    model_class: type[PagerDutyBaseModel], extra_fields: tuple[str, ...]
+) -> frozenset[str]:
+    """Return the fields `include` may name for a model, computed once per model.
+
+    Generating the JSON schema is slow and its result never changes, so the table
+    is cached rather than rebuilt on every tool call.
+    """
+    try:
+        schema = model_class.model_json_schema()
+    except Exception as e:
+        raise RuntimeError(
+            f"Cannot determine valid fields for {model_class.__name__}: {e}"
+        ) from e
+
+    return frozenset(
+        [
+            *model_class.model_fields,
+            *schema.get("properties", {}),
+            *extra_fields,
+        ]
+    )
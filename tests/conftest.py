@@ -6,7 +6,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from pagerduty_mcp_server import users
+from pagerduty_mcp_server import auth, cache, rate_limit, resilience, users
 from pagerduty_mcp_server.client import PagerDutyClient
 
 
@@ -19,12 +19,23 @@ def pytest_configure(config):
         "markers",
         "integration: Integration tests that require a real PagerDuty API token",
     )
+    config.addinivalue_line("markers", "auth: Tests for the auth sub-module")
     config.addinivalue_line("markers", "client: Tests for the client sub-module")
+    config.addinivalue_line(
+        "markers", "async_client: Tests for the async_client sub-module"
+    )
     config.addinivalue_line(
         "markers", "escalation_policies: Tests for the escalation_policies sub-module"
     )
     config.addinivalue_line("markers", "incidents: Tests for the incidents sub-module")
+    config.addinivalue_line("markers", "metrics: Tests for the metrics sub-module")
     config.addinivalue_line("markers", "oncalls: Tests for the oncalls sub-module")
+    config.addinivalue_line(
+        "markers", "rate_limit: Tests for the rate_limit sub-module"
+    )
+    config.addinivalue_line(
+        "markers", "resilience: Tests for the resilience sub-module"
+    )
     config.addinivalue_line("markers", "schedules: Tests for the schedules sub-module")
     config.addinivalue_line("markers", "server: Tests for the server sub-module")
     config.addinivalue_line("markers", "services: Tests for the services sub-module")
@@ -42,6 +53,24 @@ skip_if_no_pagerduty_key = pytest.mark.skipif(
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_client_pool():
+    """Drop pooled clients, cached OAuth tokens, user contexts and responses, rate limit buckets and circuit breakers between tests."""
+    PagerDutyClient._pool.clear()
+    auth.invalidate_cached_token()
+    users.invalidate_user_context()
+    cache.clear()
+    rate_limit.limiter.clear()
+    resilience.reset_breakers()
+    yield
+    PagerDutyClient._pool.clear()
+    auth.invalidate_cached_token()
+    users.invalidate_user_context()
+    cache.clear()
+    rate_limit.limiter.clear()
+    resilience.reset_breakers()
+
+
 @pytest.fixture(scope="session")
 def user_context():
     """Create a user context that will be shared across all integration tests.
@@ -0,0 +1,228 @@
+"""Unit tests for the asyncio PagerDuty transport."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pagerduty
+import pytest
+
+from pagerduty_mcp_server import async_utils, rate_limit
+from pagerduty_mcp_server.async_client import AsyncRestClient, async_transport_enabled
+from pagerduty_mcp_server.client import ClientPool, PagerDutyClient
+
+
+def _client(handler) -> AsyncRestClient:
+    return AsyncRestClient("test-token", transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.async_client
+async def test_client_pool_closes_async_clients_evicted_past_max_size():
+    """Filling the pool past max_size closes the evicted client's connections."""
+    pool = ClientPool(max_size=2, idle_seconds=60)
+    clients = [
+        pool.get(f"token-{n}", lambda token: _client(lambda request: None))
+        for n in range(3)
+    ]
+    await asyncio.sleep(0)
+
+    assert len(pool) == 2
+    assert [c._client.is_closed for c in clients] == [True, False, False]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.async_client
+async def test_jget_sends_auth_and_accept_headers():
+    """jget authenticates with the token and requests REST API v2."""
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["request"] = request
+        return httpx.Response(200, json={"team": {"id": "T1"}})
+
+    body = await _client(handler).jget("/teams/T1", params={"include[]": "members"})
+
+    assert body == {"team": {"id": "T1"}}
+    request = seen["request"]
+    assert request.url.path == "/teams/T1"
+    assert request.url.params["include[]"] == "members"
+    assert request.headers["Authorization"] == "Token token=test-token"
+    assert request.headers["Accept"] == "application/vnd.pagerduty+json;version=2"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.async_client
+async def test_list_params_are_sent_with_brackets():
+    """List filters are sent as `name[]`, matching the SDK's parameter normalization."""
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["query"] = request.url.query.decode()
+        return httpx.Response(200, json={"incidents": [], "more": False})
+
+    await _client(handler).list_all(
+        "/incidents",
+        params={
+            "statuses": ["triggered", "acknowledged"],
+            "service_ids[]": ["P1"],
+            "urgency": "high",
+        },
+    )
+
+    assert seen["query"] == (
+        "statuses%5B%5D=triggered&statuses%5B%5D=acknowledged"
+        "&service_ids%5B%5D=P1&urgency=high&limit=100&offset=0"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.async_client
+async def test_bearer_auth_type():
+    """OAuth tokens are sent as bearer credentials."""
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["auth"] = request.headers["Authorization"]
+        return httpx.Response(200, json={})
+
+    pd_client = AsyncRestClient(
+        "pdus+_abc", auth_type="bearer", transport=httpx.MockTransport(handler)
+    )
+    await pd_client.jget("/users/me")
+
+    assert seen["auth"] == "Bearer pdus+_abc"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.async_client
+async def test_error_status_raises_http_error():
+    """Unsuccessful responses raise pagerduty.HttpError carrying the response."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, json={"error": {"message": "Not Found"}})
+
+    with pytest.raises(pagerduty.HttpError) as exc_info:
+        await _client(handler).jget("/teams/MISSING")
+
+    assert exc_info.value.response.status_code == 404
+    assert "Not Found" in exc_info.value.response.text
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.async_client
+async def test_unauthorized_status_calls_hook():
+    """A 401 response reports rejected credentials before raising."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(401, json={"error": {"message": "Unauthorized"}})
+
+    pd_client = _client(handler)
+    pd_client.on_unauthorized = MagicMock()
+
+    with pytest.raises(pagerduty.HttpError):
+        await pd_client.jget("/users/me")
+
+    pd_client.on_unauthorized.assert_called_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.async_client
+async def test_rate_limited_request_is_requeued():
+    """A 429 is retried after Retry-After through the token's scheduler."""
+    responses = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            httpx.Response(200, json={"users": []}),
+        ]
+    )
+
+    with patch(
+        "pagerduty_mcp_server.rate_limit.asyncio.sleep", new_callable=AsyncMock
+    ) as mock_sleep:
+        body = await _client(lambda request: next(responses)).jget("/users")
+
+    assert body == {"users": []}
+    mock_sleep.assert_awaited_once()
+    assert mock_sleep.await_args.args[0] == pytest.approx(3.0, abs=0.1)
+    bucket_stats = rate_limit.limiter.stats()
+    assert next(iter(bucket_stats.values()))["rate_limited_responses"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.async_client
+async def test_iter_all_follows_offsets():
+    """iter_all walks classic pagination until `more` is false."""
+    teams = [{"id": f"T{i}"} for i in range(5)]
+    offsets = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        limit = int(request.url.params["limit"])
+        offsets.append(offset)
+        page = teams[offset : offset + limit]
+        return httpx.Response(
+            200, json={"teams": page, "more": offset + limit < len(teams)}
+        )
+
+    results = [
+        item
+        async for item in _client(handler).iter_all(
+            "/teams", params={"query": "eng"}, page_size=2
+        )
+    ]
+
+    assert results == teams
+    assert offsets == [0, 2, 4]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.async_client
+async def test_async_utils_helpers_await_async_client():
+    """async_utils helpers await the async transport without a worker thread."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "PUT":
+            assert request.headers["From"] == "user@example.com"
+            return httpx.Response(200, json={"incident": {"id": "P1"}})
+        return httpx.Response(200, json={"teams": [{"id": "T1"}], "more": False})
+
+    pd_client = _client(handler)
+    with patch.object(async_utils, "safe_execute_async") as mock_safe_execute:
+        teams = await async_utils.paginate(
+            pd_client, "/teams", params={}, max_records=10, operation_name="test"
+        )
+        updated = await async_utils.jput(
+            pd_client,
+            "/incidents/P1",
+            json={"incident": {"type": "incident_reference"}},
+            headers={"From": "user@example.com"},
+            operation_name="test",
+        )
+
+    mock_safe_execute.assert_not_called()
+    assert teams == [{"id": "T1"}]
+    assert updated == {"incident": {"id": "P1"}}
+
+
+@pytest.mark.unit
+@pytest.mark.async_client
+def test_client_factory_uses_async_transport_when_enabled(monkeypatch):
+    """PAGERDUTY_ASYNC_TRANSPORT switches new clients to AsyncRestClient."""
+    monkeypatch.setenv("PAGERDUTY_ASYNC_TRANSPORT", "true")
+    assert async_transport_enabled() is True
+    assert isinstance(
+        PagerDutyClient._create_client_with_token("test-token"), AsyncRestClient
+    )
+
+    monkeypatch.delenv("PAGERDUTY_ASYNC_TRANSPORT")
+    assert async_transport_enabled() is False
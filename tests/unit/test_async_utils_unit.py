@@ -1,11 +1,24 @@
 """Unit tests for async_utils module."""
 
+import asyncio
 import threading
+from contextlib import aclosing
 from unittest.mock import MagicMock
 
 import pytest
 
-from pagerduty_mcp_server.async_utils import paginate, safe_execute_async
+from pagerduty_mcp_server import utils
+from pagerduty_mcp_server.async_utils import (
+    PAGINATE_CONCURRENCY,
+    InstrumentedExecutor,
+    get_executor,
+    iter_pages,
+    jget,
+    jput,
+    merge_pages,
+    paginate,
+    safe_execute_async,
+)
 
 
 @pytest.mark.unit
@@ -41,6 +54,59 @@ async def test_safe_execute_async_runs_in_thread():
     assert result_thread_id != main_thread_id
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_safe_execute_async_uses_dedicated_executor():
+    """safe_execute_async runs on the PagerDuty executor and records its latency."""
+    before = get_executor().stats()["completed"]
+
+    thread_name = await safe_execute_async(
+        lambda: threading.current_thread().name, "executor test"
+    )
+
+    stats = get_executor().stats()
+    assert thread_name.startswith("pagerduty-io")
+    assert stats["completed"] == before + 1
+    assert stats["wait_seconds"]["count"] >= 1
+    assert stats["run_seconds"]["buckets"]["+Inf"] == stats["run_seconds"]["count"]
+
+
+@pytest.mark.unit
+def test_instrumented_executor_tracks_queue_depth():
+    """Tasks waiting for a busy worker are reported as queued."""
+    executor = InstrumentedExecutor(max_workers=1)
+    release = threading.Event()
+    running = threading.Event()
+
+    def blocker():
+        running.set()
+        release.wait(timeout=5)
+
+    try:
+        first = executor.submit(blocker)
+        running.wait(timeout=5)
+        second = executor.submit(lambda: "done")
+        third = executor.submit(lambda: "cancelled")
+        assert third.cancel()
+
+        stats = executor.stats()
+        assert stats["active_workers"] == 1
+        assert stats["queue_depth"] == 1
+
+        release.set()
+        first.result(timeout=5)
+        assert second.result(timeout=5) == "done"
+    finally:
+        release.set()
+        executor.shutdown(wait=True)
+
+    stats = executor.stats()
+    assert stats["active_workers"] == 0
+    assert stats["queue_depth"] == 0
+    assert stats["completed"] == 2
+    assert stats["wait_seconds"]["count"] == 2
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_paginate_caps_at_max_records():
@@ -169,14 +235,247 @@ async def test_paginate_uses_optimal_page_size():
     )
 
 
+def _offset_pages(total, *, report_total=True):
+    """Build a jget side effect serving `total` teams in pages of `limit` by `offset`."""
+    items = [{"id": f"P{i}"} for i in range(total)]
+
+    def fake_jget(_url, params):
+        offset, limit = params["offset"], params["limit"]
+        body = {
+            "teams": items[offset : offset + limit],
+            "more": offset + limit < total,
+        }
+        if report_total and params.get("total") == "true":
+            body["total"] = total
+        return body
+
+    return items, fake_jget
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_paginate_fetches_remaining_offsets_concurrently():
+    """Past one page, paginate requests total=true and then every remaining offset."""
+    mock_client = MagicMock()
+    items, fake_jget = _offset_pages(250)
+    mock_client.jget.side_effect = fake_jget
+
+    results = await paginate(
+        mock_client, "/teams", params={}, max_records=500, operation_name="test"
+    )
+
+    assert results == items
+    mock_client.iter_all.assert_not_called()
+    calls = [c.kwargs["params"] for c in mock_client.jget.call_args_list]
+    assert calls[0] == {"limit": 100, "offset": 0, "total": "true"}
+    assert sorted(c["offset"] for c in calls[1:]) == [100, 200]
+    assert all("total" not in c for c in calls[1:])
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_paginate_page_size_caps_at_100():
-    """paginate caps page_size at 100 even for large max_records."""
+async def test_paginate_concurrent_stops_at_max_records():
+    """Offsets past max_records are never requested and results are capped."""
     mock_client = MagicMock()
-    mock_client.iter_all.return_value = iter([{"id": f"P{i}"} for i in range(100)])
+    items, fake_jget = _offset_pages(1000)
+    mock_client.jget.side_effect = fake_jget
 
-    await paginate(
-        mock_client, "/teams", params={}, max_records=500, operation_name="test cap"
+    results = await paginate(
+        mock_client, "/teams", params={}, max_records=150, operation_name="test"
     )
-    mock_client.iter_all.assert_called_once_with("/teams", params={}, page_size=100)
+
+    assert results == items[:150]
+    assert mock_client.jget.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_paginate_walks_serially_without_total():
+    """Endpoints that omit `total` are walked one offset at a time."""
+    mock_client = MagicMock()
+    items, fake_jget = _offset_pages(230, report_total=False)
+    mock_client.jget.side_effect = fake_jget
+
+    results = await paginate(
+        mock_client, "/teams", params={}, max_records=500, operation_name="test"
+    )
+
+    assert results == items
+    offsets = [c.kwargs["params"]["offset"] for c in mock_client.jget.call_args_list]
+    assert offsets == [0, 100, 200]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_iter_pages_stops_requesting_when_closed():
+    """Closing iter_pages after the first page cancels the remaining page requests."""
+    mock_client = MagicMock()
+    _items, fake_jget = _offset_pages(1000)
+    mock_client.jget.side_effect = fake_jget
+
+    async with aclosing(
+        iter_pages(
+            mock_client, "/teams", params={}, max_records=1000, operation_name="test"
+        )
+    ) as pages:
+        first = await anext(pages)
+
+    assert len(first) == 100
+    assert mock_client.jget.call_count <= 1 + PAGINATE_CONCURRENCY
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_iter_pages_cursor_skips_dropped_duplicates():
+    """A cursor counts duplicates dropped between pages, so resuming repeats nothing."""
+    mock_client = MagicMock()
+    items, fake_jget = _offset_pages(250)
+    # Records shifted while paging: the second page starts with the first page's last.
+    items[100] = dict(items[99])
+    mock_client.jget.side_effect = fake_jget
+    positions = utils.PagePositions()
+
+    results = await paginate_with_positions(mock_client, positions, max_records=500)
+    next_cursor = utils.make_next_cursor("/teams", {}, 500, positions)
+    params, limit = utils.decode_cursor(next_cursor(150), "/teams")
+
+    assert [item["id"] for item in results[99:101]] == ["P99", "P101"]
+    assert params == {"offset": 151}
+    assert limit == 350
+    resumed = await paginate(
+        mock_client, "/teams", params=params, max_records=limit, operation_name="test"
+    )
+    assert resumed == results[150:]
+
+
+async def paginate_with_positions(pd_client, positions, *, max_records):
+    """Collect every page of `iter_pages` over /teams, tracking record positions."""
+    results = []
+    async for page in iter_pages(
+        pd_client,
+        "/teams",
+        {},
+        max_records=max_records,
+        operation_name="test",
+        positions=positions,
+    ):
+        results.extend(page)
+    return results
+
+
+async def _pages(*pages, pulled=None):
+    """Yield the given pages, recording in `pulled` how many were requested."""
+    for page in pages:
+        if pulled is not None:
+            pulled.append(page)
+        yield page
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_merge_pages_orders_dedupes_and_skips():
+    """Sorted streams are merged by key, duplicates dropped, and skip/max applied."""
+    first = _pages([{"id": "a", "k": 1}, {"id": "c", "k": 3}], [{"id": "e", "k": 5}])
+    second = _pages([{"id": "b", "k": 2}, {"id": "c", "k": 3}], [{"id": "d", "k": 4}])
+
+    merged = []
+    async for page in merge_pages(
+        [first, second], key=lambda item: item["k"], max_records=3, skip=1
+    ):
+        merged.extend(page)
+
+    assert [item["id"] for item in merged] == ["b", "c", "d"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_merge_pages_advances_later_streams_only_when_needed():
+    """A stream whose items sort last is not read past its first page early."""
+    pulled: list = []
+    early = _pages([{"id": "a", "k": 1}], [{"id": "b", "k": 2}])
+    late = _pages([{"id": "y", "k": 8}], [{"id": "z", "k": 9}], pulled=pulled)
+
+    async with aclosing(
+        merge_pages([early, late], key=lambda item: item["k"], max_records=2)
+    ) as pages:
+        merged = [item async for page in pages for item in page]
+
+    assert [item["id"] for item in merged] == ["a", "b"]
+    assert len(pulled) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_identical_concurrent_reads_share_one_request():
+    """Concurrent GETs with the same path and params are sent to PagerDuty once."""
+    release = threading.Event()
+    mock_client = MagicMock()
+
+    def slow_jget(_url, params=None):
+        release.wait(timeout=5)
+        return {"user": {"id": "U1"}}
+
+    mock_client.jget.side_effect = slow_jget
+
+    calls = [
+        asyncio.ensure_future(
+            jget(mock_client, "/users/me", params={"a": 1}, operation_name="test")
+        )
+        for _ in range(3)
+    ]
+    other = asyncio.ensure_future(
+        jget(mock_client, "/users/me", params={"a": 2}, operation_name="test")
+    )
+    await asyncio.sleep(0.05)
+    release.set()
+    results = await asyncio.gather(*calls, other)
+
+    assert mock_client.jget.call_count == 2
+    assert results[0] == results[1] == results[2] == {"user": {"id": "U1"}}
+    assert results[0] is not results[1]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_read_results_are_copies_of_the_shared_response():
+    """The first caller gets a copy too, so later joiners never share its object."""
+    response = {"incident": {"id": "P1"}}
+    mock_client = MagicMock()
+    mock_client.jget.return_value = response
+
+    result = await jget(mock_client, "/incidents/P1", operation_name="test")
+
+    assert result == response
+    assert result is not response
+    assert result["incident"] is not response["incident"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_writes_are_not_coalesced():
+    """Writes are never shared between callers."""
+    mock_client = MagicMock()
+    mock_client.jput.return_value = {"incident": {"id": "P1"}}
+
+    await asyncio.gather(
+        *(
+            jput(mock_client, "/incidents/P1", json={}, operation_name="test")
+            for _ in range(2)
+        )
+    )
+
+    assert mock_client.jput.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_merge_pages_without_key_concatenates_streams():
+    """With no key, streams are returned one after another in their given order."""
+    first = _pages([{"id": "b"}], [{"id": "a"}])
+    second = _pages([{"id": "c"}, {"id": "a"}])
+
+    merged = []
+    async for page in merge_pages([first, second], key=None, max_records=10):
+        merged.extend(page)
+
+    assert [item["id"] for item in merged] == ["b", "a", "c"]
@@ -0,0 +1,176 @@
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from pagerduty_mcp_server import auth
+
+
+def _keyring(values):
+    return patch(
+        "pagerduty_mcp_server.auth.keyring.get_password",
+        side_effect=lambda service, key: values.get(key),
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+def test_get_token_reads_keyring_once_while_valid():
+    """Test that a valid keyring token is served from memory on later calls."""
+    values = {
+        auth.KEYRING_KEY_ACCESS_TOKEN: "oauth-token",
+        auth.KEYRING_KEY_TOKEN_EXPIRY: str(time.time() + 3600),
+    }
+    with _keyring(values) as mock_get_password:
+        assert auth.get_token() == "oauth-token"
+        calls = mock_get_password.call_count
+        assert auth.get_token() == "oauth-token"
+        assert auth.get_token() == "oauth-token"
+
+    assert calls > 0
+    assert mock_get_password.call_count == calls
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+def test_get_token_rereads_keyring_after_expiry():
+    """Test that an expired in-memory token falls back to the keyring."""
+    auth._cache_token("stale-token", time.time() - 1)
+    values = {
+        auth.KEYRING_KEY_ACCESS_TOKEN: "fresh-token",
+        auth.KEYRING_KEY_TOKEN_EXPIRY: str(time.time() + 3600),
+    }
+    with _keyring(values):
+        assert auth.get_token() == "fresh-token"
+
+    assert auth.get_cached_token() == "fresh-token"
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+def test_invalidate_cached_token_forces_keyring_read():
+    """Test that invalidating the cache makes the next lookup hit the keyring."""
+    auth._cache_token("rejected-token", time.time() + 3600)
+    auth.invalidate_cached_token()
+    assert auth.get_cached_token() is None
+
+    values = {
+        auth.KEYRING_KEY_ACCESS_TOKEN: "rotated-token",
+        auth.KEYRING_KEY_TOKEN_EXPIRY: str(time.time() + 3600),
+    }
+    with _keyring(values) as mock_get_password:
+        assert auth.get_token() == "rotated-token"
+
+    mock_get_password.assert_called()
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+def test_reject_token_ignores_replaced_tokens():
+    """Test that a late 401 for an old token does not discard its replacement."""
+    auth._cache_token("new-token", time.time() + 3600)
+    values = {
+        auth.KEYRING_KEY_ACCESS_TOKEN: "new-token",
+        auth.KEYRING_KEY_TOKEN_EXPIRY: str(time.time() + 3600),
+    }
+    with (
+        _keyring(values),
+        patch("pagerduty_mcp_server.auth.keyring.set_password") as mock_set_password,
+    ):
+        auth.reject_token("old-token")
+
+    assert auth.get_cached_token() == "new-token"
+    mock_set_password.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+def test_store_tokens_populates_cache():
+    """Test that newly stored tokens are cached with their expiry."""
+    with patch("pagerduty_mcp_server.auth.keyring.set_password"):
+        auth._store_tokens({"access_token": "new-token", "expires_in": 3600})
+
+    assert auth.get_cached_token() == "new-token"
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+def test_refresh_token_if_due_waits_until_refresh_point():
+    """Test that a fresh token is not refreshed and the remaining delay is reported."""
+    auth._cache_token("oauth-token", time.time() + 1000)
+
+    with patch("pagerduty_mcp_server.auth.refresh_access_token") as mock_refresh:
+        delay = auth.refresh_token_if_due()
+
+    mock_refresh.assert_not_called()
+    assert 0 < delay <= 1000 * auth.OAUTH_REFRESH_FRACTION
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+def test_refresh_token_if_due_renews_token(monkeypatch):
+    """Test that a token past its refresh point is renewed before it expires."""
+    monkeypatch.setenv("PAGERDUTY_CLIENT_SECRET", "secret")
+    auth._cache_token("old-token", time.time() + 1000)
+    with auth._token_cache_lock:
+        auth._token_cache["refresh_at"] = time.time() - 1
+
+    with (
+        _keyring({auth.KEYRING_KEY_REFRESH_TOKEN: "refresh-token"}),
+        patch("pagerduty_mcp_server.auth.keyring.set_password"),
+        patch(
+            "pagerduty_mcp_server.auth.refresh_access_token",
+            return_value={"access_token": "new-token", "expires_in": 3600},
+        ) as mock_refresh,
+    ):
+        delay = auth.refresh_token_if_due()
+
+    mock_refresh.assert_called_once_with("refresh-token")
+    assert auth.get_cached_token() == "new-token"
+    assert delay == pytest.approx(3600 * auth.OAUTH_REFRESH_FRACTION, abs=5)
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+def test_refresh_token_if_due_without_secret(monkeypatch):
+    """Test that nothing is refreshed when no client secret is configured."""
+    monkeypatch.delenv("PAGERDUTY_CLIENT_SECRET", raising=False)
+    auth._cache_token("old-token", time.time() + 1000)
+    with auth._token_cache_lock:
+        auth._token_cache["refresh_at"] = time.time() - 1
+
+    with (
+        _keyring({auth.KEYRING_KEY_REFRESH_TOKEN: "refresh-token"}),
+        patch("pagerduty_mcp_server.auth.refresh_access_token") as mock_refresh,
+    ):
+        assert auth.refresh_token_if_due() is None
+
+    mock_refresh.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.auth
+async def test_run_token_refresher_runs_off_event_loop():
+    """Test that the refresher does its blocking work on a worker thread."""
+    threads = []
+
+    def fake_refresh():
+        threads.append(threading.current_thread().name)
+        return 3600.0
+
+    with patch(
+        "pagerduty_mcp_server.auth.refresh_token_if_due", side_effect=fake_refresh
+    ):
+        task = asyncio.create_task(auth.run_token_refresher())
+        for _ in range(100):
+            if threads:
+                break
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert threads and threads[0].startswith("pagerduty-io")
@@ -0,0 +1,332 @@
+"""Unit tests for the cache module."""
+
+import asyncio
+import stat
+import threading
+import time
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
+
+import pytest
+
+from pagerduty_mcp_server import cache
+from pagerduty_mcp_server.async_utils import jget, jpost, jput
+
+
+@pytest.mark.unit
+def test_memory_cache_evicts_least_recently_used_over_max_bytes():
+    """Entries are evicted oldest-use first once the byte cap is exceeded."""
+    memory = cache.MemoryCache(max_bytes=10)
+    memory.set("a", "aaaa", resource="teams", ttl=60)
+    memory.set("b", "bbbb", resource="teams", ttl=60)
+    assert memory.get("a") == ("aaaa", ANY)
+
+    memory.set("c", "cccc", resource="teams", ttl=60)
+
+    assert memory.get("b") is None
+    assert memory.get("a") == ("aaaa", ANY)
+    assert memory.stats()["evictions"] == 1
+
+
+@pytest.mark.unit
+def test_memory_cache_expires_entries():
+    """Entries are not returned after their TTL."""
+    memory = cache.MemoryCache(max_bytes=100)
+    with patch("pagerduty_mcp_server.cache.time.time", return_value=100.0):
+        memory.set("a", "1", resource="teams", ttl=5)
+    with patch("pagerduty_mcp_server.cache.time.time", return_value=106.0):
+        assert memory.get("a") is None
+
+
+@pytest.mark.unit
+def test_memory_cache_invalidates_by_resource():
+    """invalidate drops only the entries for the given resource."""
+    memory = cache.MemoryCache(max_bytes=100)
+    memory.set("t", "1", resource="teams", ttl=60)
+    memory.set("u", "2", resource="users", ttl=60)
+
+    memory.invalidate("teams")
+
+    assert memory.get("t") is None
+    assert memory.get("u") == ("2", ANY)
+
+
+@pytest.mark.unit
+def test_sqlite_cache_persists_across_instances(tmp_path):
+    """A new SqliteCache on the same file sees entries written by an earlier one."""
+    path = str(tmp_path / "cache.db")
+    cache.SqliteCache(path, max_age=3600, max_bytes=1 << 20).set(
+        "t", "1", resource="teams", ttl=60
+    )
+
+    reopened = cache.SqliteCache(path, max_age=3600, max_bytes=1 << 20)
+
+    assert reopened.get("t") == ("1", ANY)
+    reopened.invalidate("teams")
+    assert reopened.get("t") is None
+
+
+@pytest.mark.unit
+def test_sqlite_cache_serves_entries_until_their_ttl(tmp_path):
+    """Entries are served until their TTL, and pruned once older than max_age."""
+    path = str(tmp_path / "cache.db")
+    sqlite = cache.SqliteCache(path, max_age=600, max_bytes=1 << 20)
+    with patch("pagerduty_mcp_server.cache.time.time", return_value=1000.0):
+        sqlite.set("t", "1", resource="teams", ttl=60)
+        sqlite.set("long", "2", resource="teams", ttl=3600)
+    with patch("pagerduty_mcp_server.cache.time.time", return_value=1050.0):
+        assert sqlite.get("t") == ("1", 1000.0)
+    with patch("pagerduty_mcp_server.cache.time.time", return_value=1070.0):
+        assert sqlite.get("t") is None
+        assert sqlite.get("long") == ("2", 1000.0)
+
+    with patch("pagerduty_mcp_server.cache.time.time", return_value=1700.0):
+        reopened = cache.SqliteCache(path, max_age=600, max_bytes=1 << 20)
+    assert reopened.stats()["entries"] == 0
+
+
+@pytest.mark.unit
+def test_sqlite_cache_prunes_expired_rows_on_write(tmp_path):
+    """Writing a row deletes the rows whose TTL has passed."""
+    sqlite = cache.SqliteCache(str(tmp_path / "cache.db"), max_age=3600, max_bytes=100)
+    with patch("pagerduty_mcp_server.cache.time.time", return_value=1000.0):
+        sqlite.set("t", "1", resource="teams", ttl=60)
+    with patch("pagerduty_mcp_server.cache.time.time", return_value=1100.0):
+        sqlite.set("u", "22", resource="users", ttl=60)
+
+    assert sqlite.stats()["entries"] == 1
+    assert sqlite.stats()["bytes"] == 2
+
+
+@pytest.mark.unit
+def test_sqlite_cache_evicts_oldest_rows_past_max_bytes(tmp_path):
+    """Rows are evicted oldest first once the values exceed max_bytes."""
+    path = str(tmp_path / "cache.db")
+    sqlite = cache.SqliteCache(path, max_age=3600, max_bytes=10)
+    for now, key in enumerate("abc"):
+        with patch("pagerduty_mcp_server.cache.time.time", return_value=1000.0 + now):
+            sqlite.set(key, "1234", resource="teams", ttl=60)
+    sqlite.set("big", "x" * 11, resource="teams", ttl=60)
+
+    with patch("pagerduty_mcp_server.cache.time.time", return_value=1010.0):
+        assert sqlite.get("a") is None
+        assert sqlite.get("b") == ("1234", 1001.0)
+        assert sqlite.get("c") == ("1234", 1002.0)
+        assert sqlite.get("big") is None
+    stats = sqlite.stats()
+    assert (stats["bytes"], stats["evictions"]) == (8, 1)
+
+    with patch("pagerduty_mcp_server.cache.time.time", return_value=1010.0):
+        assert (
+            cache.SqliteCache(path, max_age=3600, max_bytes=4).stats()["entries"] == 1
+        )
+
+
+@pytest.mark.unit
+def test_sqlite_cache_file_is_private_to_its_owner(tmp_path):
+    """The database is created, or tightened, to mode 0600."""
+    created = tmp_path / "new.db"
+    existing = tmp_path / "old.db"
+    existing.touch(mode=0o644)
+
+    cache.SqliteCache(str(created), max_age=3600, max_bytes=100)
+    cache.SqliteCache(str(existing), max_age=3600, max_bytes=100)
+
+    assert stat.S_IMODE(created.stat().st_mode) == 0o600
+    assert stat.S_IMODE(existing.stat().st_mode) == 0o600
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_read_through_serves_stale_entries_and_refreshes_them(tmp_path):
+    """An entry past its TTL is returned at once and refetched in the background."""
+    sqlite = cache.SqliteCache(
+        str(tmp_path / "cache.db"), max_age=3600, max_bytes=1 << 20
+    )
+    ttl = cache.RESOURCE_TTL_SECONDS["teams"]
+    with patch("pagerduty_mcp_server.cache.time.time", return_value=1000.0):
+        sqlite.set(
+            "k",
+            '{"team": "old"}',
+            resource="teams",
+            ttl=ttl + cache.CACHE_STALE_SECONDS,
+        )
+    fetch = AsyncMock(return_value={"team": "new"})
+
+    with (
+        patch.object(cache, "_backend", sqlite),
+        patch("pagerduty_mcp_server.cache.time.time", return_value=1001.0 + ttl),
+    ):
+        stale = await cache.read_through("k", "/teams/T1", fetch)
+        await asyncio.gather(*cache._revalidations.values())
+        fresh = await cache.read_through("k", "/teams/T1", fetch)
+
+    assert stale == {"team": "old"}
+    assert fresh == {"team": "new"}
+    fetch.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_read_through_does_not_serve_persisted_entries_past_the_stale_window(
+    tmp_path,
+):
+    """A persisted entry older than its TTL plus the stale window is refetched."""
+    sqlite = cache.SqliteCache(
+        str(tmp_path / "cache.db"), max_age=7 * 24 * 3600, max_bytes=1 << 20
+    )
+    ttl = cache.RESOURCE_TTL_SECONDS["teams"] + cache.CACHE_STALE_SECONDS
+    with patch("pagerduty_mcp_server.cache.time.time", return_value=1000.0):
+        sqlite.set("k", '{"team": "old"}', resource="teams", ttl=ttl)
+    fetch = AsyncMock(return_value={"team": "new"})
+
+    with (
+        patch.object(cache, "_backend", sqlite),
+        patch("pagerduty_mcp_server.cache.time.time", return_value=1001.0 + ttl),
+    ):
+        assert await cache.read_through("k", "/teams/T1", fetch) == {"team": "new"}
+
+    fetch.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_read_through_returns_fresh_copies():
+    """Hits are served without fetching, as copies callers can mutate."""
+    fetch = AsyncMock(return_value={"team": {"id": "T1"}})
+
+    first = await cache.read_through("k", "/teams/T1", fetch)
+    first["team"]["id"] = "mutated"
+    second = await cache.read_through("k", "/teams/T1", fetch)
+
+    assert second == {"team": {"id": "T1"}}
+    fetch.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_read_through_skips_uncached_resources():
+    """Resources without a TTL, such as incidents, always go to the network."""
+    fetch = AsyncMock(return_value={"incident": {"id": "P1"}})
+
+    await cache.read_through("k", "/incidents/P1", fetch)
+    await cache.read_through("k", "/incidents/P1", fetch)
+
+    assert fetch.await_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_writes_invalidate_cached_reads():
+    """A write to a resource makes the next read go to the network."""
+    mock_client = MagicMock()
+    mock_client.jget.return_value = {"team": {"id": "T1"}}
+    mock_client.jput.return_value = {"team": {"id": "T1"}}
+
+    await jget(mock_client, "/teams/T1", operation_name="test")
+    await jget(mock_client, "/teams/T1", operation_name="test")
+    assert mock_client.jget.call_count == 1
+
+    await jput(mock_client, "/teams/T1", json={}, operation_name="test")
+    await jget(mock_client, "/teams/T1", operation_name="test")
+    assert mock_client.jget.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_incident_updates_evict_cached_services():
+    """Updating incidents drops cached services, whose status follows them."""
+    mock_client = MagicMock()
+    mock_client.jget.side_effect = [
+        {"service": {"id": "S1", "status": "critical"}},
+        {"team": {"id": "T1"}},
+        {"service": {"id": "S1", "status": "active"}},
+    ]
+    mock_client.jput.return_value = {"incidents": []}
+    mock_client.jpost.return_value = {"note": {}}
+    await jget(mock_client, "/services/S1", operation_name="test")
+    await jget(mock_client, "/teams/T1", operation_name="test")
+
+    await jpost(mock_client, "/incidents/P1/notes", json={}, operation_name="test")
+    assert (await jget(mock_client, "/services/S1", operation_name="test"))["service"][
+        "status"
+    ] == "critical"
+
+    await jput(mock_client, "/incidents", json={}, operation_name="test")
+    assert (await jget(mock_client, "/services/S1", operation_name="test"))["service"][
+        "status"
+    ] == "active"
+    await jget(mock_client, "/teams/T1", operation_name="test")
+    assert mock_client.jget.call_count == 3
+
+
+@pytest.mark.unit
+def test_invalidated_by_lists_the_resources_each_write_changes():
+    """Writes drop their own cached resource plus those in WRITE_INVALIDATES."""
+    assert cache.invalidated_by("PUT", "/teams/T1") == ("teams",)
+    assert cache.invalidated_by("PUT", "/incidents") == ("services",)
+    assert cache.invalidated_by("POST", "/incidents/P1/notes") == ()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_read_through_serves_entries_within_the_stale_window():
+    """Just past its TTL, an entry is still served while it is refreshed."""
+    fetch = AsyncMock(side_effect=[{"team": "old"}, {"team": "new"}])
+    ttl = cache.RESOURCE_TTL_SECONDS["teams"]
+
+    with patch("pagerduty_mcp_server.cache.time.time", return_value=1000.0):
+        await cache.read_through("k", "/teams/T1", fetch)
+    with patch("pagerduty_mcp_server.cache.time.time", return_value=1001.0 + ttl):
+        with cache.track_fetch_times() as fetch_times:
+            stale = await cache.read_through("k", "/teams/T1", fetch)
+        await asyncio.gather(*cache._revalidations.values())
+
+    assert stale == {"team": "old"}
+    assert fetch_times == [1000.0]
+    assert fetch.await_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_list_responses_report_when_cached_pages_were_fetched(
+    mock_get_api_client,
+):
+    """metadata.as_of is the fetch time of the cached pages, not the time of the call."""
+    from pagerduty_mcp_server import teams
+
+    mock_get_api_client.iter_all.return_value = [{"id": "T1", "name": "Team"}]
+    fetched_at = time.time() - 60
+    with patch("pagerduty_mcp_server.cache.time.time", return_value=fetched_at):
+        await teams.list_teams()
+
+    response = await teams.list_teams()
+
+    assert response["metadata"]["as_of"] == time.strftime(
+        "%Y-%m-%dT%H:%M:%SZ", time.gmtime(fetched_at)
+    )
+    mock_get_api_client.iter_all.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_read_through_calls_blocking_backends_off_the_event_loop(tmp_path):
+    """SQLite reads and writes run on a worker thread, not on the event loop."""
+    sqlite = cache.SqliteCache(
+        str(tmp_path / "cache.db"), max_age=3600, max_bytes=1 << 20
+    )
+    threads = []
+    for name in ("get", "set"):
+        method = getattr(sqlite, name)
+
+        def record(*args, _method=method, **kwargs):
+            threads.append(threading.get_ident())
+            return _method(*args, **kwargs)
+
+        setattr(sqlite, name, record)
+    fetch = AsyncMock(return_value={"team": "new"})
+
+    with patch.object(cache, "_backend", sqlite):
+        await cache.read_through("k", "/teams/T1", fetch)
+
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
@@ -1,10 +1,20 @@
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 from starlette.requests import Request
 
-from pagerduty_mcp_server.client import PagerDutyClient, create_client
+from pagerduty_mcp_server import auth, rate_limit
+from pagerduty_mcp_server.client import (
+    ClientPool,
+    PagerDutyClient,
+    _RestClient,
+    create_client,
+    load_oauth_token,
+)
 from pagerduty_mcp_server.errors import PagerDutyAuthError
+from pagerduty_mcp_server.utils import token_key
 
 
 @pytest.fixture(autouse=True)
@@ -26,7 +36,7 @@ def reset_env_client():
 @pytest.mark.unit
 @pytest.mark.client
 def test_create_client_with_request_token():
-    """Test that create_client() creates new instance with request token."""
+    """Test that create_client() reuses the pooled instance for a request token."""
     mock_client = MagicMock()
 
     mock_request = MagicMock(spec=Request)
@@ -41,11 +51,11 @@ def test_create_client_with_request_token():
         ),
         patch.dict("os.environ", {"PAGERDUTY_API_TOKEN": "env-token"}),
     ):
-        create_client()
-        create_client()
+        client1 = create_client()
+        client2 = create_client()
 
-        assert mock_client_class.call_count == 2
-        mock_client_class.assert_called_with("request-token")
+        mock_client_class.assert_called_once_with("request-token")
+        assert client1 is client2
 
 
 @pytest.mark.unit
@@ -222,6 +232,120 @@ def test_get_oauth_token_returns_none_when_no_client_id(monkeypatch):
     assert result is None
 
 
+@pytest.mark.unit
+@pytest.mark.client
+def test_create_client_reuses_oauth_client(monkeypatch):
+    """Test that the OAuth path reuses a pooled client that rejects its token on 401."""
+    monkeypatch.delenv("PAGERDUTY_API_TOKEN", raising=False)
+    mock_client = MagicMock()
+
+    with (
+        patch(
+            "pagerduty_mcp_server.client._RestClient", return_value=mock_client
+        ) as mock_client_class,
+        patch("pagerduty_mcp_server.client.get_http_request", side_effect=RuntimeError),
+        patch.object(PagerDutyClient, "_get_oauth_token", return_value="oauth-token"),
+    ):
+        client1 = create_client()
+        client2 = create_client()
+
+    mock_client_class.assert_called_once_with("oauth-token")
+    assert client1 is client2
+    assert client1.on_unauthorized.func is auth.reject_token
+    assert client1.on_unauthorized.args == ("oauth-token",)
+
+
+@pytest.mark.unit
+@pytest.mark.client
+def test_unauthorized_oauth_token_is_refreshed(monkeypatch):
+    """Test that after a 401 the next client uses a refreshed token, not the rejected one."""
+    monkeypatch.delenv("PAGERDUTY_API_TOKEN", raising=False)
+    monkeypatch.setenv("PAGERDUTY_CLIENT_ID", "client-id")
+    monkeypatch.setenv("PAGERDUTY_CLIENT_SECRET", "secret")
+    stored = {
+        auth.KEYRING_KEY_ACCESS_TOKEN: "old-token",
+        auth.KEYRING_KEY_TOKEN_EXPIRY: str(time.time() + 3600),
+        auth.KEYRING_KEY_REFRESH_TOKEN: "refresh-token",
+    }
+
+    with (
+        patch("pagerduty_mcp_server.client.get_http_request", side_effect=RuntimeError),
+        patch(
+            "pagerduty_mcp_server.auth.keyring.get_password",
+            side_effect=lambda service, key: stored.get(key),
+        ),
+        patch(
+            "pagerduty_mcp_server.auth.keyring.set_password",
+            side_effect=lambda service, key, value: stored.__setitem__(key, value),
+        ),
+        patch(
+            "pagerduty_mcp_server.auth.refresh_access_token",
+            return_value={"access_token": "new-token", "expires_in": 3600},
+        ) as mock_refresh,
+    ):
+        rejected = create_client()
+        rejected.postprocess(MagicMock(status_code=401, headers={}))
+        refreshed = create_client()
+
+    mock_refresh.assert_called_once_with("refresh-token")
+    assert rejected.token_key == token_key("old-token")
+    assert refreshed.token_key == token_key("new-token")
+
+
+@pytest.mark.unit
+@pytest.mark.client
+def test_rest_client_calls_on_unauthorized_for_401():
+    """Test that the SDK client reports rejected credentials through its hook."""
+    pd_client = _RestClient("test-token")
+    pd_client.on_unauthorized = MagicMock()
+
+    pd_client.postprocess(MagicMock(status_code=200, headers={}))
+    pd_client.on_unauthorized.assert_not_called()
+
+    pd_client.postprocess(MagicMock(status_code=401, headers={}))
+    pd_client.on_unauthorized.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.client
+def test_rest_client_requeues_rate_limited_requests():
+    """Test that a 429 bypasses the SDK's blind sleep and goes back through the scheduler."""
+    pd_client = _RestClient("test-token")
+    ok_response = MagicMock(status_code=200)
+
+    with (
+        patch(
+            "pagerduty.RestApiV2Client.request",
+            side_effect=[
+                rate_limit.RateLimited(MagicMock(status_code=429)),
+                ok_response,
+            ],
+        ) as mock_request,
+        patch.object(rate_limit.limiter, "acquire") as mock_acquire,
+    ):
+        response = pd_client.request("GET", "/users")
+
+    assert response is ok_response
+    assert mock_request.call_count == 2
+    assert mock_acquire.call_count == 2
+    mock_acquire.assert_called_with(token_key("test-token"))
+
+
+@pytest.mark.unit
+@pytest.mark.client
+def test_rest_client_postprocess_raises_on_429():
+    """Test that the response hook records the limit and hands 429s to the scheduler."""
+    pd_client = _RestClient("test-token")
+    response = MagicMock(status_code=429, headers={"retry-after": "7"})
+
+    with pytest.raises(rate_limit.RateLimited):
+        pd_client.postprocess(response)
+
+    stats = rate_limit.limiter.bucket(pd_client.token_key).stats()
+    assert stats["rate_limited_responses"] == 1
+    assert stats["blocked_seconds"] == pytest.approx(7.0, abs=0.1)
+
+
 @pytest.mark.unit
 @pytest.mark.client
 def test_env_client_recreated_on_token_rotation():
@@ -266,3 +390,117 @@ def test_get_oauth_token_raises_auth_error_on_failure(monkeypatch):
             mock_oauth()
 
         assert "OAuth authorization failed" in str(exc_info.value)
+
+
+@pytest.mark.unit
+@pytest.mark.client
+def test_create_client_pools_per_request_token():
+    """Test that distinct header tokens get distinct pooled clients."""
+    mock_request = MagicMock(spec=Request)
+
+    with (
+        patch(
+            "pagerduty_mcp_server.client._RestClient",
+            side_effect=lambda *args, **kwargs: MagicMock(),
+        ) as mock_client_class,
+        patch(
+            "pagerduty_mcp_server.client.get_http_request", return_value=mock_request
+        ),
+    ):
+        mock_request.headers = {"X-PagerDuty-Token": "token-a"}
+        client_a = create_client()
+        mock_request.headers = {"X-PagerDuty-Token": "token-b"}
+        client_b = create_client()
+        mock_request.headers = {"X-PagerDuty-Token": "token-a"}
+        client_a_again = create_client()
+
+        assert mock_client_class.call_count == 2
+        assert client_a is client_a_again
+        assert client_a is not client_b
+
+
+@pytest.mark.unit
+@pytest.mark.client
+def test_client_pool_keys_by_token_hash():
+    """Test that the pool never stores raw tokens as keys."""
+    pool = ClientPool(max_size=4, idle_seconds=60)
+    pool.get("secret-token", lambda token: MagicMock())
+
+    assert list(pool._clients) == [token_key("secret-token")]
+    assert "secret-token" not in pool._clients
+
+
+@pytest.mark.unit
+@pytest.mark.client
+def test_client_pool_evicts_least_recently_used():
+    """Test that the pool drops the least recently used client past max_size."""
+    pool = ClientPool(max_size=2, idle_seconds=60)
+    factory = MagicMock(side_effect=lambda token: MagicMock(name=token))
+
+    client_a = pool.get("token-a", factory)
+    client_b = pool.get("token-b", factory)
+    assert pool.get("token-a", factory) is client_a
+    pool.get("token-c", factory)
+
+    assert len(pool) == 2
+    assert token_key("token-b") not in pool._clients
+    assert factory.call_count == 3
+    client_b.close.assert_called_once()
+    client_a.close.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.client
+def test_client_pool_closes_idle_clients():
+    """Test that clients idle past idle_seconds are closed and replaced."""
+    pool = ClientPool(max_size=4, idle_seconds=30)
+    factory = MagicMock(side_effect=lambda token: MagicMock())
+
+    with patch("pagerduty_mcp_server.client.time.monotonic", return_value=100.0):
+        stale_client = pool.get("token-a", factory)
+    with patch("pagerduty_mcp_server.client.time.monotonic", return_value=131.0):
+        fresh_client = pool.get("token-a", factory)
+
+    stale_client.close.assert_called_once()
+    assert fresh_client is not stale_client
+    assert factory.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.client
+@pytest.mark.asyncio
+async def test_load_oauth_token_runs_off_event_loop(monkeypatch):
+    """Test that a missing OAuth token is obtained on a worker thread, not the loop."""
+    monkeypatch.delenv("PAGERDUTY_API_TOKEN", raising=False)
+    threads = []
+
+    def get_oauth_token():
+        threads.append(threading.get_ident())
+        return "oauth-token"
+
+    with (
+        patch("pagerduty_mcp_server.client.get_http_request", side_effect=RuntimeError),
+        patch.object(PagerDutyClient, "_get_oauth_token", side_effect=get_oauth_token),
+    ):
+        await load_oauth_token()
+        auth._cache_token("oauth-token", time.time() + 3600)
+        await load_oauth_token()
+
+    assert len(threads) == 1
+    assert threads[0] != threading.get_ident()
+
+
+@pytest.mark.unit
+@pytest.mark.client
+@pytest.mark.asyncio
+async def test_load_oauth_token_skips_env_token(monkeypatch):
+    """Test that nothing is loaded when the environment token will be used."""
+    monkeypatch.setenv("PAGERDUTY_API_TOKEN", "env-token")
+
+    with (
+        patch("pagerduty_mcp_server.client.get_http_request", side_effect=RuntimeError),
+        patch.object(PagerDutyClient, "_get_oauth_token") as mock_oauth,
+    ):
+        await load_oauth_token()
+
+    mock_oauth.assert_not_called()
@@ -1,6 +1,6 @@
 """Unit tests for the escalation_policies module."""
 
-from unittest.mock import MagicMock
+from unittest.mock import ANY, MagicMock
 
 import pytest
 
@@ -25,6 +25,7 @@ async def test_list_escalation_policies(
     assert policy_list == utils.api_response_handler(
         results=mock_escalation_policies_parsed,
         resource_name="escalation_policies",
+        additional_metadata={"as_of": ANY},
     )
 
 
@@ -48,9 +49,46 @@ async def test_list_escalation_policies_with_query(
     assert policy_list == utils.api_response_handler(
         results=mock_escalation_policies_parsed,
         resource_name="escalation_policies",
+        additional_metadata={"as_of": ANY},
     )
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.escalation_policies
+async def test_list_escalation_policies_chunks_long_id_filters(
+    mock_get_api_client, monkeypatch
+):
+    """Test that long team filters are queried in chunks merged back in name order."""
+    monkeypatch.setattr(escalation_policies, "ID_FILTER_CHUNK_SIZE", 2)
+    policies_by_team = {
+        "T1": {"id": "P1", "name": "Alpha"},
+        "T2": {"id": "P3", "name": "charlie"},
+        "T3": {"id": "P2", "name": "Bravo"},
+    }
+
+    def iter_all(url, params, page_size):
+        return [policies_by_team[team_id] for team_id in params["team_ids[]"]]
+
+    mock_get_api_client.iter_all.side_effect = iter_all
+
+    policy_list = await escalation_policies.list_escalation_policies(
+        team_ids=["T1", "T2", "T3"]
+    )
+
+    assert [policy["name"] for policy in policy_list["escalation_policies"]] == [
+        "Alpha",
+        "Bravo",
+        "charlie",
+    ]
+    assert sorted(
+        call.kwargs["params"]["team_ids[]"]
+        for call in mock_get_api_client.iter_all.call_args_list
+    ) == [["T1", "T2"], ["T3"]]
+    for call in mock_get_api_client.iter_all.call_args_list:
+        assert call.kwargs["params"]["sort_by"] == "name"
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 @pytest.mark.escalation_policies
@@ -72,7 +110,9 @@ async def test_list_escalation_policies_empty_response(mock_get_api_client):
 
     policy_list = await escalation_policies.list_escalation_policies()
     assert policy_list == utils.api_response_handler(
-        results=[], resource_name="escalation_policies"
+        results=[],
+        resource_name="escalation_policies",
+        additional_metadata={"as_of": ANY},
     )
 
 
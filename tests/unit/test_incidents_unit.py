@@ -1,6 +1,7 @@
 """Unit tests for the incidents module."""
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+from unittest.mock import ANY, AsyncMock, patch
 
 import pytest
 
@@ -40,6 +41,7 @@ async def test_list_incidents(
         page_size=100,
     )
     expected_metadata = incidents._calculate_incident_metadata(mock_incidents)
+    expected_metadata["as_of"] = ANY
     assert incident_list == utils.api_response_handler(
         results=mock_incidents_parsed,
         resource_name="incidents",
@@ -447,12 +449,16 @@ async def test_show_incident(
         )
 
         if "_list_past_incidents" in test_case["expected_calls"]:
-            mock_list_past.assert_called_once_with(incident_id=incident_id)
+            mock_list_past.assert_called_once_with(
+                incident_id=incident_id, include=None
+            )
         else:
             mock_list_past.assert_not_called()
 
         if "_list_related_incidents" in test_case["expected_calls"]:
-            mock_list_related.assert_called_once_with(incident_id=incident_id)
+            mock_list_related.assert_called_once_with(
+                incident_id=incident_id, include=None
+            )
         else:
             mock_list_related.assert_not_called()
 
@@ -490,6 +496,184 @@ async def test_show_incident(
         assert incident == expected_response
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.incidents
+async def test_list_incidents_splits_long_ranges_into_windows(
+    mock_get_api_client, mock_incidents
+):
+    """Test that a year-long query is fetched as windows and merged oldest first."""
+
+    def _iter_all(url, params, page_size):
+        # Each window sees incidents created at both of its boundaries, so
+        # adjacent windows share one.
+        return [
+            {**mock_incidents[0], "id": f"I{ts[:10]}", "created_at": ts}
+            for ts in (params["since"], params["until"])
+        ]
+
+    mock_get_api_client.iter_all.side_effect = _iter_all
+
+    result = await incidents.list_incidents(
+        since="2024-01-01T00:00:00Z", until="2024-12-31T00:00:00Z", include=["id"]
+    )
+
+    windows = sorted(
+        (c.kwargs["params"] for c in mock_get_api_client.iter_all.call_args_list),
+        key=lambda params: params["since"],
+    )
+    assert len(windows) == 12
+    assert all(w["sort_by"] == "created_at:asc" for w in windows)
+    assert windows[0]["since"] == "2024-01-01T00:00:00Z"
+    assert windows[-1]["until"] == "2024-12-31T00:00:00Z"
+    ids = [incident["id"] for incident in result["incidents"]]
+    assert ids[:3] == ["I2024-01-01", "I2024-02-01", "I2024-03-03"]
+    assert ids[-1] == "I2024-12-31"
+    assert len(ids) == len(set(ids)) == 13
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.incidents
+async def test_list_incidents_cursor_resumes_each_window(mock_get_api_client):
+    """Test that a windowed query resumes every window at its own offset."""
+
+    def _window(params):
+        return [
+            {
+                "id": f"I{params['since'][:10]}-{n:02d}",
+                "created_at": f"{params['since'][:19]}.{n:03d}Z",
+            }
+            for n in range(40)
+        ]
+
+    def _jget(url, params):
+        window = _window(params)
+        offset, limit = params["offset"], params["limit"]
+        return {
+            "incidents": window[offset : offset + limit],
+            "more": offset + limit < len(window),
+            "total": len(window),
+        }
+
+    mock_get_api_client.jget.side_effect = _jget
+    params = {"since": "2024-01-01T00:00:00Z", "until": "2024-12-31T00:00:00Z"}
+    positions = utils.PagePositions()
+    first = []
+    async for page in incidents._iter_incident_pages(
+        mock_get_api_client, params, 300, positions
+    ):
+        first.extend(page)
+    cursor = utils.make_next_cursor(incidents.INCIDENTS_URL, params, 300, positions)(
+        150
+    )
+    mock_get_api_client.jget.reset_mock()
+
+    result = await incidents.list_incidents(cursor=cursor, include=["id"])
+
+    resumed, _limit = utils.decode_cursor(cursor, incidents.INCIDENTS_URL)
+    assert resumed["offset"] == [40, 40, 40, 30] + [0] * 8
+    requested = {}
+    for call in mock_get_api_client.jget.call_args_list:
+        request = call.kwargs["params"]
+        requested.setdefault(request["since"][:10], []).append(request["offset"])
+    starts = [min(requested[since]) for since in sorted(requested)]
+    assert starts == [40, 40, 40, 30] + [0] * 8
+    assert [incident["id"] for incident in result["incidents"]] == [
+        incident["id"] for incident in first[150:300]
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.incidents
+async def test_show_incident_fetches_sub_resources_concurrently(
+    mock_get_api_client, mock_incidents
+):
+    """Test that sub-resources are fetched together and one failing does not drop the others."""
+    incident_id = mock_incidents[0]["id"]
+    mock_get_api_client.jget.return_value = {"incident": mock_incidents[0]}
+    started = 0
+    all_started = asyncio.Event()
+
+    def _waiting_for_others(result):
+        async def _fetch(**_):
+            return await _wait_for_others(result)
+
+        return _fetch
+
+    async def _wait_for_others(result):
+        nonlocal started
+        started += 1
+        if started == 3:
+            all_started.set()
+        await asyncio.wait_for(all_started.wait(), timeout=1)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    past = {"incidents": [{"id": "PAST-1"}]}
+    notes = {"notes": [{"id": "NOTE-1"}]}
+    with (
+        patch(
+            "pagerduty_mcp_server.incidents._list_past_incidents",
+            side_effect=_waiting_for_others(past),
+        ),
+        patch(
+            "pagerduty_mcp_server.incidents._list_related_incidents",
+            side_effect=_waiting_for_others(RuntimeError("boom")),
+        ),
+        patch(
+            "pagerduty_mcp_server.incidents._list_notes",
+            side_effect=_waiting_for_others(notes),
+        ),
+    ):
+        incident = await incidents.show_incident(
+            incident_id=incident_id,
+            include_past_incidents=True,
+            include_related_incidents=True,
+            include_notes=True,
+        )
+
+    assert incident["incident"][0]["past_incidents"] == past["incidents"]
+    assert incident["incident"][0]["notes"] == notes["notes"]
+    assert "related_incidents" not in incident["incident"][0]
+    assert incident["metadata"]["past_incidents_count"] == 1
+    assert incident["metadata"]["notes_count"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.incidents
+async def test_show_incidents_batch(mock_get_api_client, mock_incidents):
+    """Test that a batch lookup returns incidents in order, with notes, and reports failures."""
+
+    def _jget(url, **kwargs):
+        if url.endswith("/notes"):
+            return {"notes": [{"id": "NOTE-1", "content": "note"}]}
+        incident_id = url.rsplit("/", 1)[1]
+        if incident_id == "MISSING":
+            raise RuntimeError("Incident Not Found")
+        return {"incident": {**mock_incidents[0], "id": incident_id}}
+
+    mock_get_api_client.jget.side_effect = _jget
+
+    result = await incidents.show_incidents(
+        incident_ids=["P1", "MISSING", "P2", "P1"],
+        include_notes=True,
+        include=["id"],
+    )
+
+    assert [i["id"] for i in result["incidents"]] == ["P1", "P2"]
+    assert result["incidents"][0]["notes"][0]["id"] == "NOTE-1"
+    assert result["metadata"]["fetched_count"] == 2
+    assert result["metadata"]["failed"] == [
+        {"incident_id": "MISSING", "error": "Incident Not Found"}
+    ]
+    # Two incidents and a failure, each with a notes fetch; the duplicate is skipped.
+    assert mock_get_api_client.jget.call_count == 6
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 @pytest.mark.incidents
@@ -942,6 +1126,88 @@ async def test_update_incident_status_invalid_response(
         await incidents.update_incident_status(incident_id="123", status="acknowledged")
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.incidents
+async def test_update_incidents_status_chunks_requests(
+    mock_get_api_client, mock_user_email_patch, mock_incidents
+):
+    """Test that bulk updates are split into PagerDuty-sized chunks with one email lookup."""
+
+    def _jput(url, json, headers):
+        return {
+            "incidents": [
+                {**mock_incidents[0], "id": item["id"], "status": item["status"]}
+                for item in json["incidents"]
+            ]
+        }
+
+    mock_get_api_client.jput.side_effect = _jput
+    incident_ids = [f"P{i}" for i in range(5)] + ["P0"]
+
+    with patch.object(incidents, "BULK_UPDATE_MAX_INCIDENTS", 2):
+        result = await incidents.update_incidents_status(
+            incident_ids=incident_ids, status="resolved", include=["id", "status"]
+        )
+
+    # Chunks are sent concurrently, so the calls may arrive in any order.
+    calls = mock_get_api_client.jput.call_args_list
+    assert sorted(
+        [item["id"] for item in call.kwargs["json"]["incidents"]] for call in calls
+    ) == [["P0", "P1"], ["P2", "P3"], ["P4"]]
+    assert all(call.args == (incidents.INCIDENTS_URL,) for call in calls)
+    assert all(call.kwargs["headers"] == {"From": MOCK_USER_EMAIL} for call in calls)
+    assert calls[0].kwargs["json"]["incidents"][0]["type"] == "incident_reference"
+    assert calls[0].kwargs["json"]["incidents"][0]["status"] == "resolved"
+    mock_user_email_patch.assert_awaited_once()
+    assert [i["id"] for i in result["incidents"]] == [f"P{i}" for i in range(5)]
+    assert result["metadata"]["updated_count"] == 5
+    assert result["metadata"]["failed"] == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.incidents
+async def test_update_incidents_status_reports_per_incident_failures(
+    mock_get_api_client, mock_user_email_patch, mock_incidents
+):
+    """Test that a failed chunk and incidents missing from a response are reported as failed."""
+
+    def _jput(url, json, headers):
+        ids = [item["id"] for item in json["incidents"]]
+        if "P2" in ids:
+            raise RuntimeError("Incident Not Found")
+        return {"incidents": [{**mock_incidents[0], "id": ids[0]}]}
+
+    mock_get_api_client.jput.side_effect = _jput
+
+    with patch.object(incidents, "BULK_UPDATE_MAX_INCIDENTS", 2):
+        result = await incidents.update_incidents_status(
+            incident_ids=["P0", "P1", "P2", "P3"], status="acknowledged"
+        )
+
+    assert [i["id"] for i in result["incidents"]] == ["P0"]
+    assert result["metadata"]["failed_count"] == 3
+    assert result["metadata"]["failed"] == [
+        {"incident_id": "P1", "error": "Incident missing from PagerDuty response"},
+        {"incident_id": "P2", "error": "Incident Not Found"},
+        {"incident_id": "P3", "error": "Incident Not Found"},
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.incidents
+async def test_update_incidents_status_validates_input():
+    """Test that empty or invalid incident IDs raise ValueError before any request."""
+    with pytest.raises(ValueError, match="incident_ids cannot be empty"):
+        await incidents.update_incidents_status(incident_ids=[], status="resolved")
+    with pytest.raises(ValueError, match="Invalid incident_id format"):
+        await incidents.update_incidents_status(
+            incident_ids=["P1", "bad/id"], status="resolved"
+        )
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 @pytest.mark.incidents
@@ -0,0 +1,38 @@
+"""Unit tests for the metrics module."""
+
+import pytest
+
+from pagerduty_mcp_server import metrics
+
+
+@pytest.mark.unit
+@pytest.mark.metrics
+def test_histogram_cumulative_buckets():
+    """Histogram buckets count observations less than or equal to each bound."""
+    histogram = metrics.Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot["count"] == 4
+    assert snapshot["sum"] == pytest.approx(3.65)
+    assert snapshot["buckets"] == {"0.1": 2, "1": 3, "+Inf": 4}
+
+
+@pytest.mark.unit
+@pytest.mark.metrics
+def test_snapshot_isolates_failing_collectors(monkeypatch):
+    """A failing collector is reported as an error without hiding the others."""
+    monkeypatch.setattr(metrics, "_collectors", {})
+
+    def broken():
+        raise RuntimeError("boom")
+
+    metrics.register_collector("healthy", lambda: {"value": 1})
+    metrics.register_collector("broken", broken)
+
+    assert metrics.snapshot() == {
+        "broken": {"error": "boom"},
+        "healthy": {"value": 1},
+    }
@@ -1,6 +1,6 @@
 """Unit tests for the oncalls module."""
 
-from unittest.mock import MagicMock
+from unittest.mock import ANY, MagicMock
 
 import pytest
 
@@ -23,6 +23,7 @@ async def test_list_oncalls(mock_get_api_client, mock_oncalls, mock_oncalls_pars
     assert oncall_list == utils.api_response_handler(
         results=mock_oncalls_parsed,
         resource_name="oncalls",
+        additional_metadata={"as_of": ANY},
     )
 
 
@@ -96,7 +97,7 @@ async def test_list_oncalls_empty_response(mock_get_api_client):
 
     oncall_list = await oncalls.list_oncalls()
     assert oncall_list == utils.api_response_handler(
-        results=[], resource_name="oncalls"
+        results=[], resource_name="oncalls", additional_metadata={"as_of": ANY}
     )
 
 
@@ -116,6 +117,40 @@ async def test_list_oncalls_preserves_full_error_message(mock_get_api_client):
     assert str(exc_info.value) == "API Error"
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.oncalls
+async def test_list_oncalls_dedupes_entries_across_chunks(
+    mock_get_api_client, monkeypatch
+):
+    """Test that an entry returned by two chunks of an ID filter is listed once."""
+    monkeypatch.setattr(oncalls, "ID_FILTER_CHUNK_SIZE", 1)
+    shared = {
+        "user": {"id": "U1"},
+        "schedule": {"id": "S1"},
+        "escalation_policy": {"id": "EP1"},
+        "escalation_level": 1,
+        "start": "2024-01-01T00:00:00Z",
+        "end": "2024-01-08T00:00:00Z",
+    }
+    later_shift = {**shared, "start": "2024-01-08T00:00:00Z", "end": None}
+
+    def iter_all(url, params, page_size):
+        if params["schedule_ids[]"] == ["S1"]:
+            return [dict(shared)]
+        return [dict(shared), later_shift]
+
+    mock_get_api_client.iter_all.side_effect = iter_all
+
+    oncall_list = await oncalls.list_oncalls(schedule_ids=["S1", "S2"])
+
+    assert mock_get_api_client.iter_all.call_count == 2
+    assert [oncall["start"] for oncall in oncall_list["oncalls"]] == [
+        "2024-01-01T00:00:00Z",
+        "2024-01-08T00:00:00Z",
+    ]
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 @pytest.mark.oncalls
@@ -0,0 +1,108 @@
+"""Unit tests for the per-token rate limit scheduler."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from pagerduty_mcp_server import metrics
+from pagerduty_mcp_server.rate_limit import (
+    RateLimiter,
+    TokenBucket,
+)
+from pagerduty_mcp_server.utils import token_key
+
+
+@pytest.mark.unit
+@pytest.mark.rate_limit
+def test_reserve_queues_once_budget_is_spent():
+    """Requests beyond the budget are queued in arrival order instead of failing."""
+    bucket = TokenBucket(limit=2, period=60.0)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    first_wait = bucket.reserve()
+    second_wait = bucket.reserve()
+
+    assert first_wait == pytest.approx(30.0, abs=0.1)
+    assert second_wait == pytest.approx(60.0, abs=0.1)
+    assert bucket.stats()["queued_requests"] == 2
+
+
+@pytest.mark.unit
+@pytest.mark.rate_limit
+def test_observe_learns_budget_from_headers():
+    """The ratelimit-* headers correct the limit and the remaining budget."""
+    bucket = TokenBucket(limit=960)
+
+    bucket.observe(
+        200,
+        {"ratelimit-limit": "500", "ratelimit-remaining": "0", "ratelimit-reset": "12"},
+    )
+
+    stats = bucket.stats()
+    assert stats["limit_per_minute"] == 500
+    assert stats["remaining_reported"] == 0
+    assert bucket.reserve() == pytest.approx(12.0, abs=0.1)
+
+
+@pytest.mark.unit
+@pytest.mark.rate_limit
+def test_observe_honors_retry_after_on_429():
+    """A 429 blocks the token until Retry-After has passed."""
+    bucket = TokenBucket(limit=960)
+
+    bucket.observe(429, {"retry-after": "5"})
+
+    assert bucket.reserve() == pytest.approx(5.0, abs=0.1)
+    assert bucket.stats()["rate_limited_responses"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.rate_limit
+def test_observe_backs_off_on_429_without_headers():
+    """Consecutive 429s without timing headers back off exponentially."""
+    bucket = TokenBucket(limit=960)
+
+    bucket.observe(429, {})
+    first = bucket.stats()["blocked_seconds"]
+    bucket.observe(429, {})
+    second = bucket.stats()["blocked_seconds"]
+
+    assert first == pytest.approx(1.5, abs=0.1)
+    assert second == pytest.approx(3.0, abs=0.1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.rate_limit
+async def test_acquire_async_sleeps_without_blocking():
+    """Async callers wait on the event loop for their queued slot."""
+    limiter = RateLimiter()
+    key = token_key("token")
+    limiter.observe(key, 429, {"retry-after": "2"})
+
+    with patch(
+        "pagerduty_mcp_server.rate_limit.asyncio.sleep", new_callable=AsyncMock
+    ) as mock_sleep:
+        waited = await limiter.acquire_async(key)
+
+    assert waited == pytest.approx(2.0, abs=0.1)
+    mock_sleep.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.rate_limit
+def test_limiter_tracks_tokens_separately_and_reports_metrics():
+    """Each token has its own budget, reported without exposing the token."""
+    limiter = RateLimiter(max_tokens=2)
+    limiter.acquire(token_key("token-a"))
+    limiter.acquire(token_key("token-b"))
+    limiter.acquire(token_key("token-c"))
+
+    stats = limiter.stats()
+    assert set(stats) == {
+        token_key("token-b")[:12],
+        token_key("token-c")[:12],
+    }
+    assert "token-b" not in str(stats)
+    assert "rate_limits" in metrics.snapshot()
@@ -0,0 +1,179 @@
+"""Unit tests for retries and circuit breaking around upstream calls."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx2
+import pagerduty
+import pytest
+
+from pagerduty_mcp_server import async_utils, metrics, resilience
+from pagerduty_mcp_server.client import _RestClient
+from pagerduty_mcp_server.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    endpoint_key,
+)
+
+
+def _http_error(status: int) -> pagerduty.HttpError:
+    return pagerduty.HttpError(f"status {status}", MagicMock(status_code=status))
+
+
+@pytest.fixture
+def no_sleep():
+    with patch(
+        "pagerduty_mcp_server.resilience.asyncio.sleep", new_callable=AsyncMock
+    ) as mock_sleep:
+        yield mock_sleep
+
+
+@pytest.mark.unit
+@pytest.mark.resilience
+def test_endpoint_key_normalizes_ids():
+    """Resource IDs are collapsed so every incident shares one breaker."""
+    assert (
+        endpoint_key("get", "/incidents/PABC123/notes") == "GET /incidents/{id}/notes"
+    )
+    assert (
+        endpoint_key("GET", "https://api.pagerduty.com/teams/9429c90ff0")
+        == "GET /teams/{id}"
+    )
+    assert endpoint_key("GET", "/users/me") == "GET /users/me"
+
+
+@pytest.mark.unit
+@pytest.mark.resilience
+def test_retry_policy_delay_is_jittered_and_capped():
+    """Backoff delays are drawn from zero up to the capped exponential bound."""
+    policy = RetryPolicy(max_attempts=5, base_delay=1.0, max_delay=4.0)
+
+    for attempt in range(6):
+        assert 0 <= policy.delay(attempt) <= min(4.0, 2**attempt)
+    assert policy.should_retry(_http_error(503), 0)
+    assert not policy.should_retry(_http_error(404), 0)
+    assert not policy.should_retry(_http_error(503), 4)
+
+
+@pytest.mark.unit
+@pytest.mark.resilience
+def test_only_sdk_network_failures_are_transient():
+    """Bare SDK errors are transient only when raised from a network error."""
+    try:
+        raise pagerduty.Error("exceeded maximum number of attempts") from (
+            httpx2.ConnectError("connection refused")
+        )
+    except pagerduty.Error as e:
+        network_error = e
+
+    assert resilience.is_transient_error(network_error)
+    assert not resilience.is_transient_error(pagerduty.Error("Method not supported"))
+    assert not resilience.is_transient_error(pagerduty.UrlError("Bad URL"))
+
+
+@pytest.mark.unit
+@pytest.mark.resilience
+def test_sdk_client_leaves_network_retries_to_resilience():
+    """The SDK client raises network errors at once instead of retrying them itself."""
+    pd_client = _RestClient("test-token")
+
+    with (
+        patch("pagerduty_mcp_server.client.rate_limit.limiter.acquire"),
+        patch.object(
+            httpx2.Client,
+            "request",
+            side_effect=httpx2.ConnectError("connection refused"),
+        ) as mock_request,
+        pytest.raises(pagerduty.Error) as exc_info,
+    ):
+        pd_client.request("GET", "/users/me")
+
+    mock_request.assert_called_once()
+    assert resilience.is_transient_error(exc_info.value)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.resilience
+async def test_jget_retries_transient_failures(no_sleep):
+    """Idempotent GETs are retried after a 5xx."""
+    mock_client = MagicMock()
+    mock_client.jget.side_effect = [_http_error(503), {"user": {"id": "U1"}}]
+
+    body = await async_utils.jget(mock_client, "/users/me", operation_name="test")
+
+    assert body == {"user": {"id": "U1"}}
+    assert mock_client.jget.call_count == 2
+    no_sleep.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.resilience
+async def test_writes_and_client_errors_are_not_retried(no_sleep):
+    """Non-idempotent writes and 4xx responses fail on the first attempt."""
+    mock_client = MagicMock()
+    mock_client.jput.side_effect = _http_error(503)
+    mock_client.jget.side_effect = _http_error(404)
+
+    with pytest.raises(pagerduty.HttpError):
+        await async_utils.jput(
+            mock_client, "/incidents/P1", json={}, operation_name="test"
+        )
+    with pytest.raises(pagerduty.HttpError):
+        await async_utils.jget(mock_client, "/incidents/P1", operation_name="test")
+
+    assert mock_client.jput.call_count == 1
+    assert mock_client.jget.call_count == 1
+    no_sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.resilience
+async def test_open_circuit_fails_fast(no_sleep):
+    """Once an endpoint keeps failing, calls are rejected without reaching PagerDuty."""
+    mock_client = MagicMock()
+    mock_client.jput.side_effect = _http_error(502)
+    attempts = resilience.CIRCUIT_FAILURE_THRESHOLD
+
+    for i in range(attempts):
+        with pytest.raises(pagerduty.HttpError):
+            await async_utils.jput(
+                mock_client, f"/incidents/P{i}", json={}, operation_name="test"
+            )
+
+    with pytest.raises(CircuitOpenError):
+        await async_utils.jput(
+            mock_client, "/incidents/PNEXT", json={}, operation_name="test"
+        )
+    assert mock_client.jput.call_count == attempts
+    snapshot = metrics.snapshot()["circuit_breakers"]
+    assert snapshot["PUT /incidents/{id}"]["state"] == resilience.OPEN
+
+
+@pytest.mark.unit
+@pytest.mark.resilience
+def test_circuit_half_open_probe_closes_or_reopens():
+    """After the reset timeout one probe is admitted; its outcome decides the state."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10)
+    with patch("pagerduty_mcp_server.resilience.time.monotonic", return_value=100.0):
+        breaker.before_call("GET /users")
+        breaker.record_failure()
+        assert breaker.state == resilience.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call("GET /users")
+
+    with patch("pagerduty_mcp_server.resilience.time.monotonic", return_value=111.0):
+        breaker.before_call("GET /users")
+        assert breaker.state == resilience.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call("GET /users")
+        breaker.record_failure()
+        assert breaker.state == resilience.OPEN
+
+    with patch("pagerduty_mcp_server.resilience.time.monotonic", return_value=122.0):
+        breaker.before_call("GET /users")
+        breaker.record_success()
+        assert breaker.state == resilience.CLOSED
+        breaker.before_call("GET /users")
@@ -1,7 +1,7 @@
 """Unit tests for the schedules module."""
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import MagicMock
+from unittest.mock import ANY, MagicMock
 
 import pytest
 
@@ -27,6 +27,7 @@ async def test_list_schedules(
     assert schedule_list == utils.api_response_handler(
         results=mock_schedules_parsed,
         resource_name="schedules",
+        additional_metadata={"as_of": ANY},
     )
 
 
@@ -48,6 +49,7 @@ async def test_list_schedules_with_query(
     assert schedule_list == utils.api_response_handler(
         results=mock_schedules_parsed,
         resource_name="schedules",
+        additional_metadata={"as_of": ANY},
     )
 
 
@@ -72,7 +74,7 @@ async def test_list_schedules_empty_response(mock_get_api_client):
 
     schedule_list = await schedules.list_schedules()
     assert schedule_list == utils.api_response_handler(
-        results=[], resource_name="schedules"
+        results=[], resource_name="schedules", additional_metadata={"as_of": ANY}
     )
 
 
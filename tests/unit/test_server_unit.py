@@ -1,6 +1,12 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
 import pytest
+from fastmcp.client import Client
 
 from pagerduty_mcp_server import mcp
+from pagerduty_mcp_server.server import get_runtime_metrics, lifespan, warm_up
 
 
 @pytest.mark.unit
@@ -8,3 +14,154 @@ from pagerduty_mcp_server import mcp
 def test_mcp():
     """Test that the server initializes correctly."""
     assert mcp.name == "pagerduty_mcp_server"
+
+
+@pytest.mark.unit
+@pytest.mark.server
+def test_runtime_metrics_resource():
+    """Test that the runtime metrics resource reports executor utilization."""
+    snapshot = json.loads(get_runtime_metrics())
+
+    assert snapshot["executor"]["max_workers"] >= 1
+    assert "wait_seconds" in snapshot["executor"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.server
+async def test_lifespan_runs_token_refresher_when_enabled():
+    """Test that the lifespan starts the OAuth refresher and cancels it on shutdown."""
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def fake_refresher():
+        started.set()
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with (
+        patch(
+            "pagerduty_mcp_server.server.auth.token_refresh_enabled",
+            return_value=True,
+        ),
+        patch(
+            "pagerduty_mcp_server.server.auth.run_token_refresher",
+            side_effect=fake_refresher,
+        ),
+    ):
+        async with lifespan(mcp):
+            await asyncio.wait_for(started.wait(), timeout=1)
+
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.server
+async def test_lifespan_skips_token_refresher_when_disabled():
+    """Test that the OAuth refresher does not run without OAuth refresh configured."""
+    with (
+        patch(
+            "pagerduty_mcp_server.server.auth.token_refresh_enabled",
+            return_value=False,
+        ),
+        patch("pagerduty_mcp_server.server.auth.run_token_refresher") as mock_refresher,
+    ):
+        async with lifespan(mcp):
+            pass
+
+    mock_refresher.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.server
+async def test_lifespan_warms_up_when_enabled():
+    """Test that the lifespan finishes the warm-up before the server starts serving."""
+    with (
+        patch("pagerduty_mcp_server.server.WARM_UP_ON_START", True),
+        patch(
+            "pagerduty_mcp_server.server.warm_up", new_callable=AsyncMock
+        ) as mock_warm_up,
+    ):
+        async with lifespan(mcp):
+            mock_warm_up.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.server
+async def test_warm_up_prefetches_default_tool_calls(monkeypatch):
+    """Test that warm-up fetches what the default tool calls need and tolerates failures."""
+    monkeypatch.setenv("PAGERDUTY_API_TOKEN", "test-token")
+    user_context = {"user_id": "U1", "team_ids": ["T1"]}
+    with (
+        patch(
+            "pagerduty_mcp_server.server.users.build_user_context",
+            new_callable=AsyncMock,
+            return_value=user_context,
+        ),
+        patch(
+            "pagerduty_mcp_server.server.teams.list_teams",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("boom"),
+        ) as mock_teams,
+        patch(
+            "pagerduty_mcp_server.server.services.list_services",
+            new_callable=AsyncMock,
+        ) as mock_services,
+        patch(
+            "pagerduty_mcp_server.server.escalation_policies.list_escalation_policies",
+            new_callable=AsyncMock,
+        ) as mock_policies,
+    ):
+        await warm_up()
+
+    mock_teams.assert_awaited_once_with()
+    mock_services.assert_awaited_once_with(team_ids=["T1"])
+    mock_policies.assert_awaited_once_with(user_ids=["U1"], team_ids=["T1"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.server
+async def test_warm_up_skipped_without_api_token(monkeypatch):
+    """Test that warm-up never starts an OAuth flow when no API token is configured."""
+    monkeypatch.delenv("PAGERDUTY_API_TOKEN", raising=False)
+    with patch(
+        "pagerduty_mcp_server.server.users.build_user_context", new_callable=AsyncMock
+    ) as mock_build:
+        await warm_up()
+
+    mock_build.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.server
+async def test_list_tool_rejects_cursor_with_filters():
+    """Test that a cursor cannot be combined with other filters."""
+    async with Client(mcp) as client:
+        result = await client.call_tool_mcp(
+            "get_teams", {"cursor": "abc", "query": "test"}
+        )
+
+    assert result.isError is True
+    assert "When `cursor` is provided" in result.content[0].text
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.server
+async def test_get_incidents_rejects_incident_ids_with_filters():
+    """Test that a batch lookup cannot be combined with list filters."""
+    async with Client(mcp) as client:
+        result = await client.call_tool_mcp(
+            "get_incidents", {"incident_ids": ["P1"], "statuses": ["triggered"]}
+        )
+
+    assert result.isError is True
+    assert "When `incident_ids` is provided" in result.content[0].text
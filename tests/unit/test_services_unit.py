@@ -1,6 +1,6 @@
 """Unit tests for the services module."""
 
-from unittest.mock import MagicMock
+from unittest.mock import ANY, MagicMock
 
 import pytest
 
@@ -24,6 +24,7 @@ async def test_list_services(mock_get_api_client, mock_services, mock_services_p
     assert service_list == utils.api_response_handler(
         results=mock_services_parsed,
         resource_name="services",
+        additional_metadata={"as_of": ANY},
     )
 
 
@@ -49,6 +50,7 @@ async def test_list_services_with_query(
     assert service_list == utils.api_response_handler(
         results=expected_parsed,
         resource_name="services",
+        additional_metadata={"as_of": ANY},
     )
 
 
@@ -77,6 +79,7 @@ async def test_list_services_with_team_ids(
     assert service_list == utils.api_response_handler(
         results=expected_parsed,
         resource_name="services",
+        additional_metadata={"as_of": ANY},
     )
 
 
@@ -101,7 +104,7 @@ async def test_list_services_empty_response(mock_get_api_client):
 
     service_list = await services.list_services()
     assert service_list == utils.api_response_handler(
-        results=[], resource_name="services"
+        results=[], resource_name="services", additional_metadata={"as_of": ANY}
     )
 
 
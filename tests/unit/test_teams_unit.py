@@ -1,6 +1,6 @@
 """Unit tests for the teams module."""
 
-from unittest.mock import MagicMock
+from unittest.mock import ANY, MagicMock
 
 import pytest
 
@@ -21,7 +21,24 @@ async def test_list_teams(mock_get_api_client, mock_teams, mock_teams_parsed):
         teams.TEAMS_URL, params={}, page_size=100
     )
     assert team_list == utils.api_response_handler(
-        results=mock_teams_parsed, resource_name="teams"
+        results=mock_teams_parsed,
+        resource_name="teams",
+        additional_metadata={"as_of": ANY},
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.teams
+async def test_list_teams_resumes_from_cursor(mock_get_api_client, mock_teams):
+    """Test that a cursor resumes the original query at its offset."""
+    cursor = utils.encode_cursor(teams.TEAMS_URL, {"query": "test", "offset": 40}, 5)
+    mock_get_api_client.iter_all.return_value = mock_teams
+
+    await teams.list_teams(cursor=cursor)
+
+    mock_get_api_client.iter_all.assert_called_once_with(
+        teams.TEAMS_URL, params={"query": "test", "offset": 40}, page_size=5
     )
 
 
@@ -41,7 +58,9 @@ async def test_list_teams_with_query(
         teams.TEAMS_URL, params={"query": query}, page_size=100
     )
     assert team_list == utils.api_response_handler(
-        results=mock_teams_parsed, resource_name="teams"
+        results=mock_teams_parsed,
+        resource_name="teams",
+        additional_metadata={"as_of": ANY},
     )
 
 
@@ -65,7 +84,9 @@ async def test_list_teams_empty_response(mock_get_api_client):
     mock_get_api_client.iter_all.return_value = []
 
     team_list = await teams.list_teams()
-    assert team_list == utils.api_response_handler(results=[], resource_name="teams")
+    assert team_list == utils.api_response_handler(
+        results=[], resource_name="teams", additional_metadata={"as_of": ANY}
+    )
 
 
 @pytest.mark.asyncio
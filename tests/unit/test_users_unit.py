@@ -1,6 +1,9 @@
 """Unit tests for the users module."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import copy
+from types import SimpleNamespace
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -21,7 +24,9 @@ async def test_list_users(mock_get_api_client, mock_users, mock_users_parsed):
         users.USERS_URL, params={}, page_size=100
     )
     assert user_list == utils.api_response_handler(
-        results=mock_users_parsed, resource_name="users"
+        results=mock_users_parsed,
+        resource_name="users",
+        additional_metadata={"as_of": ANY},
     )
 
 
@@ -41,7 +46,9 @@ async def test_list_users_with_query(
         users.USERS_URL, params={"query": query}, page_size=100
     )
     assert user_list == utils.api_response_handler(
-        results=mock_users_parsed, resource_name="users"
+        results=mock_users_parsed,
+        resource_name="users",
+        additional_metadata={"as_of": ANY},
     )
 
 
@@ -65,7 +72,9 @@ async def test_list_users_empty_response(mock_get_api_client):
     mock_get_api_client.iter_all.return_value = []
 
     user_list = await users.list_users()
-    assert user_list == utils.api_response_handler(results=[], resource_name="users")
+    assert user_list == utils.api_response_handler(
+        results=[], resource_name="users", additional_metadata={"as_of": ANY}
+    )
 
 
 @pytest.mark.asyncio
@@ -140,6 +149,7 @@ async def test_build_user_context(
     mock_team_ids,
     mock_service_ids,
     mock_escalation_policy_ids,
+    mock_get_api_client,
 ):
     """Test that the user context is built correctly with all data present."""
     mock_show_current_user.return_value = mock_user_parsed
@@ -158,7 +168,9 @@ async def test_build_user_context(
 @pytest.mark.unit
 @pytest.mark.users
 @patch("pagerduty_mcp_server.users._show_current_user", new_callable=AsyncMock)
-async def test_build_user_context_missing_data(mock_show_current_user):
+async def test_build_user_context_missing_data(
+    mock_show_current_user, mock_get_api_client
+):
     """Test that build_user_context raises ValueError for missing data."""
     mock_show_current_user.return_value = None
 
@@ -171,7 +183,9 @@ async def test_build_user_context_missing_data(mock_show_current_user):
 @pytest.mark.unit
 @pytest.mark.users
 @patch("pagerduty_mcp_server.users._show_current_user", new_callable=AsyncMock)
-async def test_build_user_context_error_handling(mock_show_current_user):
+async def test_build_user_context_error_handling(
+    mock_show_current_user, mock_get_api_client
+):
     """Test that build_user_context raises RuntimeError for API errors."""
     error = RuntimeError("API Error")
     mock_show_current_user.side_effect = error
@@ -185,7 +199,9 @@ async def test_build_user_context_error_handling(mock_show_current_user):
 @pytest.mark.unit
 @pytest.mark.users
 @patch("pagerduty_mcp_server.users._show_current_user", new_callable=AsyncMock)
-async def test_build_user_context_none_user(mock_show_current_user):
+async def test_build_user_context_none_user(
+    mock_show_current_user, mock_get_api_client
+):
     """Test that build_user_context raises ValueError for None user data."""
     mock_show_current_user.return_value = None
 
@@ -194,6 +210,44 @@ async def test_build_user_context_none_user(mock_show_current_user):
     assert str(exc_info.value) == "Failed to get current user data"
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.users
+@patch("pagerduty_mcp_server.users._show_current_user", new_callable=AsyncMock)
+@patch("pagerduty_mcp_server.teams.fetch_team_ids")
+@patch("pagerduty_mcp_server.services.fetch_service_ids", new_callable=AsyncMock)
+@patch(
+    "pagerduty_mcp_server.escalation_policies.fetch_escalation_policy_ids",
+    new_callable=AsyncMock,
+)
+async def test_build_user_context_waits_for_cancelled_fetches(
+    mock_fetch_escalation_policy_ids,
+    mock_fetch_service_ids,
+    mock_fetch_team_ids,
+    mock_show_current_user,
+    mock_user_parsed,
+    mock_get_api_client,
+):
+    """When one fetch fails, the others are cancelled and finish before it raises."""
+    cleaned_up = []
+
+    async def slow_fetch(**_kwargs):
+        try:
+            await asyncio.sleep(5)
+        finally:
+            await asyncio.sleep(0.05)
+            cleaned_up.append(True)
+
+    mock_show_current_user.return_value = mock_user_parsed
+    mock_fetch_team_ids.return_value = ["team1"]
+    mock_fetch_escalation_policy_ids.side_effect = slow_fetch
+    mock_fetch_service_ids.side_effect = RuntimeError("API Error")
+
+    with pytest.raises(RuntimeError):
+        await users.build_user_context()
+    assert cleaned_up == [True]
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 @pytest.mark.users
@@ -208,6 +262,7 @@ async def test_build_user_context_empty_teams(
     mock_fetch_team_ids,
     mock_show_current_user,
     mock_user_parsed,
+    mock_get_api_client,
 ):
     """Test that build_user_context handles empty team data correctly."""
     mock_show_current_user.return_value = mock_user_parsed
@@ -241,6 +296,7 @@ async def test_build_user_context_empty_services(
     mock_fetch_team_ids,
     mock_show_current_user,
     mock_user_parsed,
+    mock_get_api_client,
 ):
     """Test that build_user_context handles empty service data correctly."""
     mock_show_current_user.return_value = mock_user_parsed
@@ -275,6 +331,7 @@ async def test_build_user_context_empty_escalation_policies(
     mock_fetch_team_ids,
     mock_show_current_user,
     mock_user_parsed,
+    mock_get_api_client,
 ):
     """Test that build_user_context handles empty escalation policy data correctly."""
     mock_show_current_user.return_value = mock_user_parsed
@@ -307,6 +364,7 @@ async def test_build_user_context_invalid_team_ids(
     mock_fetch_team_ids,
     mock_show_current_user,
     mock_user_parsed,
+    mock_get_api_client,
 ):
     """Test that build_user_context raises RuntimeError for invalid team IDs."""
     mock_show_current_user.return_value = mock_user_parsed
@@ -335,6 +393,7 @@ async def test_build_user_context_invalid_service_ids(
     mock_fetch_team_ids,
     mock_show_current_user,
     mock_user_parsed,
+    mock_get_api_client,
 ):
     """Test that build_user_context raises RuntimeError for invalid service IDs."""
     mock_show_current_user.return_value = mock_user_parsed
@@ -364,6 +423,7 @@ async def test_build_user_context_invalid_escalation_policy_ids(
     mock_fetch_team_ids,
     mock_show_current_user,
     mock_user_parsed,
+    mock_get_api_client,
 ):
     """Test that build_user_context raises RuntimeError for invalid escalation policy IDs."""
     mock_show_current_user.return_value = mock_user_parsed
@@ -391,6 +451,7 @@ async def test_build_user_context_team_fetch_error(
     mock_fetch_team_ids,
     mock_show_current_user,
     mock_user_parsed,
+    mock_get_api_client,
 ):
     """Test that build_user_context raises RuntimeError for team fetch errors."""
     mock_show_current_user.return_value = mock_user_parsed
@@ -447,3 +508,151 @@ async def test_show_user_with_include(mock_get_api_client, mock_users):
 
     assert "id" in user["user"][0]
     assert len(user["user"][0].keys()) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.users
+@patch("pagerduty_mcp_server.users._build_user_context", new_callable=AsyncMock)
+async def test_build_user_context_is_cached(mock_build, mock_get_api_client):
+    """Test that the user context is built once per token until refreshed."""
+    mock_build.return_value = {"user_id": "U1", "team_ids": ["T1"]}
+
+    first = await users.build_user_context()
+    first["team_ids"].append("mutated")
+    second = await users.build_user_context()
+
+    assert second == {"user_id": "U1", "team_ids": ["T1"]}
+    mock_build.assert_awaited_once()
+
+    await users.build_user_context(refresh=True)
+    assert mock_build.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.users
+@patch("pagerduty_mcp_server.users._build_user_context", new_callable=AsyncMock)
+async def test_build_user_context_refreshes_in_background(
+    mock_build, mock_get_api_client
+):
+    """Test that a context near its TTL is served from cache while it is rebuilt."""
+    mock_build.return_value = {"user_id": "U1"}
+    await users.build_user_context()
+    key = next(iter(users._user_context_cache))
+    built_at, last_used, context = users._user_context_cache[key]
+    users._user_context_cache[key] = (
+        built_at - users.USER_CONTEXT_TTL_SECONDS * 0.9,
+        last_used,
+        context,
+    )
+    mock_build.return_value = {"user_id": "U2"}
+
+    assert await users.build_user_context() == {"user_id": "U1"}
+    await users._user_context_builds[key]
+
+    assert await users.build_user_context() == {"user_id": "U2"}
+    assert mock_build.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.users
+@patch("pagerduty_mcp_server.users._build_user_context", new_callable=AsyncMock)
+async def test_build_user_context_cache_is_bounded_lru(mock_build, monkeypatch):
+    """Test that the least recently used token's context is dropped past the cap."""
+    token = {"key": "token-a"}
+    monkeypatch.setattr(
+        users, "create_client", lambda: SimpleNamespace(token_key=token["key"])
+    )
+    monkeypatch.setattr(users, "USER_CONTEXT_CACHE_MAX_SIZE", 2)
+    mock_build.side_effect = lambda: {"user_id": token["key"]}
+
+    for key in ("token-a", "token-b", "token-a", "token-c"):
+        token["key"] = key
+        await users.build_user_context()
+
+    assert list(users._user_context_cache) == ["token-a", "token-c"]
+    assert mock_build.await_count == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.users
+@patch("pagerduty_mcp_server.users._build_user_context", new_callable=AsyncMock)
+async def test_build_user_context_evicts_idle_contexts(mock_build, monkeypatch):
+    """Test that contexts unused for a whole TTL are dropped on the next access."""
+    token = {"key": "token-a"}
+    monkeypatch.setattr(
+        users, "create_client", lambda: SimpleNamespace(token_key=token["key"])
+    )
+    mock_build.return_value = {"user_id": "U1"}
+    await users.build_user_context()
+    built_at, last_used, context = users._user_context_cache["token-a"]
+    users._user_context_cache["token-a"] = (
+        built_at,
+        last_used - users.USER_CONTEXT_TTL_SECONDS,
+        context,
+    )
+
+    token["key"] = "token-b"
+    await users.build_user_context()
+
+    assert list(users._user_context_cache) == ["token-b"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.users
+@patch("pagerduty_mcp_server.users._show_current_user", new_callable=AsyncMock)
+@patch("pagerduty_mcp_server.services.fetch_service_ids", new_callable=AsyncMock)
+@patch(
+    "pagerduty_mcp_server.escalation_policies.fetch_escalation_policy_ids",
+    new_callable=AsyncMock,
+)
+async def test_build_user_context_fetches_concurrently(
+    mock_fetch_escalation_policy_ids,
+    mock_fetch_service_ids,
+    mock_show_current_user,
+    mock_user_parsed,
+    mock_get_api_client,
+):
+    """Test that services and escalation policies are fetched at the same time."""
+    both_started = asyncio.Barrier(2)
+
+    async def fetch_services(**_kwargs):
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return ["S1"]
+
+    async def fetch_escalation_policies(**_kwargs):
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return ["EP1"]
+
+    mock_show_current_user.return_value = mock_user_parsed
+    mock_fetch_service_ids.side_effect = fetch_services
+    mock_fetch_escalation_policy_ids.side_effect = fetch_escalation_policies
+
+    context = await users.build_user_context()
+
+    assert context["service_ids"] == ["S1"]
+    assert context["escalation_policy_ids"] == ["EP1"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.users
+async def test_build_user_context_refresh_sees_upstream_changes(mock_get_api_client):
+    """Test that a refresh rebuilds the context from PagerDuty, not cached responses."""
+    current_user = {"id": "U1", "name": "User", "teams": [{"id": "T1"}]}
+    mock_get_api_client.jget.side_effect = lambda url, **_kwargs: {
+        "user": copy.deepcopy(current_user)
+    }
+    mock_get_api_client.list_all.return_value = []
+
+    first = await users.build_user_context()
+    current_user["teams"] = [{"id": "T2"}]
+    refreshed = await users.build_user_context(refresh=True)
+
+    assert first["team_ids"] == ["T1"]
+    assert refreshed["team_ids"] == ["T2"]
+    assert mock_get_api_client.jget.call_count == 2
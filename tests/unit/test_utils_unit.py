@@ -1,8 +1,15 @@
 """Unit tests for the utils module."""
 
+import sys
+from datetime import timedelta
+from typing import Any
+
 import pytest
 
 from pagerduty_mcp_server import utils
+from pagerduty_mcp_server.models.incident import Incident
+from pagerduty_mcp_server.models.schedule import Schedule
+from pagerduty_mcp_server.models.team import Team
 
 
 @pytest.mark.unit
@@ -125,6 +132,55 @@ def test_validate_timestamp_range_exceeds_6_months():
     )
 
 
+@pytest.mark.unit
+@pytest.mark.utils
+def test_validate_timestamp_range_without_max_days():
+    """Test that validate_timestamp_range accepts long ranges when max_days is None."""
+    utils.validate_timestamp_range(
+        "2024-01-01T00:00:00Z", "2025-01-01T00:00:00Z", max_days=None
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+def test_split_time_range():
+    """Test that long ranges are split into consecutive windows and short ones are not."""
+    window = timedelta(days=31)
+    assert (
+        utils.split_time_range("2024-01-01T00:00:00Z", "2024-01-20T00:00:00Z", window)
+        is None
+    )
+
+    windows = utils.split_time_range(
+        "2024-01-01T00:00:00Z", "2024-03-15T00:00:00Z", window
+    )
+
+    assert windows == [
+        ("2024-01-01T00:00:00Z", "2024-02-01T00:00:00+00:00"),
+        ("2024-02-01T00:00:00+00:00", "2024-03-03T00:00:00+00:00"),
+        ("2024-03-03T00:00:00+00:00", "2024-03-15T00:00:00Z"),
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+def test_split_id_filters():
+    """Test that long ID filters are chunked into every combination of chunks."""
+    params = {"service_ids": ["S1", "S2", "S3", "S1"], "team_ids": ["T1"], "q": "x"}
+    assert utils.split_id_filters(params, ["service_ids", "team_ids"], 3) == [{}]
+
+    slices = utils.split_id_filters(
+        {**params, "team_ids": ["T1", "T2", "T3"]}, ["service_ids", "team_ids"], 2
+    )
+
+    assert slices == [
+        {"service_ids": ["S1", "S2"], "team_ids": ["T1", "T2"]},
+        {"service_ids": ["S1", "S2"], "team_ids": ["T3"]},
+        {"service_ids": ["S3"], "team_ids": ["T1", "T2"]},
+        {"service_ids": ["S3"], "team_ids": ["T3"]},
+    ]
+
+
 @pytest.mark.unit
 @pytest.mark.utils
 def test_validate_timestamp_range_invalid_format():
@@ -134,3 +190,241 @@ def test_validate_timestamp_range_invalid_format():
 
     with pytest.raises(ValueError):
         utils.validate_timestamp_range(since, until)
+
+
+def _pages(*pages, fetched):
+    async def _gen():
+        for page in pages:
+            fetched.append(page)
+            yield page
+
+    return _gen()
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+@pytest.mark.asyncio
+async def test_parse_list_pages_formats_every_page():
+    """parse_list_pages parses every page and merges metadata filled in by on_page."""
+    fetched = []
+    metadata = {"pages": 0}
+
+    def on_page(_page):
+        metadata["pages"] += 1
+
+    response = await utils.parse_list_pages(
+        _pages(
+            [{"id": "T1", "name": "a"}], [{"id": "T2", "name": "b"}], fetched=fetched
+        ),
+        Team,
+        "teams",
+        include=["id"],
+        additional_metadata=metadata,
+        on_page=on_page,
+    )
+
+    assert response["teams"] == [{"id": "T1"}, {"id": "T2"}]
+    assert response["metadata"]["count"] == 2
+    assert response["metadata"]["pages"] == 2
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+@pytest.mark.asyncio
+async def test_parse_list_pages_stops_fetching_when_limit_exceeded():
+    """Once a page pushes the response over the limit, later pages are never pulled."""
+    fetched = []
+    large_page = [{"id": "T1", "description": "x" * (utils.RESPONSE_CHAR_LIMIT + 1)}]
+    later_page = [{"id": "T2"}]
+
+    response = await utils.parse_list_pages(
+        _pages(large_page, later_page, fetched=fetched), Team, "teams"
+    )
+
+    assert response["error"]["code"] == "LIMIT_EXCEEDED"
+    assert fetched == [large_page]
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+@pytest.mark.asyncio
+async def test_parse_list_pages_returns_partial_results_with_cursor():
+    """With next_cursor, the items that fit are returned along with a cursor."""
+    fetched = []
+    first_page = [{"id": "T1", "name": "a"}, {"id": "T2", "name": "b"}]
+    large_item = {"id": "T3", "description": "x" * (utils.RESPONSE_CHAR_LIMIT + 1)}
+
+    response = await utils.parse_list_pages(
+        _pages(first_page, [large_item, {"id": "T4"}], [{"id": "T5"}], fetched=fetched),
+        Team,
+        "teams",
+        next_cursor=utils.make_next_cursor("/teams", {"query": "a"}, 10),
+    )
+
+    assert [team["id"] for team in response["teams"]] == ["T1", "T2"]
+    assert len(fetched) == 2
+    params, limit = utils.decode_cursor(response["metadata"]["next_cursor"], "/teams")
+    assert params == {"query": "a", "offset": 2}
+    assert limit == 8
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+def test_make_next_cursor_continues_from_starting_offset():
+    """Cursors built for a resumed query count from the query's starting offset."""
+    next_cursor = utils.make_next_cursor("/teams", {"offset": 200}, 50)
+
+    assert utils.decode_cursor(next_cursor(30), "/teams") == ({"offset": 230}, 20)
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor",
+        utils.encode_cursor("/users", {"offset": 1}, 5),
+        utils.encode_cursor("/teams", {"offset": [3, -1]}, 5),
+    ],
+)
+def test_decode_cursor_rejects_invalid_cursor(cursor):
+    """decode_cursor rejects malformed cursors and cursors for another endpoint."""
+    with pytest.raises(utils.ValidationError):
+        utils.decode_cursor(cursor, "/teams")
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+@pytest.mark.parametrize(
+    "include",
+    [
+        ["id", "status"],
+        ["status", "id", "body_details"],
+        ["client_url"],
+        ["assignments", "teams", "notes"],
+    ],
+)
+def test_parse_list_response_projection_matches_full_model(mock_incidents, include):
+    """Test that validating only the included fields gives the full model's output."""
+    expected = [
+        Incident.model_validate(item).to_clean_dict(include_fields=include)
+        for item in mock_incidents
+    ]
+
+    response = utils.parse_list_response(mock_incidents, Incident, "incidents", include)
+
+    assert response["incidents"] == expected
+    assert Incident.projection(include) is Incident.projection(list(reversed(include)))
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+def test_projection_skips_fields_not_included():
+    """Test that fields left out of a projection are not validated."""
+    projection = Schedule.projection(["id", "name"])
+
+    model = projection.model_validate({"id": "S1", "name": "Primary", "teams": "bad"})
+
+    assert set(projection.model_fields) == {"id", "name"}
+    assert model.to_clean_dict() == {"id": "S1", "name": "Primary"}
+    assert Schedule.projection(None) is Schedule
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+def test_projection_cache_is_keyed_by_model_fields_and_bounded():
+    """Test that include lists naming the same model fields share one projection."""
+    from pagerduty_mcp_server.models import common
+
+    projection = Incident.projection(["id", "status"])
+
+    assert Incident.projection(["status", "id", "id", "notes", "unknown"]) is projection
+    assert common._projection.cache_info().maxsize == common.PROJECTION_CACHE_SIZE
+
+
+def _baseline_size(obj, visited):
+    """The byte counter `measure_object` replaced, kept to check it is equivalent."""
+    if id(obj) in visited:
+        return 0
+    visited.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            size += _baseline_size(k, visited) + _baseline_size(v, visited)
+    elif isinstance(obj, (list, tuple, set)):
+        for item in obj:
+            size += _baseline_size(item, visited)
+    return size
+
+
+def _baseline_chars(obj, visited):
+    """The character counter `measure_object` replaced, kept to check it is equivalent."""
+    if id(obj) in visited:
+        return 0
+    visited.add(id(obj))
+    if isinstance(obj, dict):
+        return sum(
+            _baseline_chars(k, visited) + _baseline_chars(v, visited)
+            for k, v in obj.items()
+        )
+    if isinstance(obj, (list, tuple, set)):
+        return sum(_baseline_chars(item, visited) for item in obj)
+    if isinstance(obj, str):
+        return len(obj)
+    return len(str(obj))
+
+
+def _shared_references():
+    shared = {"id": "X1"}
+    return [shared, shared, {"ref": shared}]
+
+
+def _cycle():
+    cycle: list[Any] = ["loop"]
+    cycle.append(cycle)
+    return cycle
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+@pytest.mark.parametrize(
+    ("make_obj", "expected_chars"),
+    [
+        (
+            lambda: {
+                "name": "Zoë",
+                "tags": ["α", "b"],
+                "n": 12,
+                "ratio": 1.5,
+                "none": None,
+            },
+            32,
+        ),
+        (lambda: ({"deep": [[["x"]]]}, {1, 2}), 7),
+        (_shared_references, 7),
+        (_cycle, 4),
+    ],
+)
+def test_measure_object_matches_two_pass_counters(make_obj, expected_chars):
+    """Test that measure_object gives the totals of the original two-pass counters."""
+    obj = make_obj()
+
+    chars, size = utils.measure_object(obj)
+
+    assert chars == expected_chars == _baseline_chars(obj, set())
+    assert size == _baseline_size(obj, set())
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+def test_measure_object_can_be_fed_item_by_item():
+    """Test that a shared visited set measures items as if they were one list."""
+    shared = {"id": "P1"}
+    items = [{"id": "P2", "teams": [shared], "count": 12}, {"team": shared}]
+
+    chars, size = utils.measure_object(items)
+
+    visited: set[int] = set()
+    measured = [utils.measure_object(item, visited=visited) for item in items]
+    assert sum(item_chars for item_chars, _ in measured) == chars
+    assert sum(item_size for _, item_size in measured) == size - sys.getsizeof(items)
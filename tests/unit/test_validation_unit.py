@@ -112,6 +112,17 @@ class TestValidateIncludeFields:
         with pytest.raises(RuntimeError, match="Cannot determine valid fields"):
             validation.validate_include_fields(["id"], cast(Any, mock_model))
 
+    def test_valid_fields_are_computed_once_per_model(self):
+        """Test that the model schema is generated once, not on every call."""
+        mock_model = MagicMock()
+        mock_model.model_fields = {"id": MagicMock()}
+        mock_model.model_json_schema.return_value = {"properties": {"name": {}}}
+
+        for _ in range(3):
+            validation.validate_include_fields(["id", "name"], cast(Any, mock_model))
+
+        mock_model.model_json_schema.assert_called_once()
+
     def test_single_field(self):
         """Test validation with a single field."""
         result = validation.validate_include_fields(["id"], User)